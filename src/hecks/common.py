@@ -28,6 +28,7 @@ from bytesparse.base import Value
 from bytesparse.inplace import Memory
 
 from .utils import VALUE_FORMAT_CHAR
+from .utils import VALUE_FORMAT_INTEGER_BASE
 from .utils import VALUE_FORMAT_PREFIX
 from .utils import VALUE_FORMAT_SUFFIX
 from .utils import ValueFormatEnum
@@ -133,6 +134,15 @@ def build_encoding_table(encoding: str, nonprintable: str = '.') -> List[str]:
     return lut
 
 
+def build_encoding_index(chars_table: List[str]) -> MutableMapping[str, int]:
+    # Reverse lookup; duplicates (e.g. the nonprintable placeholder) resolve
+    # to the lowest value, matching list.index()
+    lut = {}
+    for i, t in enumerate(chars_table):
+        lut.setdefault(t, i)
+    return lut
+
+
 # =====================================================================================================================
 
 class EngineStatus:
@@ -149,11 +159,14 @@ class EngineStatus:
         self.line_length: int = 16
         self.chars_encoding = 'ascii'
         self.chars_table = build_encoding_table(self.chars_encoding)
+        self.chars_index = build_encoding_index(self.chars_table)
 
         # Allocate cell attributes
         self.cell_format_mode: ValueFormatEnum = ValueFormatEnum.HEXADECIMAL_UPPER
         self.cell_format_string: str = ''
+        self.cell_format_table: List[str] = []
         self.cell_format_length: int = 0
+        self.cell_format_base: int = 16
         self.cell_format_zeroed: bool = True
         self.cell_format_prefix: bool = False
         self.cell_format_suffix: bool = False
@@ -201,6 +214,15 @@ class EngineStatus:
         self.cursor_digit: CellCoord = 0  # digit index, left-to-right
         self.cursor_address: Address = 0
 
+        # Last known dense block span; empty until some cursor movement
+        # caches it, reset upon any memory mutation
+        self._dense_start: Address = 0
+        self._dense_endex: Address = 0
+
+    def reset_dense_span(self) -> None:
+        self._dense_start = 0
+        self._dense_endex = 0
+
     def address_to_cell_coords(self, address: Address) -> CellCoords:
         address -= self.address_skip
         line_length = self.line_length
@@ -233,7 +255,11 @@ class EngineStatus:
         format_length = len(format_string.format(value_max))
 
         self.cell_format_string = format_string
+        # Cell values span a single byte, so every possible text is
+        # precomputed here; rendering then indexes instead of formatting
+        self.cell_format_table = [format_string.format(value) for value in range(256)]
         self.cell_format_length = format_length
+        self.cell_format_base = VALUE_FORMAT_INTEGER_BASE[mode]
 
         self.cell_spacing = 1 + max(0, self.offset_format_length - self.cell_format_length)
         self.offset_spacing = 1 + max(0, self.cell_format_length - self.offset_format_length)
@@ -1079,6 +1105,8 @@ class BaseEngine(
 
 class BaseMemento(abc.ABC):
 
+    __slots__ = ('_engine', '_status')
+
     def __init__(
         self,
         engine: BaseEngine,
@@ -1095,6 +1123,12 @@ class BaseMemento(abc.ABC):
     def undo(self) -> None:
         ...
 
+    def dispose(self) -> None:
+        # Called when the memento is evicted from the history, so that any
+        # byte snapshots are released immediately instead of lingering
+        # until garbage collection
+        pass
+
 
 # =====================================================================================================================
 
@@ -1356,6 +1390,10 @@ class BaseUserInterface(abc.ABC):
     def ask_chars_encoding_custom(self) -> Optional[int]:
         ...
 
+    @abc.abstractmethod
+    def ask_value(self, title: str, prompt: str) -> Optional[str]:
+        ...
+
     @abc.abstractmethod
     def update_title_by_file_path(self) -> None:
         ...
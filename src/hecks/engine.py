@@ -16,11 +16,9 @@
 # along with Hecks.  If not, see <https://www.gnu.org/licenses/>.
 
 import inspect
-import tkinter.filedialog
-import tkinter.font
-import tkinter.messagebox
-import tkinter.simpledialog
-from math import floor
+import mmap
+import os
+from contextlib import contextmanager
 from typing import Callable
 from typing import Optional
 from typing import Tuple
@@ -40,19 +38,26 @@ from .common import CharCoord
 from .common import CursorMode
 from .common import EngineStatus
 from .common import SelectionMode
+from .common import build_encoding_index
 from .common import build_encoding_table
-from .utils import VALUE_FORMAT_INTEGER_BASE
 from .utils import ValueFormatEnum
 from .utils import memory_to_clipboard
 from .utils import clipboard_to_memory
-from .utils import iter_lines
 from .utils import parse_int
+from .utils import parse_int_cached
 
 
 def _todo():  # TODO remove all of its calls
     print(f'TODO: {inspect.stack()[1].function}')
 
 
+# Minimum raw file size worth the fixed cost of setting up a memory map
+MMAP_THRESHOLD: int = 1 << 20
+
+# Maximum buffer allocated at once while filling a selection
+FILL_CHUNK_SIZE: int = 1 << 20
+
+
 # =====================================================================================================================
 
 class Engine(BaseEngine):
@@ -63,6 +68,29 @@ class Engine(BaseEngine):
         status: Optional[EngineStatus] = None,
     ):
         super().__init__(ui, status)
+        self._redraw_pending: bool = False
+        self._redraw_suppressed: int = 0
+        self._selection_update_pending: bool = False
+
+        # Shadow the pure forwarder methods with bound aliases of their
+        # targets, so that event dispatch skips one Python frame per call;
+        # the class methods stay in place to satisfy the base interface
+        self.on_edit_undo = self.on_key_undo
+        self.on_edit_redo = self.on_key_redo
+        self.on_edit_copy = self.copy_selection
+        self.on_edit_paste = self.paste_selection
+        self.on_edit_delete = self.delete_cell
+        self.on_edit_clear = self.clear_cell
+        self.on_edit_reserve = self.reserve_cell
+        self.on_edit_fill = self.on_key_fill
+        self.on_edit_flood = self.on_key_flood
+        self.on_edit_crop = self.crop_selection
+        self.on_edit_cursor_mode = self.switch_cursor_mode
+        self.on_edit_select_all = self.select_all
+        self.on_edit_copy_address = self.copy_cursor_address
+        self.on_key_reserve_cell = self.reserve_cell
+        self.on_key_delete_cell = self.delete_cell
+        self.on_key_clear_cell = self.clear_cell
 
     def _set_selection_start(self, cell_x: CellCoord, cell_y: CellCoord) -> None:
         status = self.status
@@ -162,6 +190,7 @@ class Engine(BaseEngine):
             memory = self.status.memory
             # TODO: add memento
             memory.shift(offset)
+            self.status.reset_dense_span()
 
             widget = self.ui.editor
             widget.mark_dirty_all()
@@ -187,12 +216,13 @@ class Engine(BaseEngine):
                 endex += offset
                 memory.write(start, chunk)
                 del chunk
+                status.reset_dense_span()
 
                 self._set_selection_start(*status.address_to_cell_coords(start))
                 self._set_selection_endin(*status.address_to_cell_coords(endex - 1))
 
                 widget = self.ui.editor
-                widget.mark_dirty_range(min(start, origin))
+                widget.mark_dirty_range(min(start, origin), max(endex, origin + (endex - start)))
                 widget.update_view(force_content=True)
                 self.ui.update_menus_by_selection()
                 self.ui.update_status()
@@ -216,7 +246,7 @@ class Engine(BaseEngine):
         address = status.cursor_address
         value_before = memory.peek(address)
         if insert:
-            widget.mark_dirty_range(address)
+            widget.mark_dirty_range(address, address + 1)
             # TODO: add memento
             memory.poke(address, 0)
             value = 0
@@ -227,9 +257,9 @@ class Engine(BaseEngine):
         try:
             cursor_digit = status.cursor_digit
             if 0 <= status.cursor_digit < status.cell_format_length:
-                text = status.cell_format_string.format(value)
+                text = status.cell_format_table[value]
                 text = text[:cursor_digit] + digit_char + text[cursor_digit + 1:]
-                value = int(text, VALUE_FORMAT_INTEGER_BASE[status.cell_format_mode])
+                value = int(text, status.cell_format_base)
             else:
                 raise ValueError
         except ValueError:
@@ -241,6 +271,7 @@ class Engine(BaseEngine):
             return False  # just ignore
 
         memory.write(address, chunk)
+        status.reset_dense_span()
         widget.update_view(force_content=True)
 
         self._move_cursor_by_char(+1, 0)
@@ -264,12 +295,13 @@ class Engine(BaseEngine):
         address = status.cursor_address
         value_before = memory.peek(address)
         if insert:
-            widget.mark_dirty_range(address)
+            widget.mark_dirty_range(address, address + 1)
             memory.poke(address, value)
         else:
             widget.mark_dirty_cell(*status.cursor_cell)
             # TODO: add memento
             memory.poke(address, value)
+        status.reset_dense_span()
         widget.update_view(force_content=True)
 
         status.cursor_digit = 0
@@ -289,6 +321,7 @@ class Engine(BaseEngine):
             address = status.cursor_address
             # TODO: add memento
             status.memory.reserve(address, address + 1)
+            status.reset_dense_span()
             widget.mark_dirty_range(address)
             widget.update_view(force_content=True)
             self.ui.update_menus_by_selection()
@@ -304,6 +337,7 @@ class Engine(BaseEngine):
             address = status.cursor_address
             # TODO: add memento
             status.memory.clear(address, address + 1)
+            status.reset_dense_span()
             cell_x, cell_y = status.cursor_cell
             widget.mark_dirty_cell(cell_x, cell_y)
             widget.update_view(force_content=True)
@@ -320,6 +354,7 @@ class Engine(BaseEngine):
             address = status.cursor_address
             # TODO: add memento
             status.memory.delete(address, address + 1)
+            status.reset_dense_span()
             widget.mark_dirty_range(address)
             widget.update_view(force_content=True)
             self.ui.update_menus_by_selection()
@@ -343,7 +378,12 @@ class Engine(BaseEngine):
             address_endex = address_endin + 1
             operate = status.memory.clear if reserve else status.memory.delete
             operate = _cast(Callable, operate)
-            widget.mark_dirty_range(address_start)
+            if reserve:
+                # clear() only blanks the selected range
+                widget.mark_dirty_range(address_start, address_endex)
+            else:
+                # delete() also shifts any trailing content back
+                widget.mark_dirty_range(address_start)
 
             if sel_mode == SelectionMode.NORMAL:
                 # TODO: add memento
@@ -354,13 +394,15 @@ class Engine(BaseEngine):
                 line_length = status.line_length
                 cell_w = cell_endin[0] + 1 - cell_start[0]
 
-                while address_endex > address_start:
+                # Precompute the row end addresses; deletion goes in reverse
+                # address order so that pending rows keep their addresses valid
+                for row_endex in range(address_endex, address_start, -line_length):
                     # TODO: add memento
-                    operate(address_endex - cell_w, address_endex)
-                    address_endex -= line_length
+                    operate(row_endex - cell_w, row_endex)
 
                 widget.update_view(force_content=True)
 
+            status.reset_dense_span()
             self.set_cursor_cell(*cell_start, 0)
 
         self.escape_selection()
@@ -383,6 +425,7 @@ class Engine(BaseEngine):
                 start, endin = endin, start
             # TODO: add memento
             status.memory.crop(start, endin + 1)
+            status.reset_dense_span()
             widget.mark_dirty_all()
             widget.update_view(force_content=True)
             self.goto_memory_absolute(start)
@@ -429,7 +472,7 @@ class Engine(BaseEngine):
         clipboard = pyperclip.paste()
         address = status.cursor_address
         try:
-            memory = clipboard_to_memory(iter_lines(clipboard))
+            memory = clipboard_to_memory(clipboard)
         except ValueError:
             pass  # just ignore
         else:
@@ -448,13 +491,29 @@ class Engine(BaseEngine):
                 target_address = address + block_start - start
                 # TODO: add memento
                 status.memory.write(target_address, block_data)
-                widget.mark_dirty_range(address, address + len(block_data))
+                widget.mark_dirty_range(target_address, target_address + len(block_data))
 
+            status.reset_dense_span()
             self.goto_memory_absolute(target_endex)
             widget.update_view(force_content=True)
             self.ui.update_menus_by_selection()
             self.ui.update_status()
 
+    @staticmethod
+    def _fill_range(memory: Memory, start: Address, endex: Address, value: Value) -> None:
+        # Repeating a single byte compiles down to memset; chunking the
+        # writes caps the peak buffer allocation on huge selections while
+        # each write stays memcpy-bound
+        size = endex - start
+        chunk = bytes((value,)) * min(size, FILL_CHUNK_SIZE)
+        chunk_size = len(chunk)
+        address = start
+        while size > chunk_size:
+            memory.write(address, chunk)
+            address += chunk_size
+            size -= chunk_size
+        memory.write(address, chunk[:size] if size < chunk_size else chunk)
+
     def fill_selection(self, value: int):
         widget = self.ui.editor
         status = self.status
@@ -465,7 +524,7 @@ class Engine(BaseEngine):
 
             if start is not None and endex is not None and start < endex:
                 # TODO: add memento
-                status.memory.fill(start, endex, value)
+                self._fill_range(status.memory, start, endex, value)
                 widget.mark_dirty_range(start, endex)
 
                 status.sel_mode = SelectionMode.NORMAL
@@ -479,12 +538,13 @@ class Engine(BaseEngine):
                 start, endin = endin, start
             endex = endin + 1
             # TODO: add memento
-            status.memory.fill(start, endex, value)
+            self._fill_range(status.memory, start, endex, value)
             widget.mark_dirty_range(start, endex)
 
         elif sel_mode == SelectionMode.RECTANGLE:
             pass  # TODO
 
+        status.reset_dense_span()
         widget.update_view(force_selection=True, force_content=True)
         self.ui.update_menus_by_selection()
         self.ui.update_status()
@@ -512,6 +572,7 @@ class Engine(BaseEngine):
         elif sel_mode == SelectionMode.RECTANGLE:
             pass  # TODO
 
+        status.reset_dense_span()
         widget.update_view(force_selection=True, force_content=True)
         self.ui.update_menus_by_selection()
         self.ui.update_status()
@@ -528,6 +589,7 @@ class Engine(BaseEngine):
                 start, endin = endin, start
             # TODO: add memento
             status.memory.reserve(start, endin + 1 - start)
+            status.reset_dense_span()
             widget.mark_dirty_range(start)
             widget.update_view(force_content=True)
             self.goto_memory_absolute(start)
@@ -573,11 +635,23 @@ class Engine(BaseEngine):
         address_start = memory.start
         address_endex = memory.endex
 
-        if (address_start <= address_before < address_endex) != (address_start <= address_after < address_endex):
-            self.ui.update_menus_by_cursor()
+        if ((status._dense_start <= address_before < status._dense_endex and
+             status._dense_start <= address_after < status._dense_endex)):
+            pass  # both within the same dense block, menus unaffected
+
+        else:
+            if (address_start <= address_before < address_endex) != (address_start <= address_after < address_endex):
+                self.ui.update_menus_by_cursor()
+
+            elif (memory.peek(address_before) is None) != (memory.peek(address_after) is None):
+                self.ui.update_menus_by_cursor()
 
-        elif (memory.peek(address_before) is None) != (memory.peek(address_after) is None):
-            self.ui.update_menus_by_cursor()
+            # Cache the dense block span around the new cursor position
+            block_index = memory._block_index_at(address_after)
+            if block_index is not None:
+                block_start, block_items = memory._blocks[block_index]
+                status._dense_start = block_start
+                status._dense_endex = block_start + len(block_items)
 
         cell_start_y, cell_endex_y = widget.get_cell_bounds_y()
 
@@ -822,8 +896,14 @@ class Engine(BaseEngine):
             hexrec_file = hexrec.load(file_path)
         except ValueError:
             with open(file_path, 'rb') as stream:
-                data = stream.read()
-            memory = Memory.from_bytes(data)
+                if os.path.getsize(file_path) >= MMAP_THRESHOLD:
+                    # Map large raw files instead of reading them into an
+                    # intermediate bytes object; the memory copies straight
+                    # out of the page cache
+                    with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                        memory = Memory.from_bytes(view)
+                else:
+                    memory = Memory.from_bytes(stream.read())
         else:
             memory = hexrec_file.memory
         return memory
@@ -835,6 +915,7 @@ class Engine(BaseEngine):
 
             status = self.status
             status.memory = memory
+            status.reset_dense_span()
             status.file_path = file_path
             self.ui.update_title_by_file_path()
 
@@ -849,15 +930,30 @@ class Engine(BaseEngine):
             merged = self.status.memory
             for start, items in memory.blocks():
                 merged.write(start, items)
+            self.status.reset_dense_span()
 
     def _file_save(self, file_path: str, memory: Memory) -> None:
         try:
             hexrec_type = hexrec.guess_format_type(file_path)
         except KeyError:
             if memory.contiguous:
-                with open(file_path, 'wb') as stream:
-                    for start, items in memory.blocks():
-                        stream.write(items)
+                base = memory.start
+                size = memory.endex - base
+                if size >= MMAP_THRESHOLD:
+                    # Map large raw files and write blocks by slice
+                    # assignment, letting the kernel flush the pages
+                    fd = os.open(file_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o666)
+                    try:
+                        os.ftruncate(fd, size)
+                        with mmap.mmap(fd, size) as view:
+                            for start, items in memory.blocks():
+                                view[(start - base):(start - base + len(items))] = items
+                    finally:
+                        os.close(fd)
+                else:
+                    with open(file_path, 'wb') as stream:
+                        for start, items in memory.blocks():
+                            stream.write(items)
             else:
                 self.ui.show_error('Not contiguous',
                                    'Cannot save a non-contiguous\n'
@@ -942,10 +1038,27 @@ class Engine(BaseEngine):
             endin = status.sel_endin_address
             if endin < start:
                 endin, start = start, endin
-            memory = status.memory.extract(start, endin + 1)
-            hexrec_type = hexrec.guess_format_type(path)
-            hexrec_file = hexrec_type.from_memory(memory)
-            hexrec_file.save(path)
+            endex = endin + 1
+            memory = status.memory
+
+            try:
+                hexrec_type = hexrec.guess_format_type(path)
+            except KeyError:
+                if any(memory.gaps(start, endex)):
+                    self.ui.show_error('Not contiguous',
+                                       'Cannot save a non-contiguous\n'
+                                       'chunk of data as binary file')
+                else:
+                    # Stream the selected block views straight to the file,
+                    # with no intermediate extracted image
+                    with open(path, 'wb') as stream:
+                        for _, block_view in memory.blocks(start, endex):
+                            stream.write(block_view)
+            else:
+                # Structured formats go through hexrec, which needs its own
+                # memory image; extract() is the only copy made
+                hexrec_file = hexrec_type.from_memory(memory.extract(start, endex))
+                hexrec_file.save(path)
 
     def on_edit_select_all(self) -> None:
         self.select_all()
@@ -969,9 +1082,45 @@ class Engine(BaseEngine):
         self.ui.ask_chars_encoding_custom()
 
     def on_view_redraw(self) -> None:
+        if self._redraw_suppressed:
+            return
         self.ui.editor.redraw()
         self.ui.update_status()
 
+    @contextmanager
+    def batch_updates(self):
+        # Apply a series of on_set_* calls as one transaction, painting a
+        # single frame on exit instead of one per setter
+        self._redraw_suppressed += 1
+        try:
+            yield self
+        finally:
+            self._redraw_suppressed -= 1
+            if not self._redraw_suppressed:
+                self.on_view_redraw()
+
+    def _schedule_redraw(self) -> None:
+        # Coalesce bursts of redraw requests into one per Tk idle tick
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.ui.editor.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self) -> None:
+        self._redraw_pending = False
+        self.on_view_redraw()
+
+    def _schedule_selection_update(self) -> None:
+        # Tk can report mouse motion faster than the paint tick; collapse
+        # bursts of identical selection updates into one per idle tick
+        if not self._selection_update_pending:
+            self._selection_update_pending = True
+            self.ui.editor.after_idle(self._flush_selection_update)
+
+    def _flush_selection_update(self) -> None:
+        self._selection_update_pending = False
+        self.ui.editor.update_view(force_selection=True)
+        self.ui.update_status()
+
     def on_nav_editor_focus(self) -> None:
         self.ui.editor.focus_set()
 
@@ -1096,101 +1245,99 @@ class Engine(BaseEngine):
         status = self.status
         status.chars_encoding = encoding
         status.chars_table = build_encoding_table(encoding)
-        self.on_view_redraw()
+        status.chars_index = build_encoding_index(status.chars_table)
+        self._schedule_redraw()
 
     def on_set_cell_mode(self, mode: ValueFormatEnum) -> None:
         status = self.status
         status.cell_format_mode = ValueFormatEnum(mode)
         status.update_cell_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_cell_prefix(self, prefix: bool) -> None:
         status = self.status
         status.cell_format_prefix = bool(prefix)
         status.update_cell_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_cell_suffix(self, suffix: bool) -> None:
         status = self.status
         status.cell_format_suffix = bool(suffix)
         status.update_cell_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_cell_zeroed(self, zeroed: bool) -> None:
         status = self.status
         status.cell_format_zeroed = bool(zeroed)
         status.update_cell_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_address_mode(self, mode: ValueFormatEnum) -> None:
         status = self.status
         status.address_format_mode = ValueFormatEnum(mode)
         status.update_address_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_address_prefix(self, prefix: bool) -> None:
         status = self.status
         status.address_format_prefix = bool(prefix)
         status.update_address_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_address_suffix(self, suffix: bool) -> None:
         status = self.status
         status.address_format_suffix = bool(suffix)
         status.update_address_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_address_zeroed(self, zeroed: bool) -> None:
         status = self.status
         status.address_format_zeroed = bool(zeroed)
         status.update_address_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_address_skip(self, skip: Address) -> None:
         status = self.status
         status.address_skip = skip
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_address_bits(self, bitsize: int) -> None:
         status = self.status
         status.address_bits = bitsize
         status.update_address_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_offset_mode(self, mode: ValueFormatEnum) -> None:
         status = self.status
         status.offset_format_mode = ValueFormatEnum(mode)
         status.update_offset_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_offset_prefix(self, prefix: bool) -> None:
         status = self.status
         status.offset_format_prefix = bool(prefix)
         status.update_offset_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_offset_suffix(self, suffix: bool) -> None:
         status = self.status
         status.offset_format_suffix = bool(suffix)
         status.update_offset_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_set_offset_zeroed(self, zeroed: bool) -> None:
         status = self.status
         status.offset_format_zeroed = bool(zeroed)
         status.update_offset_format()
-        self.on_view_redraw()
+        self._schedule_redraw()
 
     def on_key_digit_cells(self, digit_char: str):
         insert = (self.status.cursor_mode == CursorMode.INSERT)
         self.write_digit(digit_char, insert=insert)
 
     def on_key_digit_chars(self, digit_char: str):
-        try:
-            value = self.status.chars_table.index(digit_char)
-        except ValueError:
-            pass
-        else:
+        value = self.status.chars_index.get(digit_char)
+        if value is not None:
             insert = (self.status.cursor_mode == CursorMode.INSERT)
             self.write_byte(value, insert=insert)
 
@@ -1226,27 +1373,25 @@ class Engine(BaseEngine):
             self.on_key_clear_next()
 
     def on_key_fill(self):
-        # FIXME: ask to view/widget
-        answer = tkinter.simpledialog.askstring('Fill value', 'Insert the fill value')
+        answer = self.ui.ask_value('Fill value', 'Insert the fill value')
         if answer:
             try:
-                value = parse_int(answer)[0]
+                value = parse_int_cached(answer)[0]
                 self.fill_selection(value)
             except ValueError:
-                tkinter.messagebox.showerror('Invalid format', f'Invalid value format:\n\n{answer}')
+                self.ui.show_error('Invalid format', f'Invalid value format:\n\n{answer}')
         self.ui.editor.focus_set()
 
     def on_key_flood(self):
         status = self.status
         if status.memory.peek(status.cursor_address) is None or status.sel_mode:
-            # FIXME: ask to view/widget
-            answer = tkinter.simpledialog.askstring('Flood value', 'Insert the flood value')
+            answer = self.ui.ask_value('Flood value', 'Insert the flood value')
             if answer:
                 try:
-                    value = parse_int(answer)[0]
+                    value = parse_int_cached(answer)[0]
                     self.flood_selection(value)
                 except ValueError:
-                    tkinter.messagebox.showerror('Invalid format', f'Invalid value format:\n\n{answer}')
+                    self.ui.show_error('Invalid format', f'Invalid value format:\n\n{answer}')
             self.ui.editor.focus_set()
 
     def on_key_cut(self):
@@ -1415,9 +1560,15 @@ class Engine(BaseEngine):
                 status.sel_mode = SelectionMode.NORMAL
                 self.ui.update_menus_by_selection()
 
+            # Mouse motion floods in faster than any other event; the cursor
+            # cell is already integer here, so clamp with plain comparisons
+            # instead of floor/max/min calls
             cursor_cell_x, cursor_cell_y = status.cursor_cell
-            cursor_cell_x = max(0, min(floor(cursor_cell_x), status.line_length - 1))
-            cursor_cell_y = floor(cursor_cell_y)
+            cell_x_endin = status.line_length - 1
+            if cursor_cell_x < 0:
+                cursor_cell_x = 0
+            elif cursor_cell_x > cell_x_endin:
+                cursor_cell_x = cell_x_endin
             self._set_selection_endin(cursor_cell_x, cursor_cell_y)
 
             cell_start_y = widget.view_start_cell[1]
@@ -1426,8 +1577,7 @@ class Engine(BaseEngine):
             if cursor_cell_y < cell_start_y or cursor_cell_y >= cell_endex_y:
                 self.set_cursor_cell(cursor_cell_x, cursor_cell_y, status.cursor_digit)
 
-            widget.update_view(force_selection=True)
-            self.ui.update_status()
+            self._schedule_selection_update()
 
     def on_cells_selection_release(
         self,
@@ -1473,9 +1623,13 @@ class Engine(BaseEngine):
                 status.sel_mode = SelectionMode.NORMAL
                 self.ui.update_menus_by_selection()
 
+            # Same integer clamping as on_cells_selection_motion
             cursor_cell_x, cursor_cell_y = status.cursor_cell
-            cursor_cell_x = max(0, min(floor(cursor_cell_x), status.line_length - 1))
-            cursor_cell_y = floor(cursor_cell_y)
+            cell_x_endin = status.line_length - 1
+            if cursor_cell_x < 0:
+                cursor_cell_x = 0
+            elif cursor_cell_x > cell_x_endin:
+                cursor_cell_x = cell_x_endin
             self._set_selection_endin(cursor_cell_x, cursor_cell_y)
 
             cell_start_y = widget.view_start_cell[1]
@@ -1484,8 +1638,7 @@ class Engine(BaseEngine):
             if cursor_cell_y < cell_start_y or cursor_cell_y >= cell_endex_y:
                 self.set_cursor_cell(cursor_cell_x, cursor_cell_y, status.cursor_digit)
 
-            widget.update_view(force_selection=True)
-            self.ui.update_status()
+            self._schedule_selection_update()
 
     def on_chars_selection_release(
         self,
@@ -15,32 +15,117 @@
 # You should have received a copy of the GNU General Public License
 # along with Hecks.  If not, see <https://www.gnu.org/licenses/>.
 
-import enum
-import tkinter as tk
-from math import floor
+import time
+from collections import deque
+from typing import Deque
 from typing import MutableMapping
 from typing import Optional
-from typing import List
 from typing import Tuple
 
 from .common import BaseEngine
 from .common import BaseMemento
 from .common import CellCoord
 from .common import EngineStatus
-from .utils import VALUE_FORMAT_CHAR
-from .utils import VALUE_FORMAT_PREFIX
-from .utils import VALUE_FORMAT_SUFFIX
-from .utils import ValueFormatEnum
 from bytesparse.base import Address
 from bytesparse.base import AnyBytes
-from bytesparse.base import Value
 from bytesparse.inplace import Memory
 
 
+# =====================================================================================================================
+
+# Above this size, range snapshots are deferred to the first redo(), so that
+# building the memento itself stays O(1) for huge ranges
+BACKUP_DEFER_THRESHOLD: Address = 1 << 20
+
+# Cursor moves pushed within this many seconds of each other collapse into a
+# single memento, so that key auto-repeat does not flood the history
+CURSOR_COALESCE_WINDOW: float = 0.5
+
+# Write payloads up to this size are interned, so that repeated edits with
+# the same bytes (typing the same value, pasting the same fragment) share
+# one immutable object across the whole history
+DATA_INTERN_SIZE_MAX: int = 64
+DATA_INTERN_COUNT_MAX: int = 1024
+
+# NOTE: bytes objects do not support weak references, hence the bounded
+# plain dictionary, flushed wholesale when full
+_DATA_INTERN: MutableMapping[bytes, bytes] = {}
+
+
+def _intern_data(data: bytes) -> bytes:
+    if len(_DATA_INTERN) >= DATA_INTERN_COUNT_MAX:
+        _DATA_INTERN.clear()
+    return _DATA_INTERN.setdefault(data, data)
+
+
+# Default byte budget for the whole undo history
+HISTORY_BUDGET: int = 64 << 20
+
+
+def _memento_size(memento: 'BaseMemento') -> int:
+    # Approximate footprint: content bytes of any payload or snapshot,
+    # ignoring the (slotted, small) object headers
+    size = 0
+    for name in ('_data', '_backup', '_snapshot'):
+        payload = getattr(memento, name, None)
+        if payload is not None:
+            size += len(payload)
+    return size
+
+
+class HistoryBuffer:
+    # Bounded undo history: once the running byte total exceeds the
+    # budget, the oldest mementos are evicted and disposed, so that their
+    # snapshots are released right away instead of lingering until
+    # garbage collection
+
+    __slots__ = ('_entries', '_budget', '_total')
+
+    def __init__(self, budget: int = HISTORY_BUDGET):
+        self._entries: Deque[Tuple[BaseMemento, int]] = deque()
+        self._budget = budget
+        self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, memento: BaseMemento) -> None:
+        size = _memento_size(memento)
+        self._entries.append((memento, size))
+        self._total += size
+
+        # Always keep the latest entry, even if alone it busts the budget
+        while self._total > self._budget and len(self._entries) > 1:
+            evicted, evicted_size = self._entries.popleft()
+            self._total -= evicted_size
+            evicted.dispose()
+
+    def pop(self) -> Optional[BaseMemento]:
+        if not self._entries:
+            return None
+        memento, size = self._entries.pop()
+        self._total -= size
+        return memento
+
+    def clear(self) -> None:
+        for memento, _ in self._entries:
+            memento.dispose()
+        self._entries.clear()
+        self._total = 0
+
+
 # =====================================================================================================================
 
 class MoveCursor(BaseMemento):
 
+    __slots__ = (
+        '_cursor_cell_prev',
+        '_cursor_digit_prev',
+        '_cursor_cell_next',
+        '_cursor_digit_next',
+        '_timestamp',
+    )
+
     def __init__(
         self,
         engine: BaseEngine,
@@ -57,6 +142,27 @@ class MoveCursor(BaseMemento):
         self._cursor_cell_next = (cell_x, cell_y)
         self._cursor_digit_next = cell_digit
 
+        self._timestamp = time.monotonic()
+
+    @classmethod
+    def coalesce(
+        cls,
+        prev: 'BaseMemento',
+        new: 'MoveCursor',
+    ) -> bool:
+        # Merge a burst of cursor moves into the previous memento, so that
+        # undoing jumps back to the start of the burst in one step
+        if not isinstance(prev, MoveCursor):
+            return False
+        if prev._engine is not new._engine:
+            return False
+        if new._timestamp - prev._timestamp >= CURSOR_COALESCE_WINDOW:
+            return False
+        prev._cursor_cell_next = new._cursor_cell_next
+        prev._cursor_digit_next = new._cursor_digit_next
+        prev._timestamp = new._timestamp
+        return True
+
     def redo(self) -> None:
         engine = self._engine
         engine.set_cursor_cell(*self._cursor_cell_next, self._cursor_digit_next)
@@ -71,6 +177,8 @@ class MoveCursor(BaseMemento):
 
 class MoveMemory(BaseMemento):
 
+    __slots__ = ('_offset', '_backup')
+
     def __init__(
         self,
         engine: BaseEngine,
@@ -79,7 +187,15 @@ class MoveMemory(BaseMemento):
     ):
         super().__init__(engine, status)
         memory = status.memory
-        offset, backup = memory.shift_backup(offset)
+
+        if memory.bound_start is None and memory.bound_endex is None:
+            # Nothing can fall off the addressing bounds: the shift is a pure
+            # address translation, undone by shifting back with no snapshot
+            backup = None
+        else:
+            offset, backup = memory.shift_backup(offset)
+            if not backup:
+                backup = None
 
         self._offset = offset
         self._backup = backup
@@ -105,15 +221,29 @@ class MoveMemory(BaseMemento):
 
         engine.escape_selection()
         cursor_address = status.cursor_address
-        memory.shift_restore(offset, backup)
+        if backup is None:
+            memory.shift(-offset)
+        else:
+            # Single inverse shift plus one composite write of just the
+            # clipped edge region; no per-block replay
+            memory.shift_restore(offset, backup)
         engine.goto_memory_absolute(cursor_address - offset)
         engine.on_view_redraw()
 
+    def dispose(self) -> None:
+        self._backup = None
+
 
 # ---------------------------------------------------------------------------------------------------------------------
 
 class WriteData(BaseMemento):
 
+    __slots__ = ('_address', '_data', '_snapshot')
+
+    # Cleared by the engine around bulk operations whose history is managed
+    # elsewhere, so that redo() skips the snapshot copy entirely
+    ENABLE_BACKUP: bool = True
+
     def __init__(
         self,
         engine: BaseEngine,
@@ -122,12 +252,34 @@ class WriteData(BaseMemento):
         data: AnyBytes,
     ):
         super().__init__(engine, status)
-        memory = status.memory
-        backups = memory.write_backup(address, data)
 
         self._address = address
+        # Keep bytes payloads as-is, shared zero-copy with the caller and
+        # with redo; extend() switches to a bytearray on first use
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        if len(data) <= DATA_INTERN_SIZE_MAX:
+            data = _intern_data(data)
         self._data = data
-        self._backups = backups
+        # Single composite snapshot of the overwritten range, taken by the
+        # first redo(); undo() restores it with one clear + one write,
+        # independent of how fragmented the overwritten content was
+        self._snapshot: Optional[Memory] = None
+
+    def extend(self, address: Address, data: AnyBytes) -> bool:
+        # Coalesce a follow-up write contiguous with this one, so that a
+        # burst of single-byte keystrokes costs a single memento instead of
+        # one per byte; only the incremental bytes get snapshot
+        if address != self._address + len(self._data):
+            return False
+        snapshot = self._snapshot
+        if snapshot is not None:
+            snapshot.bound_endex = address + len(data)
+            snapshot.write(0, self._status.memory.extract(address, address + len(data)))
+        if not isinstance(self._data, bytearray):
+            self._data = bytearray(self._data)
+        self._data += data
+        return True
 
     def redo(self) -> None:
         engine = self._engine
@@ -136,6 +288,11 @@ class WriteData(BaseMemento):
         address = self._address
         data = self._data
 
+        if self._snapshot is None and self.ENABLE_BACKUP:
+            # Deferred snapshot, taken on demand just before the first
+            # write overwrites the content
+            self._snapshot = memory.extract(address, address + len(data))
+
         engine.escape_selection()
         memory.write(address, data)
         engine.goto_memory_absolute(address + len(data))
@@ -146,18 +303,26 @@ class WriteData(BaseMemento):
         status = self._status
         memory = status.memory
         address = self._address
-        backups = self._backups
+        snapshot = self._snapshot
 
         engine.escape_selection()
-        memory.write_restore(backups)
+        memory.clear(address, address + len(self._data))
+        if snapshot is not None:
+            memory.write(0, snapshot)
         engine.goto_memory_absolute(address)
         engine.on_view_redraw()
 
+    def dispose(self) -> None:
+        self._data = b''
+        self._snapshot = None
+
 
 # ---------------------------------------------------------------------------------------------------------------------
 
 class ClearData(BaseMemento):
 
+    __slots__ = ('_address', '_size', '_backup')
+
     def __init__(
         self,
         engine: BaseEngine,
@@ -167,7 +332,10 @@ class ClearData(BaseMemento):
     ):
         super().__init__(engine, status)
         memory = status.memory
-        backup = memory.clear_backup(address, address + size)
+        if size > BACKUP_DEFER_THRESHOLD:
+            backup = None  # deferred to the first redo()
+        else:
+            backup = memory.clear_backup(address, address + size)
 
         self._address = address
         self._size = size
@@ -180,6 +348,11 @@ class ClearData(BaseMemento):
         address = self._address
         size = self._size
 
+        if self._backup is None:
+            # Deferred snapshot, taken on demand just before the first
+            # clear destroys the content
+            self._backup = memory.clear_backup(address, address + size)
+
         engine.escape_selection()
         memory.clear(address, address + size)
         engine.goto_memory_absolute(address)
@@ -193,15 +366,22 @@ class ClearData(BaseMemento):
         backup = self._backup
 
         engine.escape_selection()
+        # The backup is one composite Memory; this splices it back with a
+        # single clearing write, regardless of block fragmentation
         memory.clear_restore(backup)
         engine.goto_memory_absolute(address)
         engine.on_view_redraw()
 
+    def dispose(self) -> None:
+        self._backup = None
+
 
 # ---------------------------------------------------------------------------------------------------------------------
 
 class DeleteData(BaseMemento):
 
+    __slots__ = ('_address', '_size', '_backup')
+
     def __init__(
         self,
         engine: BaseEngine,
@@ -211,7 +391,10 @@ class DeleteData(BaseMemento):
     ):
         super().__init__(engine, status)
         memory = status.memory
-        backup = memory.delete_backup(address, address + size)
+        if size > BACKUP_DEFER_THRESHOLD:
+            backup = None  # deferred to the first redo()
+        else:
+            backup = memory.delete_backup(address, address + size)
 
         self._address = address
         self._size = size
@@ -224,6 +407,11 @@ class DeleteData(BaseMemento):
         address = self._address
         size = self._size
 
+        if self._backup is None:
+            # Deferred snapshot, taken on demand just before the first
+            # delete destroys the content
+            self._backup = memory.delete_backup(address, address + size)
+
         engine.escape_selection()
         memory.delete(address, address + size)
         engine.goto_memory_absolute(address)
@@ -241,3 +429,6 @@ class DeleteData(BaseMemento):
         memory.delete_restore(backup)
         engine.goto_memory_absolute(address + size)
         engine.on_view_redraw()
+
+    def dispose(self) -> None:
+        self._backup = None
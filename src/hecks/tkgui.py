@@ -15,17 +15,22 @@
 # You should have received a copy of the GNU General Public License
 # along with Hecks.  If not, see <https://www.gnu.org/licenses/>.
 
+import codecs
+import functools
+import os
 import pkgutil
 import tkinter as tk
 import tkinter.filedialog
 import tkinter.messagebox
 import tkinter.simpledialog
+from itertools import product
 from math import floor
 from tkinter import ttk
 
 import ttkthemes
 from typing import Any
 from typing import Callable
+from typing import List
 from typing import MutableMapping
 from typing import Optional
 from typing import Tuple
@@ -81,6 +86,32 @@ _COLOR_SEL_BG: str = 'SystemHighlight'
 _COLOR_SEL_FG: str = 'SystemHighlightText'
 _COLOR_SEL_OG: str = 'grey75'
 
+# Coalescing window for resize relayouts, in milliseconds
+_CONFIGURE_DELAY: int = 30
+
+# Menu radiobutton entries with their labels preformatted at import time
+_LINE_LENGTH_ITEMS: Tuple[Tuple[str, int], ...] = tuple(
+    (f'{value:3d}', value) for value in LINE_LENGTHS
+)
+_ADDRESS_BITS_ITEMS: Tuple[Tuple[str, int], ...] = tuple(
+    (f'{value:3d}', value) for value in ADDRESS_BITS
+)
+
+# Statusbar text templates, prebound so that the status worker issues a
+# single C-level format call per label
+_STATUS_RANGE_FORMAT = 'Range: {} - {}'.format
+_STATUS_SIZE_FORMAT = 'Size: {} = {:d}'.format
+_STATUS_RECT_RANGE_FORMAT = 'Range: ({:d}, {:d}) - ({:d}, {:d})'.format
+_STATUS_RECT_SIZE_FORMAT = 'Size: ({:d}, {:d}) = ({:X}h, {:X}h)'.format
+_STATUS_ADDRESS_FORMAT = 'Address: {}'.format
+_STATUS_DIGIT_FORMAT = 'Digit: {:d}'.format
+
+# Encoding menu entries with their precomputed column break flags
+_ENCODING_ITEMS: Tuple[Tuple[str, bool], ...] = tuple(
+    (encoding, bool(i and not i % 16))
+    for i, encoding in enumerate(BYTE_ENCODINGS)
+)
+
 _TOOLTIP_FONT: Union[Tuple[str, int], str] = 'TkTooltipFont'
 _TOOLTIP_FG: str = 'SystemButtonText'
 _TOOLTIP_BG: str = 'lightyellow'
@@ -91,6 +122,29 @@ def _is_shift_in_event(event: Any = None) -> bool:
     return (event.state & 1) != 0 if event else False
 
 
+# Memoized Tcl round-trips; style lookups are keyed by the active theme,
+# color-to-RGB conversion only depends on the color name
+_STYLE_LOOKUP_CACHE: MutableMapping[Tuple[str, str, str], str] = {}
+_WINFO_RGB_CACHE: MutableMapping[str, Tuple[int, int, int]] = {}
+
+
+def _style_lookup(ttk_style: ttk.Style, element: str, option: str) -> str:
+    key = (ttk_style.theme_use(), element, option)
+    value = _STYLE_LOOKUP_CACHE.get(key)
+    if value is None:
+        value = ttk_style.lookup(element, option)
+        _STYLE_LOOKUP_CACHE[key] = value
+    return value
+
+
+def _winfo_rgb(root: tk.Misc, color: str) -> Tuple[int, int, int]:
+    rgb = _WINFO_RGB_CACHE.get(color)
+    if rgb is None:
+        rgb = root.winfo_rgb(color)
+        _WINFO_RGB_CACHE[color] = rgb
+    return rgb
+
+
 def _fix_global_colors(root: ttkthemes.ThemedTk) -> None:
     global _COLOR_BG
     global _COLOR_FG
@@ -102,23 +156,23 @@ def _fix_global_colors(root: ttkthemes.ThemedTk) -> None:
     global _TOOLTIP_BG
     ttk_style = ttk.Style()
 
-    bg_color = ttk_style.lookup('TLabelFrame', 'background') or _COLOR_BG
+    bg_color = _style_lookup(ttk_style, 'TLabelFrame', 'background') or _COLOR_BG
     _COLOR_BG = bg_color
-    bg_rgb = root.winfo_rgb(bg_color)
+    bg_rgb = _winfo_rgb(root, bg_color)
 
-    fg_color = ttk_style.lookup('TLabelFrame', 'foreground') or _COLOR_FG
+    fg_color = _style_lookup(ttk_style, 'TLabelFrame', 'foreground') or _COLOR_FG
     _COLOR_FG = fg_color
-    fg_rgb = root.winfo_rgb(fg_color)
+    fg_rgb = _winfo_rgb(root, fg_color)
 
     _COLOR_OG = mix_color_hex(*fg_rgb, *bg_rgb, 0.25)
 
-    sel_bg_color = ttk_style.lookup('TEntry', 'selectbackground') or _COLOR_SEL_BG
+    sel_bg_color = _style_lookup(ttk_style, 'TEntry', 'selectbackground') or _COLOR_SEL_BG
     _COLOR_SEL_BG = sel_bg_color
-    sel_bg_rgb = root.winfo_rgb(sel_bg_color)
+    sel_bg_rgb = _winfo_rgb(root, sel_bg_color)
 
-    sel_fg_color = ttk_style.lookup('TEntry', 'selectforeground') or _COLOR_SEL_FG
+    sel_fg_color = _style_lookup(ttk_style, 'TEntry', 'selectforeground') or _COLOR_SEL_FG
     _COLOR_SEL_FG = sel_fg_color
-    sel_fg_rgb = root.winfo_rgb(sel_fg_color)
+    sel_fg_rgb = _winfo_rgb(root, sel_fg_color)
 
     _COLOR_SEL_OG = mix_color_hex(*sel_fg_rgb, *sel_bg_rgb, 0.25)
 
@@ -126,30 +180,100 @@ def _fix_global_colors(root: ttkthemes.ThemedTk) -> None:
     _TOOLTIP_BG = _COLOR_SEL_BG
 
 
+# Pre-formatted hex pairs, so that color strings are built by table lookup
+# and concatenation instead of per-channel string formatting
+_HEX_BYTE: Tuple[str, ...] = tuple(f'{i:02X}' for i in range(256))
+
+
+def _lerp8(x: int, y: int, m: float) -> int:
+    # 16-bit lerp rounded down to 8 bits, clamped inline instead of going
+    # through the min()/max() call machinery
+    v = int(((1 - m) * x) + (m * y))
+    v = 0 if v < 0 else (65535 if v > 65535 else v)
+    v = (v + 128) >> 8
+    return 255 if v > 255 else v
+
+
+@functools.lru_cache(maxsize=256)
 def mix_color_hex(x_r, x_g, x_b, y_r, y_g, y_b, m) -> str:
-    r = (max(0, min(int(((1 - m) * x_r) + (m * y_r)), 65535)) + 128) // 256
-    g = (max(0, min(int(((1 - m) * x_g) + (m * y_g)), 65535)) + 128) // 256
-    b = (max(0, min(int(((1 - m) * x_b) + (m * y_b)), 65535)) + 128) // 256
-    c = f'#{r:02X}{g:02X}{b:02X}'
+    c = '#' + _HEX_BYTE[_lerp8(x_r, y_r, m)] + _HEX_BYTE[_lerp8(x_g, y_g, m)] + _HEX_BYTE[_lerp8(x_b, y_b, m)]
     return c
 
 
 # =====================================================================================================================
 
-_image_cache = {}
-
-
+@functools.lru_cache(maxsize=None)
+def _get_font(family: str, size: int) -> Tuple['tk.font.Font', PixelCoord, PixelCoord]:
+    # Shared font object and measurements; every editor pane uses the same
+    # monospaced font, so measuring it once per process is enough
+    font = tk.font.Font(font=(family, size))
+    font_w = font.measure('#')
+    font_h = font.metrics('linespace')
+    return font, font_w, font_h
+
+
+@functools.lru_cache(maxsize=8)
+def _pixel_x_table(
+    pad_x: PixelCoord,
+    font_w: PixelCoord,
+    line_length: CellCoord,
+    period: int,
+    offset: int,
+) -> Tuple[PixelCoord, ...]:
+    # Per-column x pixel positions; only the y axis depends on the scroll
+    # offset, so the x coordinates are fixed for a given layout and can be
+    # looked up instead of recomputed per cell during geometry updates
+    return tuple(pad_x + (((x * period) + offset) * font_w) for x in range(line_length))
+
+
+@functools.lru_cache(maxsize=None)
 def load_image(path: str) -> tk.PhotoImage:
-    global _image_cache
-    image = _image_cache.get(path)
-    if image is None:
-        # See: https://stackoverflow.com/a/58941536
-        data = pkgutil.get_data(__name__, path)
-        image = tk.PhotoImage(data=data)
-        _image_cache[path] = image
+    # See: https://stackoverflow.com/a/58941536
+    data = pkgutil.get_data(__name__, path)
+    image = tk.PhotoImage(data=data)
     return image
 
 
+# Set False to skip loading and decoding menu icons entirely (several
+# themes hide them anyway); toolbar icons are not affected
+MENU_ICONS_ENABLED: bool = True
+
+
+def _menu_image(path: str) -> Union[tk.PhotoImage, str]:
+    return load_image(path) if MENU_ICONS_ENABLED else ''
+
+
+def _add_radiobuttons(menu: tk.Menu, variable: tk.Variable, items) -> None:
+    # Compose the whole batch of (label, value, columnbreak) entries as one
+    # Tcl script, so that the menu grows with a single interpreter
+    # round-trip instead of one per entry
+    w = menu._w
+    varname = str(variable)
+    script = '\n'.join(
+        (f'{w} add radiobutton -label {{{label}}} -variable {varname} -value {{{value}}} -columnbreak 1'
+         if cbrk else
+         f'{w} add radiobutton -label {{{label}}} -variable {varname} -value {{{value}}}')
+        for label, value, cbrk in items
+    )
+    menu.tk.eval(script)
+
+
+def _preload_icons() -> None:
+    # Warm the load_image cache in one pass, so that the icon-heavy menu
+    # and toolbar construction loops always hit the cache fast path;
+    # requires an existing Tk root
+    if not MENU_ICONS_ENABLED:
+        return
+    folder = 'image/16x16'
+    try:
+        names = os.listdir(os.path.join(os.path.dirname(__file__), folder))
+    except OSError:
+        return  # not a regular directory (e.g. zipped package)
+    for name in names:
+        if name.endswith('.png'):
+            load_image(f'{folder}/{name}')
+
+
 # =====================================================================================================================
 
 def __merge_extensions(hexrec_format):
@@ -194,6 +318,8 @@ class Tooltip:
         self._clearance_x = clearance_x
         self._clearance_y = clearance_y
         self._tooltip: Optional[tk.Toplevel] = None
+        self._tooltip_wh: Optional[PixelCoords] = None  # valid until text/font change
+        self._screen_wh: Optional[PixelCoords] = None
 
         widget.focus_displayof()
         widget.bind('<Enter>', self._enter)
@@ -215,10 +341,12 @@ class Tooltip:
     ) -> None:
         if text is not None:
             self._text = text
+            self._tooltip_wh = None
         if time is not None:
             self._time = time
         if font is not None:
             self._font = font
+            self._tooltip_wh = None
         if fg is not None:
             self._fg = fg
         if bg is not None:
@@ -241,19 +369,26 @@ class Tooltip:
                                   relief=tk.RIDGE, borderwidth=1, font=self._font)
             label.pack(ipadx=5)
 
-        tooltip.update_idletasks()
-
-        screen_w = widget.winfo_screenwidth()
-        screen_h = widget.winfo_screenheight()
+        tooltip_wh = self._tooltip_wh
+        if tooltip_wh is None:
+            # Only a freshly measured tooltip needs the idle-task flush;
+            # the size stays valid until the text or font changes
+            tooltip.update_idletasks()
+            tooltip_wh = (tooltip.winfo_width(), tooltip.winfo_height())
+            self._tooltip_wh = tooltip_wh
+        tooltip_w, tooltip_h = tooltip_wh
+
+        screen_wh = self._screen_wh
+        if screen_wh is None:
+            screen_wh = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+            self._screen_wh = screen_wh
+        screen_w, screen_h = screen_wh
 
         widget_x = widget.winfo_rootx()
         widget_y = widget.winfo_rooty()
         widget_w = widget.winfo_width()
         widget_h = widget.winfo_height()
 
-        tooltip_w = tooltip.winfo_width()
-        tooltip_h = tooltip.winfo_height()
-
         clearance_x = self._clearance_x
         clearance_y = self._clearance_y
 
@@ -279,6 +414,65 @@ class Tooltip:
             self._tooltip = None
 
 
+# =====================================================================================================================
+
+class ValueDialog(tk.Toplevel):
+    # Reusable modal prompt; hidden instead of destroyed on close, so that
+    # repeated invocations skip the widget tree construction cost
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.withdraw()
+        self.transient(parent)
+        self.resizable(False, False)
+        self.protocol('WM_DELETE_WINDOW', self._on_cancel)
+
+        label = ttk.Label(self, text='', anchor=tk.W)
+        label.pack(fill=tk.X, padx=8, pady=(8, 0))
+        self._label = label
+
+        entry = ttk.Entry(self)
+        entry.pack(fill=tk.X, padx=8, pady=8)
+        self._entry = entry
+
+        buttons = ttk.Frame(self)
+        buttons.pack(fill=tk.X, padx=8, pady=(0, 8))
+        ttk.Button(buttons, text='OK', command=self._on_ok).pack(side=tk.LEFT, expand=True)
+        ttk.Button(buttons, text='Cancel', command=self._on_cancel).pack(side=tk.LEFT, expand=True)
+
+        self.bind('<Return>', self._on_ok)
+        self.bind('<Escape>', self._on_cancel)
+
+        self._answer: Optional[str] = None
+        self._done = tk.BooleanVar(self, value=False)
+
+    def _on_ok(self, event=None):
+        self._answer = self._entry.get()
+        self._close()
+
+    def _on_cancel(self, event=None):
+        self._answer = None
+        self._close()
+
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._done.set(True)
+
+    def prompt(self, title: str, prompt: str) -> Optional[str]:
+        self.title(title)
+        self._label.configure(text=prompt)
+        self._entry.delete(0, tk.END)
+        self._answer = None
+        self._done.set(False)
+
+        self.deiconify()
+        self.grab_set()
+        self._entry.focus_set()
+        self.wait_variable(self._done)
+        return self._answer
+
+
 # =====================================================================================================================
 
 class ToolbarTray(ttk.Frame):
@@ -319,19 +513,32 @@ class ToolbarTray(ttk.Frame):
         container.bind('<Key>', lambda _: 'break')
         container.bind('<1>', lambda _: 'break')
 
+        # Last measured (width, content height) pair; the content only
+        # reflows when the tray width changes or widgets are added
+        self._content_height_cache: Optional[PixelCoords] = None
+
         self.bind('<Configure>', self._on_configure)
 
     def add_widget(self, widget):
+        self._content_height_cache = None
         self._container.window_create(tk.INSERT, window=widget)
 
     def _on_configure(self, event=None, force=False):
-        self.update_idletasks()
         container = self._container
-        container.configure(bg=self._bg)
+        width = self.winfo_width()
+        cache = self._content_height_cache
+
+        if cache is not None and cache[0] == width and not force:
+            content_height = cache[1]
+        else:
+            # Cache miss: pay the idle-task flush and the Tcl reflow
+            self.update_idletasks()
+            container.configure(bg=self._bg)
+            content_height = container.count('1.0', tk.END, 'update', 'ypixels')
+            self._content_height_cache = (width, content_height)
 
         borderwidth = self.cget('borderwidth')
         widget_height = self.winfo_height()
-        content_height = container.count('1.0', tk.END, 'update', 'ypixels')
         height = content_height + (borderwidth * 2)
 
         if widget_height != height or force:
@@ -380,8 +587,8 @@ class Toolbar(ttk.Frame):
 
         if tooltip and not key:
             key = tooltip
-        kwargs.setdefault('style', 'Toolbutton')
-        kwargs.setdefault('takefocus', 0)
+        # Single dict build instead of two setdefault() method calls
+        kwargs = {'style': 'Toolbutton', 'takefocus': 0, **kwargs}
         widget = ttk.Button(self, **kwargs)
         self.add_widget(widget, key=key, tooltip=tooltip)
         return widget
@@ -396,6 +603,11 @@ class Toolbar(ttk.Frame):
     def finalize(self, pad_x: int = 4, pad_y: int = 1, pad_y_sep: int = 4) -> None:
         last = self.widget_count - 1
 
+        # Call straight into the Tcl bridge, skipping the grid_configure
+        # wrapper and its per-call option dictionary processing; one Tcl
+        # command per widget is the minimum Tk accepts
+        tk_call = self.tk.call
+
         for index, (key, widget) in enumerate(self._widgets.items()):
             pad_l = 0
             pad_r = 0
@@ -415,13 +627,149 @@ class Toolbar(ttk.Frame):
                 pad_v = pad_y
                 sticky = tk.NS
 
-            widget.grid(row=0, column=index, padx=(pad_l, pad_r), pady=pad_v, sticky=sticky)
+            args = ('grid', 'configure', widget._w,
+                    '-row', 0, '-column', index,
+                    '-padx', (pad_l, pad_r), '-pady', pad_v)
+            if sticky is not None:
+                args += ('-sticky', sticky)
+            tk_call(args)
 
 
 # =====================================================================================================================
 
 class EditorWidget(BaseEditorWidget, ttk.Frame):
 
+    # Static key bindings, shared by every instance; each entry names the
+    # engine handler and tells whether it takes the Shift selection flag,
+    # and gets bound as a closure over the engine bound method
+    _CONTROL_BINDINGS: Tuple[Tuple[str, Tuple[str, bool]], ...] = (
+        ('<plus>',                  ('on_key_reserve_cell', False)),
+        ('<minus>',                 ('on_key_delete_cell', False)),
+        ('<period>',                ('on_key_clear_cell', False)),
+        ('<BackSpace>',             ('on_key_clear_back', False)),
+        ('<comma>',                 ('on_key_clear_next', False)),
+        ('<Delete>',                ('on_key_delete', False)),
+        ('$',                       ('on_key_fill', False)),
+        ('%',                       ('on_key_flood', False)),
+
+        ('<Control-x>',             ('on_key_cut', False)),
+        ('<Shift-Delete>',          ('on_key_cut', False)),
+
+        ('<Control-c>',             ('on_key_copy', False)),
+        ('<Control-C>',             ('on_key_copy', False)),
+        ('<Control-Insert>',        ('on_key_copy', False)),
+
+        ('<Control-v>',             ('on_key_paste', False)),
+        ('<Control-V>',             ('on_key_paste', False)),
+        ('<Shift-Insert>',          ('on_key_paste', False)),
+
+        ('<Control-k>',             ('on_key_crop', False)),
+
+        ('<Control-m>',             ('on_key_move_focus', False)),
+        ('<Control-M>',             ('on_key_move_apply', False)),
+
+        ('<Control-Up>',            ('on_key_scroll_line_up', False)),
+        ('<Control-Prior>',         ('on_key_scroll_page_up', False)),
+
+        ('<Control-Down>',          ('on_key_scroll_line_down', False)),
+        ('<Control-Next>',          ('on_key_scroll_page_down', False)),
+
+        ('<Control-Alt-Up>',        ('on_key_scroll_top', False)),
+        ('<Control-Alt-Down>',      ('on_key_scroll_bottom', False)),
+
+        ('<Left>',                  ('on_key_move_left_digit', True)),
+        ('<Shift-Left>',            ('on_key_move_left_digit', True)),
+
+        ('<Control-Left>',          ('on_key_move_left_byte', True)),
+        ('<Control-Shift-Left>',    ('on_key_move_left_byte', True)),
+
+        ('<Alt-Left>',              ('on_key_goto_block_previous', True)),
+        ('<Alt-Shift-Left>',        ('on_key_goto_block_previous', True)),
+
+        ('<Right>',                 ('on_key_move_right_digit', True)),
+        ('<Shift-Right>',           ('on_key_move_right_digit', True)),
+
+        ('<Control-Right>',         ('on_key_move_right_byte', True)),
+        ('<Control-Shift-Right>',   ('on_key_move_right_byte', True)),
+
+        ('<Alt-Right>',             ('on_key_goto_block_next', True)),
+        ('<Alt-Shift-Right>',       ('on_key_goto_block_next', True)),
+
+        ('<Up>',                    ('on_key_move_line_up', True)),
+        ('<Shift-Up>',              ('on_key_move_line_up', True)),
+
+        ('<Prior>',                 ('on_key_move_page_up', True)),
+        ('<Shift-Prior>',           ('on_key_move_page_up', True)),
+
+        ('<Down>',                  ('on_key_move_line_down', True)),
+        ('<Shift-Down>',            ('on_key_move_line_down', True)),
+
+        ('<Next>',                  ('on_key_move_page_down', True)),
+        ('<Shift-Next>',            ('on_key_move_page_down', True)),
+
+        ('<Home>',                  ('on_key_goto_line_start', True)),
+        ('<Shift-Home>',            ('on_key_goto_line_start', True)),
+
+        ('<End>',                   ('on_key_goto_line_endin', True)),
+        ('<Shift-End>',             ('on_key_goto_line_endin', True)),
+
+        ('<Control-g>',             ('on_key_goto_memory_focus', False)),
+        ('<Control-G>',             ('on_key_goto_memory_apply', False)),
+
+        ('<Control-Home>',          ('on_key_goto_memory_start', True)),
+        ('<Control-Shift-Home>',    ('on_key_goto_memory_start', True)),
+
+        ('<Control-End>',           ('on_key_goto_memory_endin', True)),
+        ('<Control-Shift-End>',     ('on_key_goto_memory_endin', True)),
+
+        ('<Control-Alt-End>',       ('on_key_goto_memory_endex', True)),
+        ('<Control-Alt-Shift-End>', ('on_key_goto_memory_endex', True)),
+
+        ('<Alt-Home>',              ('on_key_goto_block_start', True)),
+        ('<Alt-Shift-Home>',        ('on_key_goto_block_start', True)),
+
+        ('<Alt-End>',               ('on_key_goto_block_endin', True)),
+        ('<Alt-Shift-End>',         ('on_key_goto_block_endin', True)),
+
+        ('<Alt-Insert>',            ('on_key_copy_address', False)),
+        ('<Alt-Shift-Insert>',      ('on_key_set_address', False)),
+        ('<Control-a>',             ('on_key_select_all', False)),
+        ('<Control-r>',             ('on_key_select_range', False)),
+        ('<Escape>',                ('on_key_escape_selection', False)),
+        ('<Insert>',                ('on_key_switch_cursor_mode', False)),
+        ('<F5>',                    ('on_key_redraw', False)),
+
+        ('<Control-z>',             ('on_key_undo', False)),
+        ('<Alt-BackSpace>',         ('on_key_undo', False)),
+        ('<Control-Z>',             ('on_key_redo', False)),
+        ('<Control-y>',             ('on_key_redo', False)),
+        ('<Alt-Shift-BackSpace>',   ('on_key_redo', False)),
+    )
+
+    # Overrides applied on top of _CONTROL_BINDINGS for the chars canvas
+    _CONTROL_BINDINGS_CHARS: Tuple[Tuple[str, Tuple[str, bool]], ...] = (
+        ('<Left>',                  ('on_key_move_left_byte', True)),
+        ('<Right>',                 ('on_key_move_right_byte', True)),
+    )
+
+    _MOUSE_BINDINGS_CELLS: Tuple[Tuple[str, str], ...] = (
+        ('<Button-1>',              'on_cells_selection_press'),
+        ('<Double-Button-1>',       'on_cells_selection_double'),
+        ('<Shift-Button-1>',        'on_cells_selection_motion'),
+        ('<B1-Motion>',             'on_cells_selection_motion'),
+        ('<ButtonRelease-1>',       'on_cells_selection_release'),
+        ('<MouseWheel>',            'on_cells_chars_wheel'),
+    )
+
+    _MOUSE_BINDINGS_CHARS: Tuple[Tuple[str, str], ...] = (
+        ('<Button-1>',              'on_chars_selection_press'),
+        ('<Double-Button-1>',       'on_chars_selection_double'),
+        ('<Shift-Button-1>',        'on_chars_selection_motion'),
+        ('<B1-Motion>',             'on_chars_selection_motion'),
+        ('<ButtonRelease-1>',       'on_chars_selection_release'),
+        ('<MouseWheel>',            'on_cells_chars_wheel'),
+    )
+
     def __init__(
         self,
         parent,
@@ -456,9 +804,7 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         self._pad_x = pad_x
         self._pad_y = pad_y
 
-        font = tk.font.Font(font=('Consolas', 10))
-        font_w = font.measure('#')
-        font_h = font.metrics('linespace')
+        font, font_w, font_h = _get_font('Consolas', 10)
 
         self._font = font
         self._font_w = font_w
@@ -475,9 +821,27 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         view_w = pad_x + (font_w * (line_length * (cell_format_length + cell_spacing) - 1)) + pad_x
         self._view_w = max(offset_w, view_w)
 
+        # Memoized cells view width; it only moves with the cell layout,
+        # not with scrolling, so update_view can reuse it between changes
+        self._cells_view_w: PixelCoord = view_w
+        self._cells_view_w_params = (line_length, cell_format_length, cell_spacing)
+
         self._sel_start_address_prev: Address = -1  # dummy
         self._sel_endin_address_prev: Address = -1  # dummy
 
+        self._redraw_deferred: bool = False
+        self._scroll_delta_y: int = 0
+
+        # Typed digits buffered until the next idle tick, so that a fast
+        # burst costs one scheduled callback instead of one per keystroke
+        self._pending_digits_cells: List[str] = []
+        self._pending_digits_chars: List[str] = []
+
+        self._configure_pending: Optional[str] = None
+
+        # Pending update_view force flags; None when no pass is scheduled
+        self._update_view_flags: Optional[List[bool]] = None
+
     def __init_address_bar(self) -> None:
         pad_x, pad_y = self._pad_x, self._pad_y
         font_w, font_h = self._font_w, self._font_h
@@ -515,6 +879,7 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         offset_text_id: CanvasObject = offset_canvas.create_text(1 + pad_x, pad_y, text='', anchor=tk.NW,
                                                                  font=font, fill=_COLOR_FG)
         self._offset_text_id = offset_text_id
+        self._offset_text_params = None  # dummy, rebuilt by the first update
 
     def __init_cells_view(self) -> None:
         pad_y = self._pad_y
@@ -525,6 +890,8 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         self._cells_pixel_x: PixelCoord = 0  # dummy
         self._cells_pixel_y: PixelCoord = 0  # dummy
         self._cells_pixel_y_prev: PixelCoord = -1  # dummy
+        self._cells_pixel_x_prev: PixelCoord = -1  # dummy
+        self._cell_pixel_xs_prev: Optional[Tuple[PixelCoord, ...]] = None
 
         cells_canvas = tk.Canvas(self, width=view_w, height=view_h, borderwidth=1, highlightthickness=0,
                                       relief=tk.SUNKEN, bg=_COLOR_BG, cursor='xterm',
@@ -550,6 +917,7 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         self._cells_pixel: MutableMapping[CellCoords, PixelCoords] = {}
         self._cells_selected: set = set()
         self._cells_text_str: MutableMapping[CellCoords, str] = {}
+        self._chars_text_str: MutableMapping[CellCoords, str] = {}
 
     def __init_chars_view(self) -> None:
         pad_x = self._pad_x
@@ -602,129 +970,29 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         chars_cursor_id = self._chars_canvas.create_line(-2, -2, -1, -1, width=2, fill=color, tags='cursor')
         self._chars_cursor_id: CanvasObject = chars_cursor_id
 
-    def __init_bindings(self) -> None:
-
-        control_bindings = {
-            '<plus>':                  self.on_key_reserve_cell,
-            '<minus>':                 self.on_key_delete_cell,
-            '<period>':                self.on_key_clear_cell,
-            '<BackSpace>':             self.on_key_clear_back,
-            '<comma>':                 self.on_key_clear_next,
-            '<Delete>':                self.on_key_delete,
-            '$':                       self.on_key_fill,
-            '%':                       self.on_key_flood,
-
-            '<Control-x>':             self.on_key_cut,
-            '<Shift-Delete>':          self.on_key_cut,
-
-            '<Control-c>':             self.on_key_copy,
-            '<Control-C>':             self.on_key_copy,
-            '<Control-Insert>':        self.on_key_copy,
-
-            '<Control-v>':             self.on_key_paste,
-            '<Control-V>':             self.on_key_paste,
-            '<Shift-Insert>':          self.on_key_paste,
-
-            '<Control-k>':             self.on_key_crop,
-
-            '<Control-m>':             self.on_key_move_focus,
-            '<Control-M>':             self.on_key_move_apply,
-
-            '<Control-Up>':            self.on_key_scroll_line_up,
-            '<Control-Prior>':         self.on_key_scroll_page_up,
-
-            '<Control-Down>':          self.on_key_scroll_line_down,
-            '<Control-Next>':          self.on_key_scroll_page_down,
-
-            '<Control-Alt-Up>':        self.on_key_scroll_top,
-            '<Control-Alt-Down>':      self.on_key_scroll_bottom,
-
-            '<Left>':                  self.on_key_move_left_digit,
-            '<Shift-Left>':            self.on_key_move_left_digit,
-
-            '<Control-Left>':          self.on_key_move_left_byte,
-            '<Control-Shift-Left>':    self.on_key_move_left_byte,
-
-            '<Alt-Left>':              self.on_key_goto_block_previous,
-            '<Alt-Shift-Left>':        self.on_key_goto_block_previous,
-
-            '<Right>':                 self.on_key_move_right_digit,
-            '<Shift-Right>':           self.on_key_move_right_digit,
-
-            '<Control-Right>':         self.on_key_move_right_byte,
-            '<Control-Shift-Right>':   self.on_key_move_right_byte,
-
-            '<Alt-Right>':             self.on_key_goto_block_next,
-            '<Alt-Shift-Right>':       self.on_key_goto_block_next,
-
-            '<Up>':                    self.on_key_move_line_up,
-            '<Shift-Up>':              self.on_key_move_line_up,
-
-            '<Prior>':                 self.on_key_move_page_up,
-            '<Shift-Prior>':           self.on_key_move_page_up,
-
-            '<Down>':                  self.on_key_move_line_down,
-            '<Shift-Down>':            self.on_key_move_line_down,
-
-            '<Next>':                  self.on_key_move_page_down,
-            '<Shift-Next>':            self.on_key_move_page_down,
-
-            '<Home>':                  self.on_key_goto_line_start,
-            '<Shift-Home>':            self.on_key_goto_line_start,
-
-            '<End>':                   self.on_key_goto_line_endin,
-            '<Shift-End>':             self.on_key_goto_line_endin,
-
-            '<Control-g>':             self.on_key_goto_memory_focus,
-            '<Control-G>':             self.on_key_goto_memory_apply,
-
-            '<Control-Home>':          self.on_key_goto_memory_start,
-            '<Control-Shift-Home>':    self.on_key_goto_memory_start,
-
-            '<Control-End>':           self.on_key_goto_memory_endin,
-            '<Control-Shift-End>':     self.on_key_goto_memory_endin,
-
-            '<Control-Alt-End>':       self.on_key_goto_memory_endex,
-            '<Control-Alt-Shift-End>': self.on_key_goto_memory_endex,
+        self._cursor_state_prev = None  # parked
+        self._cursor_colors_prev = None  # dummy, applied by the first update
+        self._cursor_raise_pending: bool = False
 
-            '<Alt-Home>':              self.on_key_goto_block_start,
-            '<Alt-Shift-Home>':        self.on_key_goto_block_start,
-
-            '<Alt-End>':               self.on_key_goto_block_endin,
-            '<Alt-Shift-End>':         self.on_key_goto_block_endin,
-
-            '<Alt-Insert>':            self.on_key_copy_address,
-            '<Alt-Shift-Insert>':      self.on_key_set_address,
-            '<Control-a>':             self.on_key_select_all,
-            '<Control-r>':             self.on_key_select_range,
-            '<Escape>':                self.on_key_escape_selection,
-            '<Insert>':                self.on_key_switch_cursor_mode,
-            '<F5>':                    self.on_key_redraw,
-
-            '<Control-z>':             self.on_key_undo,
-            '<Alt-BackSpace>':         self.on_key_undo,
-            '<Control-Z>':             self.on_key_redo,
-            '<Control-y>':             self.on_key_redo,
-            '<Alt-Shift-BackSpace>':   self.on_key_redo,
-        }
+    def __init_bindings(self) -> None:
+        getattr_self = self.__getattribute__
+        engine = self._engine
 
-        mouse_bindings = {
-            '<Button-1>':              self.on_cells_selection_press,
-            '<Double-Button-1>':       self.on_cells_selection_double,
-            '<Shift-Button-1>':        self.on_cells_selection_motion,
-            '<B1-Motion>':             self.on_cells_selection_motion,
-            '<ButtonRelease-1>':       self.on_cells_selection_release,
-            '<MouseWheel>':            self.on_cells_chars_wheel,
-        }
+        def bind_control(canvas_bind, key, name, want_shift):
+            method = getattr(engine, name)
+            if want_shift:
+                canvas_bind(key, lambda event, m=method: m(_is_shift_in_event(event)))
+            else:
+                canvas_bind(key, lambda event, m=method: m())
 
         # Bind data view canvas actions
         cells_canvas = self.cells_canvas
 
-        for key, handler in control_bindings.items():
-            cells_canvas.bind(key, handler)
+        for key, (name, want_shift) in self._CONTROL_BINDINGS:
+            bind_control(cells_canvas.bind, key, name, want_shift)
 
-        for key, handler in mouse_bindings.items():
-            cells_canvas.bind(key, handler)
+        for key, name in self._MOUSE_BINDINGS_CELLS:
+            cells_canvas.bind(key, getattr_self(name))
 
         for key in HEX_SET:
             cells_canvas.bind(key, self.on_key_digit_cells)
@@ -736,28 +1004,15 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         address_canvas = self.address_canvas
         address_canvas.bind('<MouseWheel>', self.on_cells_chars_wheel)
 
-        # Bind chars canvas actions
-        control_bindings.update({
-            '<Left>':           self.on_key_move_left_byte,
-            '<Right>':          self.on_key_move_right_byte,
-        })
-
-        mouse_bindings = {
-            '<Button-1>':        self.on_chars_selection_press,
-            '<Double-Button-1>': self.on_chars_selection_double,
-            '<Shift-Button-1>':  self.on_chars_selection_motion,
-            '<B1-Motion>':       self.on_chars_selection_motion,
-            '<ButtonRelease-1>': self.on_chars_selection_release,
-            '<MouseWheel>':      self.on_cells_chars_wheel,
-        }
-
+        # Bind chars canvas actions; later entries rebind earlier ones, so
+        # the overrides simply follow the shared table
         chars_canvas = self.chars_canvas
 
-        for key, handler in control_bindings.items():
-            chars_canvas.bind(key, handler)
+        for key, (name, want_shift) in self._CONTROL_BINDINGS + self._CONTROL_BINDINGS_CHARS:
+            bind_control(chars_canvas.bind, key, name, want_shift)
 
-        for key, handler in mouse_bindings.items():
-            chars_canvas.bind(key, handler)
+        for key, name in self._MOUSE_BINDINGS_CHARS:
+            chars_canvas.bind(key, getattr_self(name))
 
         chars_canvas.bind('<Key>', self.on_key_digit_chars)
         chars_canvas.bind('<FocusIn>', self.on_chars_focus_in)
@@ -765,6 +1020,7 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
 
         # Bind widget actions
         self.bind('<Configure>', self.on_configure)
+        self.bind('<Map>', self.on_map)
 
     def focus_set(self) -> None:
         self.focus_set_cells()
@@ -823,7 +1079,8 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         self._offset_canvas.xview(*args)
         # self._cells_pixel_x = self._cells_canvas.canvasx(0)
         view_ratio_x = self._offset_canvas.xview()[0]
-        self._cells_pixel_x = floor(self._cells_pixel_size[0] * view_ratio_x)
+        # Non-negative product: plain int() truncation equals floor()
+        self._cells_pixel_x = int(self._cells_pixel_size[0] * view_ratio_x)
 
     def _on_vbar(self, mode, *args):
         cells_pixel_y = cells_pixel_y_prev = self._cells_pixel_y
@@ -836,26 +1093,21 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
             step, what = args
             step = int(step)
 
+            # Closed-form stepping: align to the next/previous multiple of
+            # the row or page height, in one division instead of a Python
+            # loop proportional to the step size
             if what == tk.UNITS:
                 if step > 0:
-                    for _ in range(step):
-                        remainder = cells_pixel_y % font_h
-                        cells_pixel_y += font_h - remainder
+                    cells_pixel_y = ((cells_pixel_y // font_h) + step) * font_h
                 elif step < 0:
-                    for _ in range(-step):
-                        remainder = cells_pixel_y % font_h
-                        cells_pixel_y -= remainder if remainder else font_h
+                    cells_pixel_y = (-(-cells_pixel_y // font_h) + step) * font_h
 
             elif what == tk.PAGES:
                 page_h = font_h * 0x100
                 if step > 0:
-                    for _ in range(step):
-                        remainder = cells_pixel_y % page_h
-                        cells_pixel_y += page_h - remainder
+                    cells_pixel_y = ((cells_pixel_y // page_h) + step) * page_h
                 elif step < 0:
-                    for _ in range(-step):
-                        remainder = cells_pixel_y % page_h
-                        cells_pixel_y -= remainder if remainder else page_h
+                    cells_pixel_y = (-(-cells_pixel_y // page_h) + step) * page_h
 
         if cells_pixel_y_prev != cells_pixel_y:
             self._cells_pixel_y = cells_pixel_y
@@ -863,181 +1115,36 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
             self.update_vbar()
 
     def on_key_digit_cells(self, event=None):
-        self.after_idle(self._on_key_digit_cells, event)
-
-    def _on_key_digit_cells(self, event=None):
-        digit_char = event.char
-        if digit_char.isprintable():
-            self._engine.on_key_digit_cells(digit_char)
+        # Bound to the hex digit keys only, which are printable by
+        # construction; the engine validates the digit value anyway
+        pending = self._pending_digits_cells
+        if not pending:
+            self.after_idle(self._flush_digits_cells)
+        pending.append(event.char)
+
+    def _flush_digits_cells(self):
+        pending = self._pending_digits_cells
+        self._pending_digits_cells = []
+        on_key_digit = self._engine.on_key_digit_cells
+        for digit_char in pending:
+            on_key_digit(digit_char)
 
     def on_key_digit_chars(self, event=None):
-        self.after_idle(self._on_key_digit_chars, event)
-
-    def _on_key_digit_chars(self, event=None):
+        # Single compare for the common ASCII case; the Unicode category
+        # check only runs for characters beyond '~' (extended encodings)
         digit_char = event.char
-        if digit_char.isprintable():
-            self._engine.on_key_digit_chars(digit_char)
-
-    def on_key_reserve_cell(self, event=None):
-        self._engine.on_key_reserve_cell()
-
-    def on_key_delete_cell(self, event=None):
-        self._engine.on_key_delete_cell()
-
-    def on_key_clear_cell(self, event=None):
-        self._engine.on_key_clear_cell()
-
-    def on_key_clear_back(self, event=None):
-        self._engine.on_key_clear_back()
-
-    def on_key_clear_next(self, event=None):
-        self._engine.on_key_clear_next()
-
-    def on_key_delete(self, event=None):
-        self._engine.on_key_delete()
-
-    def on_key_fill(self, event=None):
-        self._engine.on_key_fill()
-
-    def on_key_flood(self, event=None):
-        self._engine.on_key_flood()
-
-    def on_key_cut(self, event=None):
-        self._engine.on_key_cut()
-
-    def on_key_copy(self, event=None):
-        self._engine.on_key_copy()
-
-    def on_key_paste(self, event=None):
-        self._engine.on_key_paste()
-
-    def on_key_crop(self, event=None):
-        self._engine.on_key_crop()
-
-    def on_key_move_focus(self, event=None):
-        self._engine.on_key_move_focus()
-
-    def on_key_move_apply(self, event=None):
-        self._engine.on_key_move_apply()
-
-    def on_key_scroll_line_up(self, event=None):
-        self._engine.on_key_scroll_line_up()
-
-    def on_key_scroll_page_up(self, event=None):
-        self._engine.on_key_scroll_page_up()
-
-    def on_key_scroll_line_down(self, event=None):
-        self._engine.on_key_scroll_line_down()
-
-    def on_key_scroll_page_down(self, event=None):
-        self._engine.on_key_scroll_page_down()
-
-    def on_key_scroll_top(self, event=None):
-        self._engine.on_key_scroll_top()
-
-    def on_key_scroll_bottom(self, event=None):
-        self._engine.on_key_scroll_bottom()
-
-    def on_key_move_left_digit(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_left_digit(shift)
-
-    def on_key_move_right_digit(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_right_digit(shift)
-
-    def on_key_move_left_byte(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_left_byte(shift)
-
-    def on_key_move_right_byte(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_right_byte(shift)
-
-    def on_key_move_line_up(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_line_up(shift)
-
-    def on_key_move_page_up(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_page_up(shift)
-
-    def on_key_move_line_down(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_line_down(shift)
-
-    def on_key_move_page_down(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_move_page_down(shift)
-
-    def on_key_goto_line_start(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_line_start(shift)
-
-    def on_key_goto_line_endin(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_line_endin(shift)
-
-    def on_key_goto_memory_apply(self, event=None):
-        self._engine.on_key_goto_memory_apply()
-
-    def on_key_goto_memory_focus(self, event=None):
-        self._engine.on_key_goto_memory_focus()
-
-    def on_key_goto_memory_start(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_memory_start(shift)
-
-    def on_key_goto_memory_endin(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_memory_endin(shift)
-
-    def on_key_goto_memory_endex(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_memory_endex(shift)
-
-    def on_key_goto_block_previous(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_block_previous(shift)
-
-    def on_key_goto_block_next(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_block_next(shift)
-
-    def on_key_goto_block_start(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_block_start(shift)
-
-    def on_key_goto_block_endin(self, event=None):
-        shift = _is_shift_in_event(event)
-        self._engine.on_key_goto_block_endin(shift)
-
-    def on_key_copy_address(self, event=None):
-        self._engine.on_key_copy_address()
-
-    def on_key_set_address(self, event=None):
-        self._engine.on_key_set_address()
-
-    def on_key_select_all(self, event=None):
-        self._engine.on_key_select_all()
-
-    def on_key_select_range(self, event=None):
-        self._engine.on_key_select_range()
-
-    def on_key_escape_selection(self, event=None):
-        self._engine.on_key_escape_selection()
-
-    def on_key_switch_cursor_mode(self, event=None):
-        self._engine.on_key_switch_cursor_mode()
-
-    def on_key_redraw(self, event=None):
-        self._engine.on_key_redraw()
-
-    def on_key_undo(self, event=None):
-        self._engine.on_key_undo()
-
-    def on_key_redo(self, event=None):
-        self._engine.on_key_redo()
+        if digit_char and (' ' <= digit_char <= '~' or digit_char.isprintable()):
+            pending = self._pending_digits_chars
+            if not pending:
+                self.after_idle(self._flush_digits_chars)
+            pending.append(digit_char)
+
+    def _flush_digits_chars(self):
+        pending = self._pending_digits_chars
+        self._pending_digits_chars = []
+        on_key_digit = self._engine.on_key_digit_chars
+        for digit_char in pending:
+            on_key_digit(digit_char)
 
     def on_cells_selection_press(self, event=None):
         cell_x, cell_y, digit = self.event_to_cursor_coords(event)
@@ -1075,14 +1182,33 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         self.scroll_wheel(event)
 
     def on_configure(self, event=None):
+        # Coalesce the Configure storm of a resize drag: keep pushing the
+        # relayout back until the events pause for a beat
+        if self._configure_pending is not None:
+            self.after_cancel(self._configure_pending)
+        self._configure_pending = self.after(_CONFIGURE_DELAY, self._do_configure)
+
+    def _do_configure(self):
+        self._configure_pending = None
         self.update_idletasks()
 
         view_ratio_x = self._offset_canvas.xview()[0]
-        self._cells_pixel_x = floor(self._cells_pixel_size[0] * view_ratio_x)
+        self._cells_pixel_x = int(self._cells_pixel_size[0] * view_ratio_x)
 
         self.update_vbar()
         self.update_view()
 
+    def on_map(self, event=None):
+        # Consume any paint deferred while the widget was not viewable
+        if self._redraw_deferred:
+            self._redraw_deferred = False
+            self.redraw()
+
+    def is_paintable(self) -> bool:
+        # Viewable means mapped along with all of its ancestors, which goes
+        # False while the top-level window is withdrawn or iconified
+        return bool(self.winfo_viewable())
+
     def on_cells_focus_in(self, event=None):
         self._cells_cursor_color = _COLOR_CUR
         self.update_cursor()
@@ -1101,7 +1227,7 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
 
     def _on_wheel(self, event=None):
         step = -int(event.delta) // self._font_h
-        self._on_vbar(tk.SCROLL, step, tk.UNITS)
+        self._scroll_by(step)
 
     def get_cell_bounds_y(self) -> Tuple[CellCoord, CellCoord]:
         pad_y = self._pad_y
@@ -1132,6 +1258,13 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         if endin_y is None:
             endin_y = self._cell_endex[1] - 1
 
+        # Cull to the visible rows, with a small overscan to avoid pop-in
+        # while scrolling; cells scrolled in later get marked dirty by the
+        # geometry update anyway
+        overscan = 2
+        start_y = max(start_y, self._cell_start[1] - overscan)
+        endin_y = min(endin_y, (self._cell_endex[1] - 1) + overscan)
+
         if start_y <= endin_y:
             if start_x is None:
                 start_x = self._cell_start[0]
@@ -1144,9 +1277,14 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
 
             if start_y == endin_y:
                 cells_dirty.update((x, start_y) for x in range(start_x, endin_x + 1))
+            elif (endin_y - start_y + 1) * line_length >= (len(self._cells_text_id) >> 1):
+                # The span covers most of the viewport: one bulk C-level
+                # update of every visible cell beats materializing each
+                # coordinate tuple through nested Python generators
+                cells_dirty.update(self._cells_text_id)
             else:
                 cells_dirty.update((x, start_y) for x in range(start_x, line_length))
-                cells_dirty.update((x, y) for y in range(start_y + 1, endin_y) for x in range(0, line_length))
+                cells_dirty.update(product(range(line_length), range(start_y + 1, endin_y)))
                 cells_dirty.update((x, endin_y) for x in range(0, endin_x + 1))
 
     def mark_dirty_range(
@@ -1155,16 +1293,20 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         endex_address: Optional[Address] = None,
     ):
         status = self._status
+        # Inlined address_to_cell_coords: one divmod instead of a method
+        # call per bound
+        line_length = status.line_length
+        address_skip = status.address_skip
 
         if start_address is None:
             start_x, start_y = None, None
         else:
-            start_x, start_y = status.address_to_cell_coords(start_address)
+            start_y, start_x = divmod(start_address - address_skip, line_length)
 
         if endex_address is None:
             endin_x, endin_y = None, None
         else:
-            endin_x, endin_y = status.address_to_cell_coords(max(start_address, endex_address - 1))
+            endin_y, endin_x = divmod(max(start_address, endex_address - 1) - address_skip, line_length)
 
         self.mark_dirty_inline(start_x, start_y, endin_x, endin_y)
 
@@ -1174,17 +1316,24 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
 
         memory_start = memory.start
         memory_endex = memory.endex
-        memory_start_y = status.address_to_cell_coords(memory_start)[1]
-        memory_endex_y = status.address_to_cell_coords(max(memory_start, memory_endex - 1))[1] + 1
+        line_length = status.line_length
+        address_skip = status.address_skip
+        memory_start_y = (memory_start - address_skip) // line_length
+        memory_endex_y = (max(memory_start, memory_endex - 1) - address_skip) // line_length + 1
 
-        pixel_w, pixel_h = (self._cells_pixel_size[0], self._cells_canvas.winfo_height())
-        cell_start_y = self.pixel_to_cell_coords(0, 0)[1]
-        cell_endin_y = self.pixel_to_cell_coords(pixel_w - 1, pixel_h - 1)[1]
+        # Only the y axis matters for the scrollbar; inline the row
+        # conversion instead of going through the generic pixel converters
+        pixel_h = self._cells_canvas.winfo_height()
+        pixel_y_base = self._cells_pixel_y - self._pad_y
+        font_h = self._font_h
+        cell_start_y = pixel_y_base / font_h
+        cell_endin_y = (pixel_y_base + pixel_h - 1) / font_h
 
-        ratio_start = (cell_start_y - memory_start_y) / (memory_endex_y - memory_start_y)
-        ratio_endin = (cell_endin_y - memory_start_y) / (memory_endex_y - memory_start_y)
-        vbar_start = max(0., min(ratio_start, 1.))
-        vbar_endin = max(0., min(ratio_endin, 1.))
+        memory_span_y = memory_endex_y - memory_start_y
+        ratio_start = (cell_start_y - memory_start_y) / memory_span_y
+        ratio_endin = (cell_endin_y - memory_start_y) / memory_span_y
+        vbar_start = 0. if ratio_start < 0. else (1. if ratio_start > 1. else ratio_start)
+        vbar_endin = 0. if ratio_endin < 0. else (1. if ratio_endin > 1. else ratio_endin)
 
         self._cells_vbar.set(vbar_start, vbar_endin)
 
@@ -1194,15 +1343,62 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         force_selection: bool = False,
         force_content: bool = False,
     ):
+        # Coalesce bursts of update requests (mouse-drag selection, key
+        # auto-repeat, scroll floods): OR the force flags together and
+        # drain one combined pass per idle tick of the event loop
+        flags = self._update_view_flags
+        if flags is None:
+            self._update_view_flags = [force_geometry, force_selection, force_content]
+            self.after_idle(self._flush_update_view)
+        else:
+            if force_geometry:
+                flags[0] = True
+            if force_selection:
+                flags[1] = True
+            if force_content:
+                flags[2] = True
+
+    def _flush_update_view(self) -> None:
+        flags = self._update_view_flags
+        self._update_view_flags = None
+        self._update_view(*flags)
+
+    def _update_view(
+        self,
+        force_geometry: bool = False,
+        force_selection: bool = False,
+        force_content: bool = False,
+    ):
+        if not self.is_paintable():
+            # Painting an invisible window is wasted work; defer a single
+            # full redraw until it gets mapped again
+            self._redraw_deferred = True
+            return
+
         status = self._status
         cells_canvas = self._cells_canvas
 
+        if not (force_geometry or force_selection or force_content or
+                self._cells_dirty or
+                self._cells_pixel_y != self._cells_pixel_y_prev or
+                self._cells_pixel_x != self._cells_pixel_x_prev or
+                status.sel_start_address != self._sel_start_address_prev or
+                status.sel_endin_address != self._sel_endin_address_prev or
+                cells_canvas.winfo_height() != self._cells_pixel_size[1]):
+            # Nothing forced, nothing dirty, no scroll, no selection or
+            # viewport change since the last repaint: steady-state no-op
+            return
+
         # Resize canvas if required
         pad_x, pad_y = self._pad_x, self._pad_y
         font_w, font_h = self._font_w, self._font_h
         cell_format_length = status.cell_format_length
         line_length = status.line_length
-        view_w = pad_x + (font_w * (line_length * (cell_format_length + status.cell_spacing) - 1)) + pad_x
+        view_w_params = (line_length, cell_format_length, status.cell_spacing)
+        if view_w_params != self._cells_view_w_params:
+            self._cells_view_w_params = view_w_params
+            self._cells_view_w = pad_x + (font_w * (line_length * (cell_format_length + view_w_params[2]) - 1)) + pad_x
+        view_w = self._cells_view_w
         pixel_w = self._cells_pixel_size[0]
         if view_w != pixel_w:
             pixel_w, pixel_h = view_w, cells_canvas.winfo_height()
@@ -1212,10 +1408,16 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
             cells_pixel_size = (pixel_w, cells_canvas.winfo_height())
             pixel_w, pixel_h = cells_pixel_size
 
-        cell_start_x, cell_start_y = self.pixel_to_cell_coords(0, 0)
-        cell_start_x, cell_start_y = max(0, floor(cell_start_x)), floor(cell_start_y)
-        cell_endex_x, cell_endex_y = self.pixel_to_cell_coords(pixel_w, pixel_h)
-        cell_endex_x, cell_endex_y = min(floor(cell_endex_x) + 1, line_length), floor(cell_endex_y) + 1
+        # Inline pixel_to_cell_coords for the two corner probes, reusing
+        # the attributes already frozen into locals above
+        cell_spacing = status.cell_spacing
+        cell_period = cell_format_length + cell_spacing
+        cell_skew = cell_spacing - 1
+        cells_pixel_y = self._cells_pixel_y
+        cell_start_x = max(0, floor(((-pad_x / font_w) - cell_skew) / cell_period))
+        cell_start_y = floor((cells_pixel_y - pad_y) / font_h)
+        cell_endex_x = min(floor((((pixel_w - pad_x) / font_w) - cell_skew) / cell_period) + 1, line_length)
+        cell_endex_y = floor((pixel_h - pad_y + cells_pixel_y) / font_h) + 1
         self._cell_start = (cell_start_x, cell_start_y)
         self._cell_endex = (cell_endex_x, cell_endex_y)
         self._address_start = status.cell_coords_to_address(cell_start_x, cell_start_y)
@@ -1245,6 +1447,7 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
 
         self._cells_pixel_size = cells_pixel_size
         self._cells_pixel_y_prev = self._cells_pixel_y
+        self._cells_pixel_x_prev = self._cells_pixel_x
         self._sel_start_address_prev = status.sel_start_address
         self._sel_endin_address_prev = status.sel_endin_address
 
@@ -1264,29 +1467,48 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         chars_text_id = self._chars_text_id
         chars_rect_id = self._chars_rect_id
 
-        cells_key_keep = set()
-        cells_key_miss = set()
-        addrs_key_keep = set()
-        addrs_key_miss = set()
-
-        # Mark missing cells and addresses, and those to be kept
-        for y in range(cell_start_y, cell_endex_y):
-            for x in range(cell_start_x, cell_endex_x):
-                x_y = (x, y)
-                if x_y in cells_text_id:
-                    cells_key_keep.add(x_y)
-                else:
-                    cells_key_miss.add(x_y)
-            if y in addrs_text_id:
-                addrs_key_keep.add(y)
-            else:
-                addrs_key_miss.add(y)
-
-        cells_key_trash = [x_y for x_y in cells_text_id if x_y not in cells_key_keep]
-        addrs_key_trash = [y for y in addrs_text_id if y not in addrs_key_keep]
+        # Classify kept, missing, and trashed cells and addresses with set
+        # algebra over the mapping key views, instead of visiting every
+        # visible coordinate with Python-level membership tests
+        new_cells = set(product(range(cell_start_x, cell_endex_x),
+                                range(cell_start_y, cell_endex_y)))
+        new_rows = set(range(cell_start_y, cell_endex_y))
+        old_cells = cells_text_id.keys()
+        old_rows = addrs_text_id.keys()
+
+        cells_key_keep = old_cells & new_cells
+        cells_key_miss = new_cells - old_cells
+        cells_key_trash = list(old_cells - new_cells)
+        addrs_key_keep = old_rows & new_rows
+        addrs_key_miss = new_rows - old_rows
+        addrs_key_trash = list(old_rows - new_rows)
 
         font_w, font_h = self._font_w, self._font_h
         pad_x, pad_y = self._pad_x, self._pad_y
+        cell_format_length = status.cell_format_length
+        cell_spacing = status.cell_spacing
+        chars_visible = self._chars_visible
+        cell_pixel_xs = _pixel_x_table(pad_x, font_w, line_length,
+                                       cell_format_length + cell_spacing, cell_spacing - 1)
+        char_pixel_xs = _pixel_x_table(pad_x, font_w, line_length, 1, 0)
+        pixel_y_base = pad_y - self._cells_pixel_y
+
+        # Pure vertical scroll: every kept item moves by the same offset,
+        # which Tk applies per tag with a single command instead of one
+        # coords() roundtrip per item. Missing and recycled items are
+        # positioned absolutely below, so the blanket move cannot disturb
+        # them; the x table identity check rules out layout changes
+        scroll_delta_y = self._cells_pixel_y_prev - self._cells_pixel_y
+        pure_scroll = (scroll_delta_y != 0 and bool(cells_key_keep) and
+                       cell_pixel_xs is self._cell_pixel_xs_prev)
+        self._cell_pixel_xs_prev = cell_pixel_xs
+        if pure_scroll:
+            cells_canvas.move('cell_text', 0, scroll_delta_y)
+            cells_canvas.move('cell_rect', 0, scroll_delta_y)
+            if chars_visible:
+                chars_canvas.move('char_text', 0, scroll_delta_y)
+                chars_canvas.move('char_rect', 0, scroll_delta_y)
+            address_canvas.move('all', 0, scroll_delta_y)
 
         # Update address skip
         address_format = status.address_format_string
@@ -1313,33 +1535,35 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         for y in addrs_key_trash:
             address_canvas.delete(addrs_text_id.pop(y))
 
-        # Update kept addresses
-        for y in addrs_key_keep:
-            addr_pixel_x = pad_x
-            addr_pixel_y = pad_y + (y * font_h) - self._cells_pixel_y
-            address_canvas.coords(addrs_text_id[y], addr_pixel_x, addr_pixel_y)
+        # Update kept addresses (already repositioned by a pure scroll)
+        if not pure_scroll:
+            for y in addrs_key_keep:
+                addr_pixel_x = pad_x
+                addr_pixel_y = pad_y + (y * font_h) - self._cells_pixel_y
+                address_canvas.coords(addrs_text_id[y], addr_pixel_x, addr_pixel_y)
 
         # Instance missing cells
         cells_dirty = self._cells_dirty
         cells_pixel = self._cells_pixel
         cells_selected = self._cells_selected
         cells_text = self._cells_text_str
+        chars_text = self._chars_text_str
         font = self._font
-        cell_format_length = status.cell_format_length
         rect_w_tail = cell_format_length * font_w
-        rect_w_body = rect_w_tail + (font_w * status.cell_spacing)
+        rect_w_body = rect_w_tail + (font_w * cell_spacing)
         rect_h = font_h
         cell_x_endin = line_length - 1
-        cell_text = '?' * status.cell_format_length
+        cell_text = '?' * cell_format_length
         char_text = '?'
-        chars_visible = self._chars_visible
         char_text_id = None
         char_rect_id = None
 
         for x_y in cells_key_miss:
-            cell_pixel_x, cell_pixel_y = self.cell_coords_to_pixel(*x_y)
-            char_pixel_x, char_pixel_y = self.char_coords_to_pixel(*x_y)
-            rect_w = rect_w_body if x_y[0] < cell_x_endin else rect_w_tail
+            x, y = x_y
+            cell_pixel_x = cell_pixel_xs[x]
+            char_pixel_x = char_pixel_xs[x]
+            cell_pixel_y = char_pixel_y = pixel_y_base + (y * font_h)
+            rect_w = rect_w_body if x < cell_x_endin else rect_w_tail
 
             if cells_key_trash:
                 key = cells_key_trash.pop()
@@ -1392,15 +1616,20 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
                 chars_rect_id[x_y] = char_rect_id
 
             cells_dirty.add(x_y)
-            cells_pixel[x_y] = (-1, -1)  # invalidate
-            cells_selected.add(x_y)
+            # Seed the cache with the just-applied position, so the next
+            # keep pass does not re-issue coords for an unmoved item; the
+            # dirty mark alone already forces the selection state and the
+            # text to be reapplied by the later passes
+            cells_pixel[x_y] = (cell_pixel_x, cell_pixel_y)
             cells_text[x_y] = ''  # invalidate
+            chars_text[x_y] = ''  # invalidate
 
         cells_canvas.tag_raise('cell_text')
         cells_canvas.tag_lower('cell_rect')
         if chars_visible:
             chars_canvas.tag_raise('char_text')
             chars_canvas.tag_lower('char_rect')
+        self._cursor_raise_pending = True  # the text now covers the cursor
 
         # Remove trashed cells
         for x_y in cells_key_trash:
@@ -1413,20 +1642,33 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
             cells_pixel.pop(x_y)
             cells_selected.discard(x_y)
             cells_text.pop(x_y)
+            chars_text.pop(x_y, None)
 
         # Update kept cells
+        if pure_scroll:
+            # The blanket move already repositioned the kept items; refresh
+            # the cached positions in bulk and fall through only for entries
+            # invalidated by a full redraw, which need absolute coordinates
+            stale = [x_y for x_y in cells_key_keep if cells_pixel[x_y] == (-1, -1)]
+            for x_y in cells_key_keep:
+                cell_pixel = cells_pixel[x_y]
+                if cell_pixel != (-1, -1):
+                    cells_pixel[x_y] = (cell_pixel[0], cell_pixel[1] + scroll_delta_y)
+            cells_key_keep = stale
+
         for x_y in cells_key_keep:
-            cell_pixel = self.cell_coords_to_pixel(*x_y)
-            char_pixel = self.char_coords_to_pixel(*x_y)
+            x, y = x_y
+            cell_pixel_y = pixel_y_base + (y * font_h)
+            cell_pixel = (cell_pixel_xs[x], cell_pixel_y)
 
             if cells_pixel[x_y] != cell_pixel:
                 cells_pixel[x_y] = cell_pixel
-                cell_pixel_x, cell_pixel_y = cell_pixel
-                char_pixel_x, char_pixel_y = char_pixel
+                cell_pixel_x = cell_pixel[0]
+                char_pixel_x, char_pixel_y = char_pixel_xs[x], cell_pixel_y
 
                 cells_canvas.coords(cells_text_id[x_y], cell_pixel_x, cell_pixel_y)
 
-                rect_w = rect_w_body if x_y[0] < cell_x_endin else rect_w_tail
+                rect_w = rect_w_body if x < cell_x_endin else rect_w_tail
                 cells_canvas.coords(cells_rect_id[x_y],
                                     cell_pixel_x, cell_pixel_y,
                                     cell_pixel_x + rect_w, cell_pixel_y + rect_h)
@@ -1441,11 +1683,16 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         # Update canvas sizes
         offset_canvas = self._offset_canvas
         offset_spacing = status.offset_spacing
-        offset_format_format = status.offset_format_string.format
-        offset_format_spacing = ' ' * offset_spacing
-        text = offset_format_spacing.join(offset_format_format(x) for x in range(line_length))
-        text = offset_format_spacing[:-1] + text
-        offset_canvas.itemconfigure(self._offset_text_id, text=text)
+        offset_params = (line_length, status.offset_format_string, offset_spacing)
+        if offset_params != self._offset_text_params:
+            # The column header is a pure function of the line layout;
+            # rebuild and push it to the canvas just when that changes
+            self._offset_text_params = offset_params
+            offset_format_format = status.offset_format_string.format
+            offset_format_spacing = ' ' * offset_spacing
+            text = offset_format_spacing.join(offset_format_format(x) for x in range(line_length))
+            text = offset_format_spacing[:-1] + text
+            offset_canvas.itemconfigure(self._offset_text_id, text=text)
 
         offset_format_length = status.offset_format_length
         offset_canvas_w = pad_x + (font_w * (line_length * (offset_format_length + offset_spacing) - 1)) + pad_x
@@ -1473,36 +1720,70 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         cells_text_id = self._cells_text_id
         cells_dirty = self._cells_dirty
         cells_text_str = self._cells_text_str
+        chars_text_str = self._chars_text_str
         chars_text_id = self._chars_text_id
 
         address = status.cell_coords_to_address(cell_start_x, cell_start_y)
-        rover = status.memory.values(address, ...).__next__
-        text_format = status.cell_format_string.format
+        cell_format_table = status.cell_format_table
         text_empty = '-' * status.cell_format_length
         char_empty = ' '
         chars_visible = self._chars_visible
         chars_table = status.chars_table
 
-        chars_title.configure(text=f'Text / {status.chars_encoding}')
+        # Hoist the Tcl dispatch out of the per-cell loop
+        cells_itemconfigure = cells_canvas.itemconfigure
+        chars_itemconfigure = chars_canvas.itemconfigure
 
-        for y in range(cell_start_y, cell_endex_y):
-            for x in range(cell_start_x, cell_endex_x):
-                value = rover()
-                x_y = (x, y)
+        chars_title.configure(text=f'Text / {status.chars_encoding}')
 
-                if x_y in cells_dirty:
+        if not cells_dirty:
+            return  # nothing to refresh; skip draining the memory rover
+
+        row_width = cell_endex_x - cell_start_x
+        if len(cells_dirty) < ((row_width * (cell_endex_y - cell_start_y)) >> 3):
+            # Sparse update (a few edited cells): peek just the dirty
+            # addresses instead of draining the rover across the whole
+            # visible window; the address layout mirrors the rover exactly
+            peek = status.memory.peek
+            for x_y in cells_dirty:
+                x, y = x_y
+                if cell_start_x <= x < cell_endex_x and cell_start_y <= y < cell_endex_y:
+                    value = peek(address + ((y - cell_start_y) * row_width) + (x - cell_start_x))
                     text_before = cells_text_str[x_y]
-                    text_after = text_empty if value is None else text_format(value)
+                    text_after = text_empty if value is None else cell_format_table[value]
 
                     if text_before != text_after:
                         cells_text_str[x_y] = text_after
-                        cells_canvas.itemconfigure(cells_text_id[x_y], text=text_after)
+                        cells_itemconfigure(cells_text_id[x_y], text=text_after)
 
                         if chars_visible:
                             c = char_empty if value is None else chars_table[value]
-                            chars_canvas.itemconfigure(chars_text_id[x_y], text=c)
+                            if chars_text_str[x_y] != c:
+                                chars_text_str[x_y] = c
+                                chars_itemconfigure(chars_text_id[x_y], text=c)
+            return
 
-                address += 1
+        # Full scan: advance the coordinates and the memory rover together
+        # at C level, instead of one Python-level rover call per cell
+        values = status.memory.values(address, ...)
+        coords = product(range(cell_start_y, cell_endex_y), range(cell_start_x, cell_endex_x))
+
+        for (y, x), value in zip(coords, values):
+            x_y = (x, y)
+
+            if x_y in cells_dirty:
+                text_before = cells_text_str[x_y]
+                text_after = text_empty if value is None else cell_format_table[value]
+
+                if text_before != text_after:
+                    cells_text_str[x_y] = text_after
+                    cells_itemconfigure(cells_text_id[x_y], text=text_after)
+
+                    if chars_visible:
+                        c = char_empty if value is None else chars_table[value]
+                        if chars_text_str[x_y] != c:
+                            chars_text_str[x_y] = c
+                            chars_itemconfigure(chars_text_id[x_y], text=c)
 
     def _update_background(self):
         status = self._status
@@ -1524,34 +1805,54 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         cells_selected_before = self._cells_selected
         cells_selected_after = set()
 
-        if selection_mode == sm_norm:
+        if selection_mode is sm_norm:
             # Straighten any backwards selections
             if sel_address_endin < sel_address_start:
                 sel_address_endin, sel_address_start = sel_address_start, sel_address_endin
 
-            # Mark those cells within the selected address range
-            address = status.cell_coords_to_address(cell_start_x, cell_start_y)
-            for y in range(cell_start_y, cell_endex_y):
-                for x in range(cell_start_x, cell_endex_x):
-                    if sel_address_start <= address <= sel_address_endin:
-                        cells_selected_after.add((x, y))
-                    address += 1
+            # Intersect the selected address range with the visible window
+            # analytically: the address rover runs contiguously over the
+            # visible window, so the selection covers at most one partial
+            # head row, a rectangle of full rows, and one partial tail row
+            row_width = cell_endex_x - cell_start_x
+            base_address = status.cell_coords_to_address(cell_start_x, cell_start_y)
+            address_lo = max(sel_address_start, base_address)
+            address_hi = min(sel_address_endin,
+                             base_address + (row_width * (cell_endex_y - cell_start_y)) - 1)
+            if row_width > 0 and address_lo <= address_hi:
+                y_lo, x_lo = divmod(address_lo - base_address, row_width)
+                y_hi, x_hi = divmod(address_hi - base_address, row_width)
+                y_lo += cell_start_y
+                y_hi += cell_start_y
+                x_lo += cell_start_x
+                x_hi += cell_start_x
+                if y_lo == y_hi:
+                    cells_selected_after.update((x, y_lo) for x in range(x_lo, x_hi + 1))
+                else:
+                    cells_selected_after.update((x, y_lo) for x in range(x_lo, cell_endex_x))
+                    cells_selected_after.update(product(range(cell_start_x, cell_endex_x),
+                                                        range(y_lo + 1, y_hi)))
+                    cells_selected_after.update((x, y_hi) for x in range(cell_start_x, x_hi + 1))
 
-        elif selection_mode == sm_rect:
+        elif selection_mode is sm_rect:
             # Straighten any backwards selections
             if sel_endin_cell_x < sel_start_cell_x:
                 sel_endin_cell_x, sel_start_cell_x = sel_start_cell_x, sel_endin_cell_x
             if sel_endin_cell_y < sel_start_cell_y:
                 sel_endin_cell_y, sel_start_cell_y = sel_start_cell_y, sel_endin_cell_y
 
-            # Mark those cells within the selected rectangle range
-            for y in range(cell_start_y, cell_endex_y):
-                for x in range(cell_start_x, cell_endex_x):
-                    if ((sel_start_cell_x <= x <= sel_endin_cell_x and
-                         sel_start_cell_y <= y <= sel_endin_cell_y)):
-                        cells_selected_after.add((x, y))
-
-        # Update only those cells that changed selection state
+            # Clip the selected rectangle against the visible region
+            x_from = max(sel_start_cell_x, cell_start_x)
+            x_upto = min(sel_endin_cell_x, cell_endex_x - 1)
+            y_from = max(sel_start_cell_y, cell_start_y)
+            y_upto = min(sel_endin_cell_y, cell_endex_y - 1)
+            cells_selected_after.update(product(range(x_from, x_upto + 1),
+                                                range(y_from, y_upto + 1)))
+
+        # Touch only the cells whose selection state actually flipped; any
+        # other visible cell keeps its current appearance. Dirty cells get
+        # their state re-applied unconditionally, as the geometry update
+        # may have recycled their items with stale colors
         cells_text_id = self._cells_text_id
         cells_rect_id = self._cells_rect_id
         chars_text_id = self._chars_text_id
@@ -1560,31 +1861,30 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         palette = (_COLOR_FG, _COLOR_OG)
         palette_sel = (_COLOR_SEL_FG, _COLOR_SEL_OG)
 
-        for y in range(cell_start_y, cell_endex_y):
-            for x in range(cell_start_x, cell_endex_x):
-                x_y = (x, y)
-                selected_after = x_y in cells_selected_after
+        to_select = (cells_selected_after - cells_selected_before) | (cells_dirty & cells_selected_after)
+        to_deselect = (cells_selected_before - cells_selected_after) | (cells_dirty - cells_selected_after)
+        to_select &= cells_text_id.keys()
+        to_deselect &= cells_text_id.keys()
 
-                if x_y in cells_dirty:
-                    selected_before = not selected_after  # force update
-                else:
-                    selected_before = x_y in cells_selected_before
+        # Hoist the Tcl dispatch out of the per-cell loops
+        cells_itemconfigure = cells_canvas.itemconfigure
+        chars_itemconfigure = chars_canvas.itemconfigure
 
-                if selected_before < selected_after:
-                    color = palette_sel[x & 1]
-                    cells_canvas.itemconfigure(cells_text_id[x_y], fill=color)
-                    cells_canvas.itemconfigure(cells_rect_id[x_y], state=tk.NORMAL)
-                    if chars_visible:
-                        chars_canvas.itemconfigure(chars_text_id[x_y], fill=color)
-                        chars_canvas.itemconfigure(chars_rect_id[x_y], state=tk.NORMAL)
+        for x_y in to_select:
+            color = palette_sel[x_y[0] & 1]
+            cells_itemconfigure(cells_text_id[x_y], fill=color)
+            cells_itemconfigure(cells_rect_id[x_y], state=tk.NORMAL)
+            if chars_visible:
+                chars_itemconfigure(chars_text_id[x_y], fill=color)
+                chars_itemconfigure(chars_rect_id[x_y], state=tk.NORMAL)
 
-                elif selected_before > selected_after:
-                    color = palette[x & 1]
-                    cells_canvas.itemconfigure(cells_text_id[x_y], fill=color)
-                    cells_canvas.itemconfigure(cells_rect_id[x_y], state=tk.HIDDEN)
-                    if chars_visible:
-                        chars_canvas.itemconfigure(chars_text_id[x_y], fill=color)
-                        chars_canvas.itemconfigure(chars_rect_id[x_y], state=tk.HIDDEN)
+        for x_y in to_deselect:
+            color = palette[x_y[0] & 1]
+            cells_itemconfigure(cells_text_id[x_y], fill=color)
+            cells_itemconfigure(cells_rect_id[x_y], state=tk.HIDDEN)
+            if chars_visible:
+                chars_itemconfigure(chars_text_id[x_y], fill=color)
+                chars_itemconfigure(chars_rect_id[x_y], state=tk.HIDDEN)
 
         self._cells_selected = cells_selected_after
 
@@ -1603,10 +1903,36 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
             cursor_pixel_x, cursor_pixel_y = self.cell_coords_to_pixel(cursor_cell_x, cursor_cell_y)
             font_w, font_h = self._font_w, self._font_h
             cursor_pixel_x += status.cursor_digit * font_w
-            cells_canvas.itemconfigure(self._cells_cursor_id, fill=self._cells_cursor_color)
-            chars_canvas.itemconfigure(self._chars_cursor_id, fill=self._chars_cursor_color)
 
-            if status.cursor_mode == CursorMode.OVERWRITE:
+            colors = (self._cells_cursor_color, self._chars_cursor_color)
+            if colors != self._cursor_colors_prev:
+                self._cursor_colors_prev = colors
+                cells_canvas.itemconfigure(self._cells_cursor_id, fill=colors[0])
+                chars_canvas.itemconfigure(self._chars_cursor_id, fill=colors[1])
+
+            char_pixel_x = self.char_coords_to_pixel(cursor_cell_x, cursor_cell_y)[0] if chars_visible else None
+            state = (status.cursor_mode, chars_visible,
+                     cursor_pixel_x, cursor_pixel_y, char_pixel_x)
+            state_prev = self._cursor_state_prev
+            if state == state_prev:
+                # Already in place; just restore the stacking order if the
+                # geometry update raised the text items over the cursor
+                if self._cursor_raise_pending:
+                    self._cursor_raise_pending = False
+                    cells_canvas.tag_raise('cursor')
+                    chars_canvas.tag_raise('cursor')
+                return
+
+            self._cursor_state_prev = state
+            if state_prev is not None and state_prev[:2] == state[:2]:
+                # Same shape, new position: translate the existing items
+                # instead of rebuilding their coordinate lists
+                delta_y = cursor_pixel_y - state_prev[3]
+                cells_canvas.move(self._cells_cursor_id, cursor_pixel_x - state_prev[2], delta_y)
+                if chars_visible:
+                    chars_canvas.move(self._chars_cursor_id, char_pixel_x - state_prev[4], delta_y)
+
+            elif status.cursor_mode is CursorMode.OVERWRITE:
                 # Draw a box around the cursor character
                 cells_canvas.coords(self._cells_cursor_id,
                                     cursor_pixel_x - 1, cursor_pixel_y - 1,
@@ -1636,40 +1962,75 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
                                         cursor_pixel_x - 1, cursor_pixel_y - 1,
                                         cursor_pixel_x - 1, cursor_pixel_y + font_h + 1)
 
+            self._cursor_raise_pending = False
             cells_canvas.tag_raise('cursor')
             chars_canvas.tag_raise('cursor')
 
         else:
             # Park to an invisible spot
-            cells_canvas.coords(self._cells_cursor_id, -2, -2, -1, -1)
-            if chars_visible:
-                chars_canvas.coords(self._chars_cursor_id, -2, -2, -1, -1)
+            if self._cursor_state_prev is not None:
+                self._cursor_state_prev = None
+                cells_canvas.coords(self._cells_cursor_id, -2, -2, -1, -1)
+                if chars_visible:
+                    chars_canvas.coords(self._chars_cursor_id, -2, -2, -1, -1)
 
     def redraw(self):
-        for cell_text_id in self._cells_text_id.values():
-            self._cells_canvas.delete(cell_text_id)
-
-        for cell_rect_id in self._cells_rect_id.values():
-            self._cells_canvas.delete(cell_rect_id)
-
-        for char_text_id in self._chars_text_id.values():
-            self._chars_canvas.delete(char_text_id)
-
-        for char_rect_id in self._chars_rect_id.values():
-            self._chars_canvas.delete(char_rect_id)
-
-        for addr_text_id in self._addrs_text_id.values():
-            self._address_canvas.delete(addr_text_id)
+        if not self.is_paintable():
+            self._redraw_deferred = True
+            return
+
+        # Keep the canvas items pooled across full redraws; reconfiguring an
+        # item is much cheaper in Tk than deleting and re-creating it, and
+        # the geometry update already recycles any item left out of the view.
+        # The pool only has to be flushed when the chars column toggles,
+        # because its items exist only while the column is visible
+        if self._chars_visible != bool(self._chars_text_id) and self._cells_text_id:
+            for cell_text_id in self._cells_text_id.values():
+                self._cells_canvas.delete(cell_text_id)
+
+            for cell_rect_id in self._cells_rect_id.values():
+                self._cells_canvas.delete(cell_rect_id)
+
+            for char_text_id in self._chars_text_id.values():
+                self._chars_canvas.delete(char_text_id)
+
+            for char_rect_id in self._chars_rect_id.values():
+                self._chars_canvas.delete(char_rect_id)
+
+            for addr_text_id in self._addrs_text_id.values():
+                self._address_canvas.delete(addr_text_id)
+
+            self._addrs_text_id.clear()
+            self._cells_text_id.clear()
+            self._cells_rect_id.clear()
+            self._cells_dirty.clear()
+            self._cells_pixel.clear()
+            self._cells_selected.clear()
+            self._cells_text_str.clear()
+            self._chars_text_str.clear()
+            self._chars_text_id.clear()
+            self._chars_rect_id.clear()
 
-        self._addrs_text_id.clear()
-        self._cells_text_id.clear()
-        self._cells_rect_id.clear()
-        self._cells_dirty.clear()
-        self._cells_pixel.clear()
-        self._cells_selected.clear()
-        self._cells_text_str.clear()
-        self._chars_text_id.clear()
-        self._chars_rect_id.clear()
+        else:
+            # Invalidate the caches so that every pooled item gets its
+            # coordinates, text, and background reconfigured
+            cells_pixel = self._cells_pixel
+            cells_text_str = self._cells_text_str
+            chars_text_str = self._chars_text_str
+            for x_y in self._cells_text_id:
+                cells_pixel[x_y] = (-1, -1)  # invalidate
+                cells_text_str[x_y] = ''  # invalidate
+                chars_text_str[x_y] = ''  # invalidate
+            self._cells_dirty.update(self._cells_text_id)
+
+            # Kept addresses are only moved by the geometry update, so their
+            # text has to be refreshed here
+            status = self._status
+            address_canvas = self._address_canvas
+            address_format = status.address_format_string
+            for y, addr_text_id in self._addrs_text_id.items():
+                address = status.cell_coords_to_address(0, y)
+                address_canvas.itemconfigure(addr_text_id, text=address_format.format(address))
 
         self.update_view(force_geometry=True, force_selection=True, force_content=True)
         self.update_vbar()
@@ -1744,10 +2105,23 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
         return char_x, char_y
 
     def scroll_up(self, delta_y: int = 1) -> None:
-        self._on_vbar(tk.SCROLL, -delta_y, tk.UNITS)
+        self._scroll_by(-delta_y)
 
     def scroll_down(self, delta_y: int = 1) -> None:
-        self._on_vbar(tk.SCROLL, +delta_y, tk.UNITS)
+        self._scroll_by(+delta_y)
+
+    def _scroll_by(self, delta_y: int) -> None:
+        # Accumulate the requested lines and translate the viewport once per
+        # idle tick, so that a flood of scroll events paints a single frame
+        if not self._scroll_delta_y:
+            self.after_idle(self._flush_scroll)
+        self._scroll_delta_y += delta_y
+
+    def _flush_scroll(self) -> None:
+        delta_y = self._scroll_delta_y
+        self._scroll_delta_y = 0
+        if delta_y:
+            self._on_vbar(tk.SCROLL, delta_y, tk.UNITS)
 
     def scroll_page_up(self) -> None:
         self.scroll_up(self.get_half_page_height())
@@ -1777,7 +2151,9 @@ class EditorWidget(BaseEditorWidget, ttk.Frame):
 
     def scroll_wheel(self, event=None):
         step = -int(event.delta) // self._font_h
-        self._on_vbar(tk.SCROLL, step, tk.UNITS)
+        # Route through the accumulator, so that high-resolution wheels and
+        # trackpads collapse a burst of events into a single scroll frame
+        self._scroll_by(step)
 
     def ask_big_selection(self, size: Address) -> bool:
         answer = tk.messagebox.askquestion(
@@ -1806,17 +2182,42 @@ class UserInterface(BaseUserInterface):
         engine = engine_factory(self)
         self.engine = engine
 
+        self._value_dialog: Optional[ValueDialog] = None
+        self._menus_by_selection_pending: bool = False
+        self._menus_by_cursor_pending: bool = False
+        self._menu_index_cache: MutableMapping[Tuple[str, str], int] = {}
+        self._status_pending: bool = False
+        self._status_texts_prev: Optional[Tuple[str, str, str]] = None
+        self._menu_sel_state_prev: Optional[str] = None
+        self._menu_fill_state_prev: Optional[str] = None
+        self._menu_flood_state_prev: Optional[str] = None
+        self.menu_bar: Optional[tk.Menu] = None
+        self.cells_popup: Optional[tk.Menu] = None
+        self.address_popup: Optional[tk.Menu] = None
+        self.offset_popup: Optional[tk.Menu] = None
+        self.chars_popup: Optional[tk.Menu] = None
+        self.toolbar_tray: Optional[ToolbarTray] = None
+        self.statusbar_frame: Optional[ttk.Frame] = None
+
         self.__init_top()
         self.__init_tkvars()
+        self.__init_editor()
+
+        # Show the window as soon as the editor is usable; the decorations
+        # (menu bar, toolbars, statusbar) are filled in by the event loop
+        # right after the first paint, cutting the perceived startup
+        # latency; the keyboard works from the start, as all the bindings
+        # live on the editor canvases
+        self.top.deiconify()
+        self.top.after_idle(self.__finish_init)
+
+    def __finish_init(self) -> None:
         self.__init_menus()
         self.__init_toolbars()
         self.__init_statusbar()
-        self.__init_editor()
-
         self.update_title_by_file_path()
         self.update_menus_by_selection()
-
-        self.top.deiconify()
+        self.update_status()
 
     def quit(self):
         self.top.destroy()
@@ -1839,53 +2240,48 @@ class UserInterface(BaseUserInterface):
     def _on_delete_window(self):
         self.engine.on_file_exit()
 
+    # Traced editor variables: the entry name gives the '<name>_tkvar'
+    # attribute and the 'on_set_<name>' engine setter; the initializer takes
+    # the engine status and returns the starting value
+    _TKVAR_SPEC = (
+        ('line_length',     tk.IntVar,     (lambda status: status.line_length)),
+        ('chars_visible',   tk.BooleanVar, (lambda status: True)),
+        ('chars_encoding',  tk.StringVar,  (lambda status: 'ascii')),
+
+        ('cell_mode',       tk.IntVar,     (lambda status: int(status.cell_format_mode))),
+        ('cell_prefix',     tk.BooleanVar, (lambda status: status.cell_format_prefix)),
+        ('cell_suffix',     tk.BooleanVar, (lambda status: status.cell_format_suffix)),
+        ('cell_zeroed',     tk.BooleanVar, (lambda status: status.cell_format_zeroed)),
+
+        ('address_mode',    tk.IntVar,     (lambda status: int(status.address_format_mode))),
+        ('address_prefix',  tk.BooleanVar, (lambda status: status.address_format_prefix)),
+        ('address_suffix',  tk.BooleanVar, (lambda status: status.address_format_suffix)),
+        ('address_zeroed',  tk.BooleanVar, (lambda status: status.address_format_zeroed)),
+        ('address_skip',    tk.IntVar,     (lambda status: status.address_skip)),
+        ('address_bits',    tk.IntVar,     (lambda status: status.address_bits)),
+
+        ('offset_mode',     tk.IntVar,     (lambda status: int(status.offset_format_mode))),
+        ('offset_prefix',   tk.BooleanVar, (lambda status: status.offset_format_prefix)),
+        ('offset_suffix',   tk.BooleanVar, (lambda status: status.offset_format_suffix)),
+        ('offset_zeroed',   tk.BooleanVar, (lambda status: status.offset_format_zeroed)),
+    )
+
     def __init_tkvars(self):
         # Editor variables
         status = self.engine.status
         top = self.top
 
-        self.line_length_tkvar = tk.IntVar(top, name='line_length', value=status.line_length)
-        self.chars_visible_tkvar = tk.BooleanVar(top, name='chars_visible', value=True)
-        self.chars_encoding_tkvar = tk.StringVar(top, name='chars_encoding', value='ascii')
-
-        self.cell_mode_tkvar = tk.IntVar(top, name='cell_mode', value=int(status.cell_format_mode))
-        self.cell_prefix_tkvar = tk.BooleanVar(top, name='cell_prefix', value=status.cell_format_prefix)
-        self.cell_suffix_tkvar = tk.BooleanVar(top, name='cell_suffix', value=status.cell_format_suffix)
-        self.cell_zeroed_tkvar = tk.BooleanVar(top, name='cell_zeroed', value=status.cell_format_zeroed)
-
-        self.address_mode_tkvar = tk.IntVar(top, name='address_mode', value=int(status.address_format_mode))
-        self.address_prefix_tkvar = tk.BooleanVar(top, name='address_prefix', value=status.address_format_prefix)
-        self.address_suffix_tkvar = tk.BooleanVar(top, name='address_suffix', value=status.address_format_suffix)
-        self.address_zeroed_tkvar = tk.BooleanVar(top, name='address_zeroed', value=status.address_format_zeroed)
-        self.address_skip_tkvar = tk.IntVar(top, name='address_skip', value=status.address_skip)
-        self.address_bits_tkvar = tk.IntVar(top, name='address_bits', value=status.address_bits)
-
-        self.offset_mode_tkvar = tk.IntVar(top, name='offset_mode', value=int(status.offset_format_mode))
-        self.offset_prefix_tkvar = tk.BooleanVar(top, name='offset_prefix', value=status.offset_format_prefix)
-        self.offset_suffix_tkvar = tk.BooleanVar(top, name='offset_suffix', value=status.offset_format_suffix)
-        self.offset_zeroed_tkvar = tk.BooleanVar(top, name='offset_zeroed', value=status.offset_format_zeroed)
-
-        # Add variable tracing
-        self.line_length_tkvar.trace_add('write', self.on_tkvar_line_length)
-        self.chars_visible_tkvar.trace_add('write', self.on_tkvar_chars_visible)
-        self.chars_encoding_tkvar.trace_add('write', self.on_tkvar_chars_encoding)
-
-        self.cell_mode_tkvar.trace_add('write', self.on_tkvar_cell_mode)
-        self.cell_prefix_tkvar.trace_add('write', self.on_tkvar_cell_prefix)
-        self.cell_suffix_tkvar.trace_add('write', self.on_tkvar_cell_suffix)
-        self.cell_zeroed_tkvar.trace_add('write', self.on_tkvar_cell_zeroed)
-
-        self.address_mode_tkvar.trace_add('write', self.on_tkvar_address_mode)
-        self.address_prefix_tkvar.trace_add('write', self.on_tkvar_address_prefix)
-        self.address_suffix_tkvar.trace_add('write', self.on_tkvar_address_suffix)
-        self.address_zeroed_tkvar.trace_add('write', self.on_tkvar_address_zeroed)
-        self.address_skip_tkvar.trace_add('write', self.on_tkvar_address_skip)
-        self.address_bits_tkvar.trace_add('write', self.on_tkvar_address_bits)
-
-        self.offset_mode_tkvar.trace_add('write', self.on_tkvar_offset_mode)
-        self.offset_prefix_tkvar.trace_add('write', self.on_tkvar_offset_prefix)
-        self.offset_suffix_tkvar.trace_add('write', self.on_tkvar_offset_suffix)
-        self.offset_zeroed_tkvar.trace_add('write', self.on_tkvar_offset_zeroed)
+        # One write trace command serves every editor variable; the variable
+        # name doubles as the engine setter suffix
+        self._tkvar_setters = {name: getattr(self.engine, f'on_set_{name}')
+                               for name, _, _ in self._TKVAR_SPEC}
+        self._tkvar_pending = {}
+        cbname = top.register(self._on_tkvar_write)
+
+        for name, var_factory, initial in self._TKVAR_SPEC:
+            var = var_factory(top, name=name, value=initial(status))
+            top.tk.call('trace', 'add', 'variable', name, 'write', (cbname,))
+            setattr(self, f'{name}_tkvar', var)
 
         # TODO: Find/replace variables
         self.find_text_tkvar = tk.StringVar(top, name='find_text')
@@ -1910,93 +2306,179 @@ class UserInterface(BaseUserInterface):
 
         self.top.configure(menu=menu_bar)
 
-    def __init_menu_file(self):
-        self.menu_file = menu = tk.Menu(self.top, tearoff=False)
-
-        menu.add_command(label='New', underline=0, accelerator='Ctrl+N', command=self.on_file_new,
-                         image=load_image('image/16x16/document_new_thick.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Open', underline=0, accelerator='Ctrl+O', command=self.on_file_open,
-                         image=load_image('image/16x16/fileopen.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Import', underline=0, accelerator='Ctrl+I', command=self.on_file_import,
-                         image=load_image('image/16x16/fileimport.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Save', underline=0, accelerator='Ctrl+S', command=self.on_file_save,
-                         image=load_image('image/16x16/filesave.png'), compound=tk.LEFT)
+    # Command menus shared across windows: label, underline index,
+    # accelerator, 16x16 icon file, handler name, initial state; None
+    # stands for a separator. Built once at class level, so every window
+    # spawned by create_new() consumes the same compiled spec
+    _MENU_FILE_ITEMS = (
+        ('New',      0, 'Ctrl+N',       'document_new_thick.png', 'on_file_new',      tk.NORMAL),
+        ('Open',     0, 'Ctrl+O',       'fileopen.png',           'on_file_open',     tk.NORMAL),
+        ('Import',   0, 'Ctrl+I',       'fileimport.png',         'on_file_import',   tk.NORMAL),
+        ('Save',     0, 'Ctrl+S',       'filesave.png',           'on_file_save',     tk.NORMAL),
+        ('Save As',  0, 'Ctrl+Shift+S', 'filesaveas.png',         'on_file_save_as',  tk.NORMAL),
+        None,
+        ('Settings', 2, 'Ctrl+Shift+T', 'configure.png',          'on_file_settings', tk.DISABLED),
+        None,
+        ('Exit',     1, 'Ctrl+W',       'kill.png',               'on_file_exit',     tk.NORMAL),
+    )
+
+    _MENU_EDIT_ITEMS = (
+        ('Undo',        1, 'Ctrl+Z',  'undo.png',         'on_edit_undo',        tk.DISABLED),
+        ('Redo',        0, 'Ctrl+Y',  'redo.png',         'on_edit_redo',        tk.DISABLED),
+        None,
+        ('Cut',         1, 'Ctrl+X',  'editcut.png',      'on_edit_cut',         tk.NORMAL),
+        ('Copy',        0, 'Ctrl+C',  'editcopy.png',     'on_edit_copy',        tk.NORMAL),
+        ('Paste',       0, 'Ctrl+V',  'editpaste.png',    'on_edit_paste',       tk.NORMAL),
+        None,
+        ('Cursor mode', 7, 'Ins',     'edit.png',         'on_edit_cursor_mode', tk.NORMAL),
+        ('Insert',      0, '+',       'document_new.png', 'on_edit_reserve',     tk.NORMAL),
+        ('Delete',      0, '- (Del)', 'editdelete.png',   'on_edit_delete',      tk.NORMAL),
+        ('Clear',       1, '. (Del)', 'eraser.png',       'on_edit_clear',       tk.NORMAL),
+        ('Fill',        0, '$',       'fill.png',         'on_edit_fill',        tk.NORMAL),
+        ('Flood',       2, '%',       'color_fill.png',   'on_edit_flood',       tk.NORMAL),
+        ('Crop',        0, 'Ctrl+K',  'crop.png',         'on_edit_crop',        tk.NORMAL),
+        ('Move',        0, 'Ctrl+M',  'move.png',         'on_edit_move_focus',  tk.NORMAL),
+        None,
+        ('Select all',   7, 'Ctrl+A', 'select-all.png',   'on_edit_select_all',   tk.NORMAL),
+        ('Select range', 7, 'Ctrl+R', 'select-range.png', 'on_edit_select_range', tk.NORMAL),
+        ('Copy current address', None, 'Alt+Ins', 'copy-address.png', 'on_edit_copy_address', tk.NORMAL),
+    )
+
+    _MENU_NAV_ITEMS = (
+        ('Memory address',   7, 'Ctrl+G',       'goto.png',         'on_nav_goto_memory_address_start_focus',
+         tk.NORMAL),
+        ('Memory start',     7, 'Ctrl+Home',    'top-light.png',    'on_nav_goto_memory_start',  tk.NORMAL),
+        ('Memory end',       7, 'Ctrl+End',     'bottom-light.png', 'on_nav_goto_memory_endin',  tk.NORMAL),
+        ('Memory end-ex',   12, 'Ctrl+Alt+End', None,               'on_nav_goto_memory_endex',  tk.NORMAL),
+        ('Set address skip', 9, None,           'player_fwd.png',   'on_nav_address_skip',       tk.NORMAL),
+        None,
+        ('Previous block', 6, 'Alt+Left',  'arrow-left.png',      'on_nav_goto_block_previous', tk.NORMAL),
+        ('Next block',     7, 'Alt+Right', 'arrow-right.png',     'on_nav_goto_block_next',     tk.NORMAL),
+        ('Block start',    6, 'Alt+Home',  'arrow-up-dash.png',   'on_nav_goto_block_start',    tk.NORMAL),
+        ('Block end',      7, 'Alt+End',   'arrow-down-dash.png', 'on_nav_goto_block_endin',    tk.NORMAL),
+        None,
+        ('Previous byte', 6, 'Ctrl+Left',  'back-light.png',   'on_nav_goto_byte_previous', tk.NORMAL),
+        ('Next byte',     6, 'Ctrl+Right', 'next-light.png',   'on_nav_goto_byte_next',     tk.NORMAL),
+        ('Line start',    6, 'Home',       'start-light.png',  'on_nav_goto_line_start',    tk.NORMAL),
+        ('Line end',      7, 'End',        'finish-light.png', 'on_nav_goto_line_endin',    tk.NORMAL),
+        None,
+        ('Scroll up',            7, 'Ctrl+Up',        '1uparrow.png',   'on_nav_scroll_line_up',   tk.NORMAL),
+        ('Scroll down',          7, 'Ctrl+Down',      '1downarrow.png', 'on_nav_scroll_line_down', tk.NORMAL),
+        ('Scroll half-page up',  18, 'Ctrl+PgUp',     '2uparrow.png',   'on_nav_scroll_page_up',   tk.NORMAL),
+        ('Scroll half-page down', 19, 'Ctrl+PgDn',    '2downarrow.png', 'on_nav_scroll_page_down', tk.NORMAL),
+        ('Scroll align top',     8, 'Ctrl+Alt+PgUp',  'top.png',        'on_nav_scroll_top',       tk.NORMAL),
+        ('Scroll align bottom',  7, 'Ctrl+Alt+PgDn',  'bottom.png',     'on_nav_scroll_bottom',    tk.NORMAL),
+    )
+
+    _MENU_HELP_ITEMS = (
+        ('About', 0, None, 'info.png', 'on_help_about', tk.NORMAL),
+    )
+
+    # Editing entries shared verbatim by the cells and chars popups
+    _POPUP_EDIT_ITEMS = (
+        ('Cut',    1, None, 'editcut.png',      'on_edit_cut',        tk.NORMAL),
+        ('Copy',   0, None, 'editcopy.png',     'on_edit_copy',       tk.NORMAL),
+        ('Paste',  0, None, 'editpaste.png',    'on_edit_paste',      tk.NORMAL),
+        None,
+        ('Insert', 0, None, 'document_new.png', 'on_edit_reserve',    tk.NORMAL),
+        ('Delete', 0, None, 'editdelete.png',   'on_edit_delete',     tk.NORMAL),
+        ('Clear',  1, None, 'eraser.png',       'on_edit_clear',      tk.NORMAL),
+        ('Fill',   0, None, 'fill.png',         'on_edit_fill',       tk.NORMAL),
+        ('Flood',  2, None, 'color_fill.png',   'on_edit_flood',      tk.NORMAL),
+        ('Crop',   0, None, 'crop.png',         'on_edit_crop',       tk.NORMAL),
+        ('Move',   0, None, 'move.png',         'on_edit_move_focus', tk.NORMAL),
+        None,
+        ('Export', 0, None, 'fileexport.png',   'on_edit_export',     tk.NORMAL),
+    )
+
+    def _fill_command_menu(self, menu: tk.Menu, items) -> None:
+        add_command = menu.add_command
+        getattr_self = functools.partial(getattr, self)
+
+        for item in items:
+            if item is None:
+                menu.add_separator()
+                continue
+            label, underline, accel, icon, handler, state = item
+            kwargs = dict(label=label, command=getattr_self(handler))
+            if underline is not None:
+                kwargs['underline'] = underline
+            if accel is not None:
+                kwargs['accelerator'] = accel
+            if icon is not None:
+                kwargs['image'] = _menu_image(f'image/16x16/{icon}')
+                kwargs['compound'] = tk.LEFT
+            if state is not tk.NORMAL:
+                kwargs['state'] = state
+            add_command(**kwargs)
+
+    def _build_command_menu(self, items) -> tk.Menu:
+        menu = tk.Menu(self.top, tearoff=False)
+        self._fill_command_menu(menu, items)
+        return menu
 
-        menu.add_command(label='Save As', underline=0, accelerator='Ctrl+Shift+S', command=self.on_file_save_as,
-                         image=load_image('image/16x16/filesaveas.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Settings', underline=2, accelerator='Ctrl+Shift+T', state=tk.DISABLED,
-                         command=self.on_file_settings,
-                         image=load_image('image/16x16/configure.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Exit', underline=1, accelerator='Ctrl+W', command=self.on_file_exit,
-                         image=load_image('image/16x16/kill.png'), compound=tk.LEFT)
+    def __init_menu_file(self):
+        self.menu_file = self._build_command_menu(self._MENU_FILE_ITEMS)
 
     def __init_menu_edit(self):
-        self.menu_edit = menu = tk.Menu(self.top, tearoff=False)
-
-        menu.add_command(label='Undo', underline=1, accelerator='Ctrl+Z', state=tk.DISABLED, command=self.on_edit_undo,
-                         image=load_image('image/16x16/undo.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Redo', underline=0, accelerator='Ctrl+Y', state=tk.DISABLED, command=self.on_edit_redo,
-                         image=load_image('image/16x16/redo.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Cut', underline=1, accelerator='Ctrl+X', command=self.on_edit_cut,
-                         image=load_image('image/16x16/editcut.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Copy', underline=0, accelerator='Ctrl+C', command=self.on_edit_copy,
-                         image=load_image('image/16x16/editcopy.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Paste', underline=0, accelerator='Ctrl+V', command=self.on_edit_paste,
-                         image=load_image('image/16x16/editpaste.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Cursor mode', underline=7, accelerator='Ins', command=self.on_edit_cursor_mode,
-                         image=load_image('image/16x16/edit.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Insert', underline=0, accelerator='+', command=self.on_edit_reserve,
-                         image=load_image('image/16x16/document_new.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Delete', underline=0, accelerator='- (Del)', command=self.on_edit_delete,
-                         image=load_image('image/16x16/editdelete.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Clear', underline=1, accelerator='. (Del)', command=self.on_edit_clear,
-                         image=load_image('image/16x16/eraser.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Fill', underline=0, accelerator='$', command=self.on_edit_fill,
-                         image=load_image('image/16x16/fill.png'), compound=tk.LEFT)
+        self.menu_edit = self._build_command_menu(self._MENU_EDIT_ITEMS)
+
+    # Shared number format submenu layout: label, format value, icon file,
+    # accelerator (only shown when requested), underline index
+    _FORMAT_ITEMS = (
+        ('Hex UPPER', int(ValueFormatEnum.HEXADECIMAL_UPPER), 'char-hex-upper.png', 'Ctrl+Alt+H',       0),
+        ('Hex lower', int(ValueFormatEnum.HEXADECIMAL_LOWER), 'char-hex-lower.png', 'Ctrl+Alt+Shift+H', 12),
+        ('Decimal',   int(ValueFormatEnum.DECIMAL),           'char-decimal.png',   'Ctrl+Alt+D',       0),
+        ('Octal',     int(ValueFormatEnum.OCTAL),             'char-octal.png',     'Ctrl+Alt+O',       0),
+        ('Binary',    int(ValueFormatEnum.BINARY),            'char-binary.png',    'Ctrl+Alt+B',       0),
+    )
+
+    @staticmethod
+    def _defer_menu_fill(menu: tk.Menu, fill: Callable[[], None]) -> None:
+        # Populate the submenu on its first posting only, then disarm; the
+        # entries are bound to tkvars, so they reflect the current state
+        # whenever they happen to be built
+
+        def postcommand():
+            menu.configure(postcommand='')
+            fill()
+
+        menu.configure(postcommand=postcommand)
+
+    def _build_format_menu(
+        self,
+        parent: tk.Menu,
+        mode_tkvar: tk.IntVar,
+        prefix_tkvar: tk.BooleanVar,
+        suffix_tkvar: tk.BooleanVar,
+        zeroed_tkvar: tk.BooleanVar,
+        with_accel: bool = False,
+    ) -> tk.Menu:
+        menu = tk.Menu(parent, tearoff=False)
 
-        menu.add_command(label='Flood', underline=2, accelerator='%', command=self.on_edit_flood,
-                         image=load_image('image/16x16/color_fill.png'), compound=tk.LEFT)
+        def fill():
+            add_radiobutton = menu.add_radiobutton
+            compound = tk.LEFT
 
-        menu.add_command(label='Crop', underline=0, accelerator='Ctrl+K', command=self.on_edit_crop,
-                         image=load_image('image/16x16/crop.png'), compound=tk.LEFT)
+            for label, value, icon, accel, underline in self._FORMAT_ITEMS:
+                add_radiobutton(label=label, underline=underline,
+                                accelerator=(accel if with_accel else ''),
+                                variable=mode_tkvar, value=value,
+                                image=_menu_image(f'image/16x16/{icon}'), compound=compound)
 
-        menu.add_command(label='Move', underline=0, accelerator='Ctrl+M',
-                         command=self.on_edit_move_focus,
-                         image=load_image('image/16x16/move.png'), compound=tk.LEFT)
+            menu.add_separator()
 
-        menu.add_separator()
+            menu.add_checkbutton(label='Prefix', underline=0,
+                                 variable=prefix_tkvar, offvalue=False, onvalue=True)
 
-        menu.add_command(label='Select all', underline=7, accelerator='Ctrl+A', command=self.on_edit_select_all,
-                         image=load_image('image/16x16/select-all.png'), compound=tk.LEFT)
+            menu.add_checkbutton(label='Suffix', underline=0,
+                                 variable=suffix_tkvar, offvalue=False, onvalue=True)
 
-        menu.add_command(label='Select range', underline=7, accelerator='Ctrl+R',
-                         command=self.on_edit_select_range,
-                         image=load_image('image/16x16/select-range.png'), compound=tk.LEFT)
+            menu.add_checkbutton(label='Leading zeros', underline=8,
+                                 variable=zeroed_tkvar, offvalue=False, onvalue=True)
 
-        menu.add_command(label='Copy current address', accelerator='Alt+Ins', command=self.on_edit_copy_address,
-                         image=load_image('image/16x16/copy-address.png'), compound=tk.LEFT)
+        self._defer_menu_fill(menu, fill)
+        return menu
 
     def __init_menu_view(self):
         self.menu_view = menu = tk.Menu(self.top, tearoff=False)
@@ -2005,8 +2487,8 @@ class UserInterface(BaseUserInterface):
         line = tk.Menu(menu, tearoff=False)
         self.menu_line = line
 
-        for value in LINE_LENGTHS:
-            line.add_radiobutton(label=f'{value:3d}', variable=self.line_length_tkvar, value=value)
+        _add_radiobuttons(line, self.line_length_tkvar,
+                          ((label, value, False) for label, value in _LINE_LENGTH_ITEMS))
 
         line.add_separator()
 
@@ -2014,10 +2496,10 @@ class UserInterface(BaseUserInterface):
 
         # Address bits submenu
         bits = tk.Menu(menu, tearoff=False)
-        self.menu_line = bits
+        self.menu_bits = bits
 
-        for value in ADDRESS_BITS:
-            bits.add_radiobutton(label=f'{value:3d}', variable=self.address_bits_tkvar, value=value)
+        _add_radiobuttons(bits, self.address_bits_tkvar,
+                          ((label, value, False) for label, value in _ADDRESS_BITS_ITEMS))
 
         bits.add_separator()
 
@@ -2027,132 +2509,44 @@ class UserInterface(BaseUserInterface):
         encm = tk.Menu(menu, tearoff=False)
         self.menu_encoding = encm
 
-        for i, encoding in enumerate(BYTE_ENCODINGS):
-            encm.add_radiobutton(label=encoding, variable=self.chars_encoding_tkvar, value=encoding,
-                                 columnbreak=(i and not i % 16))
+        def fill_encoding():
+            _add_radiobuttons(encm, self.chars_encoding_tkvar,
+                              ((encoding, encoding, cbrk) for encoding, cbrk in _ENCODING_ITEMS))
+
+        self._defer_menu_fill(encm, fill_encoding)
 
         # Cell submenu
-        cell = tk.Menu(menu, tearoff=False)
+        cell = self._build_format_menu(menu, self.cell_mode_tkvar, self.cell_prefix_tkvar,
+                                       self.cell_suffix_tkvar, self.cell_zeroed_tkvar, with_accel=True)
         self._cell = cell
 
-        cell.add_radiobutton(label='Hex UPPER', underline=0, accelerator='Ctrl+Alt+H',
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_UPPER),
-                             image=load_image('image/16x16/char-hex-upper.png'), compound=tk.LEFT)
-
-        cell.add_radiobutton(label='Hex lower', underline=12, accelerator='Ctrl+Alt+Shift+H',
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_LOWER),
-                             image=load_image('image/16x16/char-hex-lower.png'), compound=tk.LEFT)
-
-        cell.add_radiobutton(label='Decimal', underline=0, accelerator='Ctrl+Alt+D',
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.DECIMAL),
-                             image=load_image('image/16x16/char-decimal.png'), compound=tk.LEFT)
-
-        cell.add_radiobutton(label='Octal', underline=0, accelerator='Ctrl+Alt+O',
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.OCTAL),
-                             image=load_image('image/16x16/char-octal.png'), compound=tk.LEFT)
-
-        cell.add_radiobutton(label='Binary', underline=0, accelerator='Ctrl+Alt+B',
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.BINARY),
-                             image=load_image('image/16x16/char-binary.png'), compound=tk.LEFT)
-
-        cell.add_separator()
-
-        cell.add_checkbutton(label='Prefix', underline=0,
-                             variable=self.cell_prefix_tkvar, offvalue=False, onvalue=True)
-
-        cell.add_checkbutton(label='Suffix', underline=0,
-                             variable=self.cell_suffix_tkvar, offvalue=False, onvalue=True)
-
-        cell.add_checkbutton(label='Leading zeros', underline=8,
-                             variable=self.cell_zeroed_tkvar, offvalue=False, onvalue=True)
-
         # Address submenu
-        address = tk.Menu(menu, tearoff=False)
+        address = self._build_format_menu(menu, self.address_mode_tkvar, self.address_prefix_tkvar,
+                                          self.address_suffix_tkvar, self.address_zeroed_tkvar)
         self._address = address
 
-        address.add_radiobutton(label='Hex UPPER', underline=0,
-                                variable=self.address_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_UPPER),
-                                image=load_image('image/16x16/char-hex-upper.png'), compound=tk.LEFT)
-
-        address.add_radiobutton(label='Hex lower', underline=12,
-                                variable=self.address_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_LOWER),
-                                image=load_image('image/16x16/char-hex-lower.png'), compound=tk.LEFT)
-
-        address.add_radiobutton(label='Decimal', underline=0,
-                                variable=self.address_mode_tkvar, value=int(ValueFormatEnum.DECIMAL),
-                                image=load_image('image/16x16/char-decimal.png'), compound=tk.LEFT)
-
-        address.add_radiobutton(label='Octal', underline=0,
-                                variable=self.address_mode_tkvar, value=int(ValueFormatEnum.OCTAL),
-                                image=load_image('image/16x16/char-octal.png'), compound=tk.LEFT)
-
-        address.add_radiobutton(label='Binary', underline=0,
-                                variable=self.address_mode_tkvar, value=int(ValueFormatEnum.BINARY),
-                                image=load_image('image/16x16/char-binary.png'), compound=tk.LEFT)
-
-        address.add_separator()
-
-        address.add_checkbutton(label='Prefix', underline=0,
-                                variable=self.address_prefix_tkvar, offvalue=False, onvalue=True)
-
-        address.add_checkbutton(label='Suffix', underline=0,
-                                variable=self.address_suffix_tkvar, offvalue=False, onvalue=True)
-
-        address.add_checkbutton(label='Leading zeros', underline=8,
-                                variable=self.address_zeroed_tkvar, offvalue=False, onvalue=True)
-
         # Offset submenu
-        offset = tk.Menu(menu, tearoff=False)
+        offset = self._build_format_menu(menu, self.offset_mode_tkvar, self.offset_prefix_tkvar,
+                                         self.offset_suffix_tkvar, self.offset_zeroed_tkvar)
         self._offset = offset
 
-        offset.add_radiobutton(label='Hex UPPER', underline=0,
-                               variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_UPPER),
-                               image=load_image('image/16x16/char-hex-upper.png'), compound=tk.LEFT)
-
-        offset.add_radiobutton(label='Hex lower', underline=12,
-                               variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_LOWER),
-                               image=load_image('image/16x16/char-hex-lower.png'), compound=tk.LEFT)
-
-        offset.add_radiobutton(label='Decimal', underline=0,
-                               variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.DECIMAL),
-                               image=load_image('image/16x16/char-decimal.png'), compound=tk.LEFT)
-
-        offset.add_radiobutton(label='Octal', underline=0,
-                               variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.OCTAL),
-                               image=load_image('image/16x16/char-octal.png'), compound=tk.LEFT)
-
-        offset.add_radiobutton(label='Binary', underline=0,
-                               variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.BINARY),
-                               image=load_image('image/16x16/char-binary.png'), compound=tk.LEFT)
-
-        offset.add_separator()
-
-        offset.add_checkbutton(label='Prefix', underline=0,
-                               variable=self.offset_prefix_tkvar, offvalue=False, onvalue=True)
-
-        offset.add_checkbutton(label='Suffix', underline=0,
-                               variable=self.offset_suffix_tkvar, offvalue=False, onvalue=True)
-
-        offset.add_checkbutton(label='Leading zeros', underline=8,
-                               variable=self.offset_zeroed_tkvar, offvalue=False, onvalue=True)
-
         # Menu
         menu.add_cascade(label='Line length', underline=0, menu=line,
-                         image=load_image('image/16x16/text_left.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/text_left.png'), compound=tk.LEFT)
 
         menu.add_cascade(label='Address bits', underline=8, menu=bits,
-                         image=load_image('image/16x16/memory.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
         menu.add_cascade(label='Cell format', underline=0, menu=cell,
-                         image=load_image('image/16x16/memory-cell.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory-cell.png'), compound=tk.LEFT)
 
         menu.add_cascade(label='Address format', underline=0, menu=address,
-                         image=load_image('image/16x16/memory-address.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory-address.png'), compound=tk.LEFT)
 
         menu.add_cascade(label='Offset format', underline=0, menu=offset,
-                         image=load_image('image/16x16/memory-offset.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory-offset.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
@@ -2160,101 +2554,18 @@ class UserInterface(BaseUserInterface):
                              variable=self.chars_visible_tkvar, offvalue=False, onvalue=True)
 
         menu.add_cascade(label='Encoding', underline=0, menu=encm,
-                         image=load_image('image/16x16/fonts.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/fonts.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
         menu.add_command(label='Redraw', underline=0, accelerator='F5', command=self.on_view_redraw,
-                         image=load_image('image/16x16/hotsync.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/hotsync.png'), compound=tk.LEFT)
 
     def __init_menu_navigation(self):
-        self.menu_nav = menu = tk.Menu(self.top, tearoff=False)
-
-        menu.add_command(label='Memory address', underline=7, accelerator='Ctrl+G',
-                         command=self.on_nav_goto_memory_address_start_focus,
-                         image=load_image('image/16x16/goto.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Memory start', underline=7, accelerator='Ctrl+Home',
-                         command=self.on_nav_goto_memory_start,
-                         image=load_image('image/16x16/top-light.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Memory end', underline=7, accelerator='Ctrl+End',
-                         command=self.on_nav_goto_memory_endin,
-                         image=load_image('image/16x16/bottom-light.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Memory end-ex', underline=12, accelerator='Ctrl+Alt+End',
-                         command=self.on_nav_goto_memory_endex)
-
-        menu.add_command(label='Set address skip', underline=9, command=self.on_nav_address_skip,
-                         image=load_image('image/16x16/player_fwd.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Previous block', underline=6, accelerator='Alt+Left',
-                         command=self.on_nav_goto_block_previous,
-                         image=load_image('image/16x16/arrow-left.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Next block', underline=7, accelerator='Alt+Right',
-                         command=self.on_nav_goto_block_next,
-                         image=load_image('image/16x16/arrow-right.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Block start', underline=6, accelerator='Alt+Home',
-                         command=self.on_nav_goto_block_start,
-                         image=load_image('image/16x16/arrow-up-dash.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Block end', underline=7, accelerator='Alt+End',
-                         command=self.on_nav_goto_block_endin,
-                         image=load_image('image/16x16/arrow-down-dash.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Previous byte', underline=6, accelerator='Ctrl+Left',
-                         command=self.on_nav_goto_byte_previous,
-                         image=load_image('image/16x16/back-light.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Next byte', underline=6, accelerator='Ctrl+Right',
-                         command=self.on_nav_goto_byte_next,
-                         image=load_image('image/16x16/next-light.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Line start', underline=6, accelerator='Home',
-                         command=self.on_nav_goto_line_start,
-                         image=load_image('image/16x16/start-light.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Line end', underline=7, accelerator='End',
-                         command=self.on_nav_goto_line_endin,
-                         image=load_image('image/16x16/finish-light.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Scroll up', underline=7, accelerator='Ctrl+Up',
-                         command=self.on_nav_scroll_line_up,
-                         image=load_image('image/16x16/1uparrow.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Scroll down', underline=7, accelerator='Ctrl+Down',
-                         command=self.on_nav_scroll_line_down,
-                         image=load_image('image/16x16/1downarrow.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Scroll half-page up', underline=18, accelerator='Ctrl+PgUp',
-                         command=self.on_nav_scroll_page_up,
-                         image=load_image('image/16x16/2uparrow.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Scroll half-page down', underline=19, accelerator='Ctrl+PgDn',
-                         command=self.on_nav_scroll_page_down,
-                         image=load_image('image/16x16/2downarrow.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Scroll align top', underline=8, accelerator='Ctrl+Alt+PgUp',
-                         command=self.on_nav_scroll_top,
-                         image=load_image('image/16x16/top.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Scroll align bottom', underline=7, accelerator='Ctrl+Alt+PgDn',
-                         command=self.on_nav_scroll_bottom,
-                         image=load_image('image/16x16/bottom.png'), compound=tk.LEFT)
+        self.menu_nav = self._build_command_menu(self._MENU_NAV_ITEMS)
 
     def __init_menu_help(self):
-        self.menu_help = menu = tk.Menu(self.top, tearoff=False)
-
-        menu.add_command(label='About', underline=0, command=self.on_help_about,
-                         image=load_image('image/16x16/info.png'), compound=tk.LEFT)
+        self.menu_help = self._build_command_menu(self._MENU_HELP_ITEMS)
 
     def __init_toolbars(self):
         toolbar_tray = ToolbarTray(self.top, padding=(0, 0), borderwidth=1, relief=tk.SUNKEN)
@@ -2270,78 +2581,71 @@ class UserInterface(BaseUserInterface):
         toolbar_tray.add_widget(self.toolbar_address)
         toolbar_tray.add_widget(self.toolbar_blocks)
 
-        toolbar_tray.pack(side=tk.TOP, expand=False, fill=tk.X, anchor=tk.N)
-
-    def __init_toolbar_file(self):
-        self.toolbar_file = toolbar = Toolbar(self.toolbar_tray)
-
-        toolbar.add_button(tooltip='New', image=load_image('image/22x22/filenew.png'),
-                           command=self.on_file_new)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Open', image=load_image('image/22x22/fileopen.png'),
-                           command=self.on_file_open)
-
-        toolbar.add_button(tooltip='Import', image=load_image('image/22x22/fileimport.png'),
-                           command=self.on_file_import)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Save', image=load_image('image/22x22/filesave.png'),
-                           command=self.on_file_save)
-
-        toolbar.add_button(tooltip='Save As', image=load_image('image/22x22/filesaveas.png'),
-                           command=self.on_file_save_as)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Settings', image=load_image('image/22x22/configure.png'),
-                           command=self.on_file_settings, state=tk.DISABLED)
+        # Deferred construction: slot the tray above the already-packed editor
+        toolbar_tray.pack(side=tk.TOP, expand=False, fill=tk.X, anchor=tk.N, before=self.editor)
+
+    # Toolbar buttons: tooltip, 22x22 icon file, handler name, initial
+    # state; None stands for a separator
+    _TOOLBAR_FILE_ITEMS = (
+        ('New',     'filenew.png',    'on_file_new',      tk.NORMAL),
+        None,
+        ('Open',    'fileopen.png',   'on_file_open',     tk.NORMAL),
+        ('Import',  'fileimport.png', 'on_file_import',   tk.NORMAL),
+        None,
+        ('Save',    'filesave.png',   'on_file_save',     tk.NORMAL),
+        ('Save As', 'filesaveas.png', 'on_file_save_as',  tk.NORMAL),
+        None,
+        ('Settings', 'configure.png', 'on_file_settings', tk.DISABLED),
+    )
+
+    _TOOLBAR_EDIT_ITEMS = (
+        ('Cut',    'editcut.png',      'on_edit_cut',     tk.NORMAL),
+        ('Copy',   'editcopy.png',     'on_edit_copy',    tk.NORMAL),
+        ('Paste',  'editpaste.png',    'on_edit_paste',   tk.NORMAL),
+        None,
+        ('Insert', 'document_new.png', 'on_edit_reserve', tk.NORMAL),
+        ('Delete', 'editdelete.png',   'on_edit_delete',  tk.NORMAL),
+        ('Clear',  'eraser.png',       'on_edit_clear',   tk.NORMAL),
+        ('Fill',   'fill.png',         'on_edit_fill',    tk.NORMAL),
+        ('Flood',  'color_fill.png',   'on_edit_flood',   tk.NORMAL),
+        ('Crop',   'crop.png',         'on_edit_crop',    tk.NORMAL),
+        None,
+        ('Undo',   'undo_dark.png',    'on_edit_undo',    tk.DISABLED),
+        ('Redo',   'redo_dark.png',    'on_edit_redo',    tk.DISABLED),
+    )
+
+    _TOOLBAR_BLOCKS_ITEMS = (
+        ('Memory start',   'top.png',             'on_nav_goto_memory_start',   tk.NORMAL),
+        ('Memory end',     'bottom.png',          'on_nav_goto_memory_endin',   tk.NORMAL),
+        None,
+        ('Previous block', 'arrow-left.png',      'on_nav_goto_block_previous', tk.NORMAL),
+        ('Next block',     'arrow-right.png',     'on_nav_goto_block_next',     tk.NORMAL),
+        None,
+        ('Block start',    'arrow-up-dash.png',   'on_nav_goto_block_start',    tk.NORMAL),
+        ('Block end',      'arrow-down-dash.png', 'on_nav_goto_block_endin',    tk.NORMAL),
+    )
+
+    def _build_toolbar(self, items) -> Toolbar:
+        toolbar = Toolbar(self.toolbar_tray)
+        add_button = toolbar.add_button
+        getattr_self = functools.partial(getattr, self)
+
+        for item in items:
+            if item is None:
+                toolbar.add_separator()
+            else:
+                tooltip, icon, handler, state = item
+                add_button(tooltip=tooltip, image=load_image(f'image/22x22/{icon}'),
+                           command=getattr_self(handler), state=state)
 
         toolbar.finalize()
+        return toolbar
 
-    def __init_toolbar_edit(self):
-        self.toolbar_edit = toolbar = Toolbar(self.toolbar_tray)
-
-        toolbar.add_button(tooltip='Cut', image=load_image('image/22x22/editcut.png'),
-                           command=self.on_edit_cut)
-
-        toolbar.add_button(tooltip='Copy',  image=load_image('image/22x22/editcopy.png'),
-                           command=self.on_edit_copy)
-
-        toolbar.add_button(tooltip='Paste', image=load_image('image/22x22/editpaste.png'),
-                           command=self.on_edit_paste)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Insert', image=load_image('image/22x22/document_new.png'),
-                           command=self.on_edit_reserve)
-
-        toolbar.add_button(tooltip='Delete', image=load_image('image/22x22/editdelete.png'),
-                           command=self.on_edit_delete)
-
-        toolbar.add_button(tooltip='Clear', image=load_image('image/22x22/eraser.png'),
-                           command=self.on_edit_clear)
-
-        toolbar.add_button(tooltip='Fill', image=load_image('image/22x22/fill.png'),
-                           command=self.on_edit_fill)
-
-        toolbar.add_button(tooltip='Flood', image=load_image('image/22x22/color_fill.png'),
-                           command=self.on_edit_flood)
-
-        toolbar.add_button(tooltip='Crop', image=load_image('image/22x22/crop.png'),
-                           command=self.on_edit_crop)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Undo', image=load_image('image/22x22/undo_dark.png'), state=tk.DISABLED,
-                           command=self.on_edit_undo)
-
-        toolbar.add_button(tooltip='Redo', image=load_image('image/22x22/redo_dark.png'), state=tk.DISABLED,
-                           command=self.on_edit_redo)
+    def __init_toolbar_file(self):
+        self.toolbar_file = self._build_toolbar(self._TOOLBAR_FILE_ITEMS)
 
-        toolbar.finalize()
+    def __init_toolbar_edit(self):
+        self.toolbar_edit = self._build_toolbar(self._TOOLBAR_EDIT_ITEMS)
 
     def __init_toolbar_address(self):
         self.toolbar_address = toolbar = Toolbar(self.toolbar_tray)
@@ -2371,31 +2675,7 @@ class UserInterface(BaseUserInterface):
         toolbar.finalize()
 
     def __init_toolbar_blocks(self):
-        self.toolbar_blocks = toolbar = Toolbar(self.toolbar_tray)
-
-        toolbar.add_button(tooltip='Memory start', image=load_image('image/22x22/top.png'),
-                           command=self.on_nav_goto_memory_start)
-
-        toolbar.add_button(tooltip='Memory end', image=load_image('image/22x22/bottom.png'),
-                           command=self.on_nav_goto_memory_endin)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Previous block', image=load_image('image/22x22/arrow-left.png'),
-                           command=self.on_nav_goto_block_previous)
-
-        toolbar.add_button(tooltip='Next block', image=load_image('image/22x22/arrow-right.png'),
-                           command=self.on_nav_goto_block_next)
-
-        toolbar.add_separator()
-
-        toolbar.add_button(tooltip='Block start', image=load_image('image/22x22/arrow-up-dash.png'),
-                           command=self.on_nav_goto_block_start)
-
-        toolbar.add_button(tooltip='Block end', image=load_image('image/22x22/arrow-down-dash.png'),
-                           command=self.on_nav_goto_block_endin)
-
-        toolbar.finalize()
+        self.toolbar_blocks = self._build_toolbar(self._TOOLBAR_BLOCKS_ITEMS)
 
     def __init_statusbar(self):
         self.statusbar_frame = sb_frame = ttk.Frame(self.top)
@@ -2419,96 +2699,37 @@ class UserInterface(BaseUserInterface):
         self.editor = editor = EditorWidget(self.top, engine, engine.status)
         editor.pack(side=tk.TOP, expand=True, fill=tk.BOTH)
 
-        self.__init_popup_cell()
-        self.__init_popup_address()
-        self.__init_popup_offset()
-        self.__init_popup_chars()
+        # The popup menus are built on the first right-click on their canvas
+        editor.cells_canvas.bind('<Button-3>', self._on_popup_cell)
+        editor.address_canvas.bind('<Button-3>', self._on_popup_address)
+        editor.offset_canvas.bind('<Button-3>', self._on_popup_offset)
+        editor.chars_canvas.bind('<Button-3>', self._on_popup_chars)
 
     def __init_popup_cell(self):
         menu = tk.Menu(tearoff=False)
         self.cells_popup = menu
 
         # View submenu
-        view = tk.Menu(menu, tearoff=False)
+        view = self._build_format_menu(menu, self.cell_mode_tkvar, self.cell_prefix_tkvar,
+                                       self.cell_suffix_tkvar, self.cell_zeroed_tkvar)
         self.cells_popup_view = view
 
-        view.add_radiobutton(label='Hex UPPER', underline=0,
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_UPPER),
-                             image=load_image('image/16x16/char-hex-upper.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Hex lower', underline=12,
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_LOWER),
-                             image=load_image('image/16x16/char-hex-lower.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Decimal', underline=0,
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.DECIMAL),
-                             image=load_image('image/16x16/char-decimal.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Octal', underline=0,
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.OCTAL),
-                             image=load_image('image/16x16/char-octal.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Binary', underline=0,
-                             variable=self.cell_mode_tkvar, value=int(ValueFormatEnum.BINARY),
-                             image=load_image('image/16x16/char-binary.png'), compound=tk.LEFT)
-
-        view.add_separator()
-
-        view.add_checkbutton(label='Prefix', underline=0,
-                             variable=self.cell_prefix_tkvar, offvalue=False, onvalue=True)
-
-        view.add_checkbutton(label='Suffix', underline=0,
-                             variable=self.cell_suffix_tkvar, offvalue=False, onvalue=True)
-
-        view.add_checkbutton(label='Leading zeros', underline=8,
-                             variable=self.cell_zeroed_tkvar, offvalue=False, onvalue=True)
-
         # Menu
         menu.add_cascade(label='Cell format', underline=0, menu=view,
-                         image=load_image('image/16x16/memory-cell.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory-cell.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
-        menu.add_command(label='Cut', underline=1, command=self.on_edit_cut,
-                         image=load_image('image/16x16/editcut.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Copy', underline=0, command=self.on_edit_copy,
-                         image=load_image('image/16x16/editcopy.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Paste', underline=0, command=self.on_edit_paste,
-                         image=load_image('image/16x16/editpaste.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Insert', underline=0, command=self.on_edit_reserve,
-                         image=load_image('image/16x16/document_new.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Delete', underline=0, command=self.on_edit_delete,
-                         image=load_image('image/16x16/editdelete.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Clear', underline=1, command=self.on_edit_clear,
-                         image=load_image('image/16x16/eraser.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Fill', underline=0, command=self.on_edit_fill,
-                         image=load_image('image/16x16/fill.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Flood', underline=2, command=self.on_edit_flood,
-                         image=load_image('image/16x16/color_fill.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Crop', underline=0, command=self.on_edit_crop,
-                         image=load_image('image/16x16/crop.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Move', underline=0, command=self.on_edit_move_focus,
-                         image=load_image('image/16x16/move.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Export', underline=0, command=self.on_edit_export,
-                         image=load_image('image/16x16/fileexport.png'), compound=tk.LEFT)
-
-        self.editor.cells_canvas.bind('<Button-3>', self._on_popup_cell)
+        self._fill_command_menu(menu, self._POPUP_EDIT_ITEMS)
 
     def _on_popup_cell(self, event):
+        if self.cells_popup is None:
+            self.__init_popup_cell()
+            # Invalidate the state caches, so the fresh menu gets stamped
+            self._menu_sel_state_prev = None
+            self._menu_fill_state_prev = None
+            self._menu_flood_state_prev = None
+            self._do_update_menus_by_selection()
         try:
             self.cells_popup.tk_popup(event.x_root, event.y_root)
         finally:
@@ -2521,46 +2742,16 @@ class UserInterface(BaseUserInterface):
         self.address_popup = menu
 
         # View submenu
-        view = tk.Menu(menu, tearoff=False)
+        view = self._build_format_menu(menu, self.address_mode_tkvar, self.address_prefix_tkvar,
+                                       self.address_suffix_tkvar, self.address_zeroed_tkvar)
         self.address_popup_view = view
 
-        view.add_radiobutton(label='Hex UPPER', underline=0,
-                             variable=self.address_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_UPPER),
-                             image=load_image('image/16x16/char-hex-upper.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Hex lower', underline=12,
-                             variable=self.address_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_LOWER),
-                             image=load_image('image/16x16/char-hex-lower.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Decimal', underline=0,
-                             variable=self.address_mode_tkvar, value=int(ValueFormatEnum.DECIMAL),
-                             image=load_image('image/16x16/char-decimal.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Octal', underline=0,
-                             variable=self.address_mode_tkvar, value=int(ValueFormatEnum.OCTAL),
-                             image=load_image('image/16x16/char-octal.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Binary', underline=0,
-                             variable=self.address_mode_tkvar, value=int(ValueFormatEnum.BINARY),
-                             image=load_image('image/16x16/char-binary.png'), compound=tk.LEFT)
-
-        view.add_separator()
-
-        view.add_checkbutton(label='Prefix', underline=0,
-                             variable=self.address_prefix_tkvar, offvalue=False, onvalue=True)
-
-        view.add_checkbutton(label='Suffix', underline=0,
-                             variable=self.address_suffix_tkvar, offvalue=False, onvalue=True)
-
-        view.add_checkbutton(label='Leading zeros', underline=8,
-                             variable=self.address_zeroed_tkvar, offvalue=False, onvalue=True)
-
         # Address bits submenu
         bits = tk.Menu(menu, tearoff=False)
-        self.menu_line = bits
+        self.address_popup_bits = bits
 
-        for value in ADDRESS_BITS:
-            bits.add_radiobutton(label=f'{value:3d}', variable=self.address_bits_tkvar, value=value)
+        _add_radiobuttons(bits, self.address_bits_tkvar,
+                          ((label, value, False) for label, value in _ADDRESS_BITS_ITEMS))
 
         bits.add_separator()
 
@@ -2568,39 +2759,39 @@ class UserInterface(BaseUserInterface):
 
         # Menu
         menu.add_cascade(label='Address format', underline=0, menu=view,
-                         image=load_image('image/16x16/memory-address.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory-address.png'), compound=tk.LEFT)
 
         menu.add_cascade(label='Address bits', underline=8, menu=bits,
-                         image=load_image('image/16x16/memory.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
         menu.add_command(label='Memory address', underline=7, command=self.on_nav_goto_memory_address_start_focus,
-                         image=load_image('image/16x16/goto.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/goto.png'), compound=tk.LEFT)
 
         menu.add_command(label='Memory start', underline=7, command=self.on_nav_goto_memory_start,
-                         image=load_image('image/16x16/top-light.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/top-light.png'), compound=tk.LEFT)
 
         menu.add_command(label='Memory end', underline=7, command=self.on_nav_goto_memory_endin,
-                         image=load_image('image/16x16/bottom-light.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/bottom-light.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
         menu.add_command(label='Previous block', underline=6, command=self.on_nav_goto_block_previous,
-                         image=load_image('image/16x16/arrow-left.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/arrow-left.png'), compound=tk.LEFT)
 
         menu.add_command(label='Next block', underline=7, command=self.on_nav_goto_block_next,
-                         image=load_image('image/16x16/arrow-right.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/arrow-right.png'), compound=tk.LEFT)
 
         menu.add_command(label='Block start', underline=6, command=self.on_nav_goto_block_start,
-                         image=load_image('image/16x16/arrow-up-dash.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/arrow-up-dash.png'), compound=tk.LEFT)
 
         menu.add_command(label='Block end', underline=7, command=self.on_nav_goto_block_endin,
-                         image=load_image('image/16x16/arrow-down-dash.png'), compound=tk.LEFT)
-
-        self.editor.address_canvas.bind('<Button-3>', self._on_popup_address)
+                         image=_menu_image('image/16x16/arrow-down-dash.png'), compound=tk.LEFT)
 
     def _on_popup_address(self, event):
+        if self.address_popup is None:
+            self.__init_popup_address()
         try:
             self.address_popup.tk_popup(event.x_root, event.y_root)
         finally:
@@ -2613,46 +2804,16 @@ class UserInterface(BaseUserInterface):
         self.offset_popup = menu
 
         # View submenu
-        view = tk.Menu(menu, tearoff=False)
+        view = self._build_format_menu(menu, self.offset_mode_tkvar, self.offset_prefix_tkvar,
+                                       self.offset_suffix_tkvar, self.offset_zeroed_tkvar)
         self.offset_popup_view = view
 
-        view.add_radiobutton(label='Hex UPPER', underline=0,
-                             variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_UPPER),
-                             image=load_image('image/16x16/char-hex-upper.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Hex lower', underline=12,
-                             variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.HEXADECIMAL_LOWER),
-                             image=load_image('image/16x16/char-hex-lower.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Decimal', underline=0,
-                             variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.DECIMAL),
-                             image=load_image('image/16x16/char-decimal.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Octal', underline=0,
-                             variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.OCTAL),
-                             image=load_image('image/16x16/char-octal.png'), compound=tk.LEFT)
-
-        view.add_radiobutton(label='Binary', underline=0,
-                             variable=self.offset_mode_tkvar, value=int(ValueFormatEnum.BINARY),
-                             image=load_image('image/16x16/char-binary.png'), compound=tk.LEFT)
-
-        view.add_separator()
-
-        view.add_checkbutton(label='Prefix', underline=0,
-                             variable=self.offset_prefix_tkvar, offvalue=False, onvalue=True)
-
-        view.add_checkbutton(label='Suffix', underline=0,
-                             variable=self.offset_suffix_tkvar, offvalue=False, onvalue=True)
-
-        view.add_checkbutton(label='Leading zeros', underline=8,
-                             variable=self.offset_zeroed_tkvar, offvalue=False, onvalue=True)
-
         # Line submenu
         line = tk.Menu(menu, tearoff=False)
         self.offset_popup_line = line
 
-        for value in LINE_LENGTHS:
-            line.add_radiobutton(label=f'{value:3d}', variable=self.line_length_tkvar, value=value)
+        _add_radiobuttons(line, self.line_length_tkvar,
+                          ((label, value, False) for label, value in _LINE_LENGTH_ITEMS))
 
         line.add_separator()
 
@@ -2660,14 +2821,14 @@ class UserInterface(BaseUserInterface):
 
         # Menu
         menu.add_cascade(label='Offset format', underline=0, menu=view,
-                         image=load_image('image/16x16/memory-offset.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/memory-offset.png'), compound=tk.LEFT)
 
         menu.add_cascade(label='Line length', underline=0, menu=line,
-                         image=load_image('image/16x16/text_left.png'), compound=tk.LEFT)
-
-        self.editor.offset_canvas.bind('<Button-3>', self._on_popup_offset)
+                         image=_menu_image('image/16x16/text_left.png'), compound=tk.LEFT)
 
     def _on_popup_offset(self, event):
+        if self.offset_popup is None:
+            self.__init_popup_offset()
         try:
             self.offset_popup.tk_popup(event.x_root, event.y_root)
         finally:
@@ -2681,101 +2842,83 @@ class UserInterface(BaseUserInterface):
         encm = tk.Menu(menu, tearoff=False)
         self.chars_popup_encoding = encm
 
-        encm.add_command(label='Custom', underline=0, command=self.on_view_chars_encoding_custom)
+        def fill_encoding():
+            encm.add_command(label='Custom', underline=0, command=self.on_view_chars_encoding_custom)
+
+            encm.add_separator()
 
-        encm.add_separator()
+            _add_radiobuttons(encm, self.chars_encoding_tkvar,
+                              ((encoding, encoding, cbrk) for encoding, cbrk in _ENCODING_ITEMS))
 
-        for i, encoding in enumerate(BYTE_ENCODINGS):
-            encm.add_radiobutton(label=encoding, variable=self.chars_encoding_tkvar, value=encoding,
-                                 columnbreak=(i and not i % 16))
+        self._defer_menu_fill(encm, fill_encoding)
 
         # Menu
         menu.add_cascade(label='Encoding', underline=0, menu=encm,
-                         image=load_image('image/16x16/fonts.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Cut', underline=1, command=self.on_edit_cut,
-                         image=load_image('image/16x16/editcut.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Copy', underline=0, command=self.on_edit_copy,
-                         image=load_image('image/16x16/editcopy.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Paste', underline=0, command=self.on_edit_paste,
-                         image=load_image('image/16x16/editpaste.png'), compound=tk.LEFT)
+                         image=_menu_image('image/16x16/fonts.png'), compound=tk.LEFT)
 
         menu.add_separator()
 
-        menu.add_command(label='Insert', underline=0, command=self.on_edit_reserve,
-                         image=load_image('image/16x16/document_new.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Delete', underline=0, command=self.on_edit_delete,
-                         image=load_image('image/16x16/editdelete.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Clear', underline=1, command=self.on_edit_clear,
-                         image=load_image('image/16x16/eraser.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Fill', underline=0, command=self.on_edit_fill,
-                         image=load_image('image/16x16/fill.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Flood', underline=2, command=self.on_edit_flood,
-                         image=load_image('image/16x16/color_fill.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Crop', underline=0, command=self.on_edit_crop,
-                         image=load_image('image/16x16/crop.png'), compound=tk.LEFT)
-
-        menu.add_command(label='Move', underline=0, command=self.on_edit_move_focus,
-                         image=load_image('image/16x16/move.png'), compound=tk.LEFT)
-
-        menu.add_separator()
-
-        menu.add_command(label='Export', underline=0, command=self.on_edit_export,
-                         image=load_image('image/16x16/fileexport.png'), compound=tk.LEFT)
-
-        self.editor.chars_canvas.bind('<Button-3>', self._on_popup_chars)
+        self._fill_command_menu(menu, self._POPUP_EDIT_ITEMS)
 
     def _on_popup_chars(self, event):
+        if self.chars_popup is None:
+            self.__init_popup_chars()
+            # Invalidate the state caches, so the fresh menu gets stamped
+            self._menu_sel_state_prev = None
+            self._menu_fill_state_prev = None
+            self._menu_flood_state_prev = None
+            self._do_update_menus_by_selection()
         try:
             self.chars_popup.tk_popup(event.x_root, event.y_root)
         finally:
             self.chars_popup.grab_release()
 
     def update_status(self):
+        # Coalesce bursts of status updates (one per engine operation, or
+        # one per mouse event while dragging) into a single trailing one
+        if not self._status_pending:
+            self._status_pending = True
+            self.top.after_idle(self._do_update_status)
+
+    def _do_update_status(self):
+        self._status_pending = False
+        if self.statusbar_frame is None:
+            return  # decorations not built yet
         status = self.engine.status
         format_address = status.address_format_string.format
 
         if status.sel_mode == SelectionMode.NORMAL:
             start, endin = status.sel_start_address, status.sel_endin_address
-            if endin < start:
-                endin, start = start, endin
-            text_range = f'Range: {format_address(start)} - {format_address(endin)}'
+            start, endin = (start, endin) if start <= endin else (endin, start)
+            text_range = _STATUS_RANGE_FORMAT(format_address(start), format_address(endin))
             length = endin + 1 - start
-            text_length = f'Size: {format_address(length)} = {length:d}'
+            text_length = _STATUS_SIZE_FORMAT(format_address(length), length)
 
         elif status.sel_mode == SelectionMode.RECTANGLE:
             start_x, start_y = status.sel_start_cell
             endin_x, endin_y = status.sel_endin_cell
-            if endin_x < start_x:
-                endin_x, start_x = start_x, endin_x
-            if endin_y < start_y:
-                endin_y, start_y = start_y, endin_y
-            text_range = f'Range: ({start_x:d}, {start_y:d}) - ({endin_x:d}, {endin_y:d})'
+            start_x, endin_x = (start_x, endin_x) if start_x <= endin_x else (endin_x, start_x)
+            start_y, endin_y = (start_y, endin_y) if start_y <= endin_y else (endin_y, start_y)
+            text_range = _STATUS_RECT_RANGE_FORMAT(start_x, start_y, endin_x, endin_y)
             text_w = endin_x + 1 - start_x
             text_h = endin_y + 1 - start_y
-            text_length = f'Size: ({text_w:d}, {text_h:d}) = ({text_w:X}h, {text_h:X}h)'
+            text_length = _STATUS_RECT_SIZE_FORMAT(text_w, text_h, text_w, text_h)
 
         else:
             address = status.cursor_address
-            text_range = f'Address: {format_address(address)}'
-            text_length = f'Digit: {status.cell_format_length - status.cursor_digit}'
-
-        self.statusbar_address.configure(text=text_range)
-        self.statusbar_selection.configure(text=text_length)
+            text_range = _STATUS_ADDRESS_FORMAT(format_address(address))
+            text_length = _STATUS_DIGIT_FORMAT(status.cell_format_length - status.cursor_digit)
 
         mode_text = f'{status.cursor_mode.name.lower()}'
         if status.sel_mode:
             mode_text += f' / {status.sel_mode.name.lower()}'
-        self.statusbar_cursor.configure(text=mode_text)
+
+        texts = (text_range, text_length, mode_text)
+        if texts != self._status_texts_prev:
+            self._status_texts_prev = texts
+            self.statusbar_address.configure(text=text_range)
+            self.statusbar_selection.configure(text=text_length)
+            self.statusbar_cursor.configure(text=mode_text)
 
     def get_start_text(self) -> str:
         text = self.start_entry.get()
@@ -2783,9 +2926,13 @@ class UserInterface(BaseUserInterface):
 
     def set_start_text(self, text: str, focus: bool = False) -> None:
         start_entry = self.start_entry
-        start_entry.delete(0, tk.END)
+        # Straight into the Tcl bridge, skipping the Entry wrappers and
+        # their per-call option processing
+        tk_call = start_entry.tk.call
+        w = start_entry._w
+        tk_call(w, 'delete', 0, 'end')
         if text:
-            start_entry.insert(tk.END, text)
+            tk_call(w, 'insert', 'end', text)
         if focus:
             start_entry.focus_set()
 
@@ -2809,9 +2956,11 @@ class UserInterface(BaseUserInterface):
 
     def set_endin_text(self, text: str, focus: bool = False) -> None:
         endin_entry = self.endin_entry
-        endin_entry.delete(0, tk.END)
+        tk_call = endin_entry.tk.call
+        w = endin_entry._w
+        tk_call(w, 'delete', 0, 'end')
         if text:
-            endin_entry.insert(tk.END, text)
+            tk_call(w, 'insert', 'end', text)
         if focus:
             endin_entry.focus_set()
 
@@ -2896,12 +3045,19 @@ class UserInterface(BaseUserInterface):
                 return value
         return None
 
+    def ask_value(self, title: str, prompt: str) -> Optional[str]:
+        dialog = self._value_dialog
+        if dialog is None:
+            dialog = ValueDialog(self.top)
+            self._value_dialog = dialog
+        return dialog.prompt(title, prompt)
+
     def ask_chars_encoding_custom(self) -> Optional[str]:
         value = tk.simpledialog.askstring('Text encoding', 'Enter the Python text codec name:')
         if value is not None:
             try:
-                b'\0'.decode(encoding=value, errors='strict')
-            except UnicodeDecodeError:
+                codecs.lookup(value)
+            except LookupError:
                 tk.messagebox.showerror('Invalid encoding', f'Python does not support the text codec: {value!r}')
             else:
                 self.chars_encoding_tkvar.set(value)
@@ -2919,85 +3075,114 @@ class UserInterface(BaseUserInterface):
         top.title(text)
 
     def update_menus_by_selection(self):
+        # Coalesce bursts of refresh requests (one per engine operation)
+        # into a single idle-time pass over the menu entries
+        if not self._menus_by_selection_pending:
+            self._menus_by_selection_pending = True
+            self.top.after_idle(self._do_update_menus_by_selection)
+
+    # Selection-dependent entry labels, per target widget
+    _SEL_LABELS_EDIT = ('Cut', 'Copy', 'Crop', 'Move')
+    _SEL_LABELS_POPUP = ('Cut', 'Copy', 'Crop', 'Move', 'Export')
+    _SEL_LABELS_TOOLBAR_EDIT = ('Cut', 'Copy', 'Crop')
+    _SEL_LABELS_TOOLBAR_ADDRESS = ('Move',)
+
+    def _menu_entry_index(self, menu: tk.Menu, label: str) -> int:
+        # Menu layouts are fixed once built, so the label-to-index query
+        # needs to hit Tcl only once per (menu, label) pair
+        key = (menu._w, label)
+        index = self._menu_index_cache.get(key)
+        if index is None:
+            index = menu.index(label)
+            self._menu_index_cache[key] = index
+        return index
+
+    def _do_update_menus_by_selection(self):
+        self._menus_by_selection_pending = False
+        if self.toolbar_tray is None:
+            return  # decorations not built yet
         status = self.engine.status
-        # TODO: cache condition to skip useless GUI calls
         state = tk.NORMAL if status.sel_mode else tk.DISABLED
 
-        menu = self.menu_edit
-        labels = ('Cut', 'Copy', 'Crop', 'Move')
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+        if state != self._menu_sel_state_prev:
+            self._menu_sel_state_prev = state
+
+            menu = self.menu_edit
+            for label in self._SEL_LABELS_EDIT:
+                menu.entryconfigure(self._menu_entry_index(menu, label), state=state)
 
-        menu = self.cells_popup
-        labels = ('Cut', 'Copy', 'Crop', 'Move', 'Export')
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+            # Popups not built yet are stamped right after their lazy build
+            menu = self.cells_popup
+            if menu is not None:
+                for label in self._SEL_LABELS_POPUP:
+                    menu.entryconfigure(self._menu_entry_index(menu, label), state=state)
 
-        menu = self.chars_popup
-        labels = ('Cut', 'Copy', 'Crop', 'Move', 'Export')
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+            menu = self.chars_popup
+            if menu is not None:
+                for label in self._SEL_LABELS_POPUP:
+                    menu.entryconfigure(self._menu_entry_index(menu, label), state=state)
 
-        toolbar = self.toolbar_edit
-        labels = ('Cut', 'Copy', 'Crop')
-        for label in labels:
-            toolbar.get_widget(label).configure(cnf=dict(state=state))
+            toolbar = self.toolbar_edit
+            for label in self._SEL_LABELS_TOOLBAR_EDIT:
+                toolbar.get_widget(label).configure(cnf=dict(state=state))
 
-        toolbar = self.toolbar_address
-        labels = ('Move',)
-        for label in labels:
-            toolbar.get_widget(label).configure(cnf=dict(state=state))
+            toolbar = self.toolbar_address
+            for label in self._SEL_LABELS_TOOLBAR_ADDRESS:
+                toolbar.get_widget(label).configure(cnf=dict(state=state))
 
-        self.update_menus_by_cursor()
+        self._do_update_menus_by_cursor()
 
     def update_menus_by_cursor(self):
+        if not self._menus_by_cursor_pending:
+            self._menus_by_cursor_pending = True
+            self.top.after_idle(self._do_update_menus_by_cursor)
+
+    def _do_update_menus_by_cursor(self):
+        self._menus_by_cursor_pending = False
+        if self.toolbar_tray is None:
+            return  # decorations not built yet
         status = self.engine.status
         address = status.cursor_address
         memory = status.memory
         start = memory.start
         endex = memory.endex
 
-        # TODO: cache condition to skip useless GUI calls
         if status.sel_mode or start <= address < endex:
             state = tk.NORMAL
         else:
             state = tk.DISABLED
 
-        menu = self.menu_edit
-        labels = ('Fill',)
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+        if state != self._menu_fill_state_prev:
+            self._menu_fill_state_prev = state
 
-        menu = self.cells_popup
-        labels = ('Fill',)
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+            menu = self.menu_edit
+            menu.entryconfigure(self._menu_entry_index(menu, 'Fill'), state=state)
 
-        toolbar = self.toolbar_edit
-        labels = ('Fill',)
-        for label in labels:
-            toolbar.get_widget(label).configure(state=state)
+            menu = self.cells_popup
+            if menu is not None:
+                menu.entryconfigure(self._menu_entry_index(menu, 'Fill'), state=state)
 
-        # TODO: cache condition to skip useless GUI calls
-        if status.sel_mode or (start <= address < endex and memory.peek(address) is None):
+            self.toolbar_edit.get_widget('Fill').configure(state=state)
+
+        if status.sel_mode:
             state = tk.NORMAL
-        else:
+        elif not (start <= address < endex):
             state = tk.DISABLED
+        else:
+            # The peek only matters for an in-range cursor with no selection
+            state = tk.NORMAL if memory.peek(address) is None else tk.DISABLED
 
-        menu = self.menu_edit
-        labels = ('Flood',)
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+        if state != self._menu_flood_state_prev:
+            self._menu_flood_state_prev = state
 
-        menu = self.cells_popup
-        labels = ('Flood',)
-        for label in labels:
-            menu.entryconfigure(menu.index(label), state=state)
+            menu = self.menu_edit
+            menu.entryconfigure(self._menu_entry_index(menu, 'Flood'), state=state)
 
-        toolbar = self.toolbar_edit
-        labels = ('Flood',)
-        for label in labels:
-            toolbar.get_widget(label).configure(state=state)
+            menu = self.cells_popup
+            if menu is not None:
+                menu.entryconfigure(self._menu_entry_index(menu, 'Flood'), state=state)
+
+            self.toolbar_edit.get_widget('Flood').configure(state=state)
 
     def on_file_new(self, event=None):
         self.engine.on_file_new()
@@ -3164,73 +3349,20 @@ class UserInterface(BaseUserInterface):
     def on_help_about(self, event=None):
         self.engine.on_help_about()
 
-    def on_tkvar_chars_visible(self, *args):
-        value = self.top.getvar(name='chars_visible')
-        self.engine.on_set_chars_visible(value)
-
-    def on_tkvar_line_length(self, *args):
-        value = self.top.getvar(name='line_length')
-        self.engine.on_set_line_length(value)
-
-    def on_tkvar_chars_encoding(self, *args):
-        value = self.top.getvar(name='chars_encoding')
-        self.engine.on_set_chars_encoding(value)
-
-    def on_tkvar_cell_mode(self, *args):
-        value = self.top.getvar(name='cell_mode')
-        self.engine.on_set_cell_mode(value)
-
-    def on_tkvar_cell_prefix(self, *args):
-        value = self.top.getvar(name='cell_prefix')
-        self.engine.on_set_cell_prefix(value)
-
-    def on_tkvar_cell_suffix(self, *args):
-        value = self.top.getvar(name='cell_suffix')
-        self.engine.on_set_cell_suffix(value)
-
-    def on_tkvar_cell_zeroed(self, *args):
-        value = self.top.getvar(name='cell_zeroed')
-        self.engine.on_set_cell_zeroed(value)
-
-    def on_tkvar_address_mode(self, *args):
-        value = self.top.getvar(name='address_mode')
-        self.engine.on_set_address_mode(value)
-
-    def on_tkvar_address_prefix(self, *args):
-        value = self.top.getvar(name='address_prefix')
-        self.engine.on_set_address_prefix(value)
-
-    def on_tkvar_address_suffix(self, *args):
-        value = self.top.getvar(name='address_suffix')
-        self.engine.on_set_address_suffix(value)
-
-    def on_tkvar_address_zeroed(self, *args):
-        value = self.top.getvar(name='address_zeroed')
-        self.engine.on_set_address_zeroed(value)
-
-    def on_tkvar_address_skip(self, *args):
-        value = self.top.getvar(name='address_skip')
-        self.engine.on_set_address_skip(value)
-
-    def on_tkvar_address_bits(self, *args):
-        value = self.top.getvar(name='address_bits')
-        self.engine.on_set_address_bits(value)
-
-    def on_tkvar_offset_mode(self, *args):
-        value = self.top.getvar(name='offset_mode')
-        self.engine.on_set_offset_mode(value)
-
-    def on_tkvar_offset_prefix(self, *args):
-        value = self.top.getvar(name='offset_prefix')
-        self.engine.on_set_offset_prefix(value)
-
-    def on_tkvar_offset_suffix(self, *args):
-        value = self.top.getvar(name='offset_suffix')
-        self.engine.on_set_offset_suffix(value)
+    def _on_tkvar_write(self, name, index, mode):
+        # Coalesce bursts of writes (e.g. applying a settings preset) into
+        # one idle-time flush, keeping only the latest value per variable
+        pending = self._tkvar_pending
+        if not pending:
+            self.top.after_idle(self._flush_tkvar_writes)
+        pending[name] = self.top.getvar(name=name)
 
-    def on_tkvar_offset_zeroed(self, *args):
-        value = self.top.getvar(name='offset_zeroed')
-        self.engine.on_set_offset_zeroed(value)
+    def _flush_tkvar_writes(self):
+        pending = self._tkvar_pending
+        self._tkvar_pending = {}
+        setters = self._tkvar_setters
+        for name, value in pending.items():
+            setters[name](value)
 
 
 # =====================================================================================================================
@@ -3248,6 +3380,7 @@ class InstanceManager(BaseInstanceManager):
         # self._root: tk.Tk = root
         self._root: ttkthemes.ThemedTk = root
         _fix_global_colors(root)
+        _preload_icons()
 
     def remove(self, index: int) -> object:
         instance = super().remove(index)
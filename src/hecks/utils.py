@@ -18,16 +18,16 @@
 import base64
 import binascii
 import enum
-import lzma
+import functools
 import re
 from ast import literal_eval as _literal_eval
+from typing import Callable
 from typing import Iterable
 from typing import Iterator
 from typing import Mapping
-from typing import Sequence
 from typing import Tuple
+from typing import Union
 
-import hexrec.utils
 from bytesparse.inplace import Memory
 
 BIN_SET = set('01')
@@ -59,28 +59,81 @@ _INT_REGEX_DICT = {
     10: DEC_AFFIX_REGEX,
 }
 
+# All the integer formats merged into one alternation, tried in the same
+# order as _INT_REGEX_DICT; the name of the matching body group tells the
+# base, so a parse costs a single match instead of up to seven
+_INT_COMBINED_REGEX = re.compile(
+    r"^(?P<sign>[+-]?)\s*(?:"
+    r"(0[Xx])(?P<hexp>[0-9A-Fa-f]+(['_][0-9A-Fa-f]+)*)"
+    r"|(0[Xx])?(?P<hexs>[0-9A-Fa-f]+(['_][0-9A-Fa-f]+)*)[Hh]"
+    r"|(0[Oo]?)(?P<octp>[0-7]+(['_][0-7]+)*)"
+    r"|(0[Oo]?)?(?P<octs>[0-7]+(['_][0-7]+)*)[Oo]"
+    r"|(0[Bb])(?P<binp>[01]+(['_][01]+)*)"
+    r"|(0[Bb])?(?P<bins>[01]+(['_][01]+)*)[Bb]"
+    r"|(0[Dd])?(?P<dec>[0-9]+(['_][0-9]+)*)[Dd]?"
+    r")$"
+)
+
+_INT_GROUP_BASES = (
+    ('hexp', 16),
+    ('hexs', 16),
+    ('octp', 8),
+    ('octs', 8),
+    ('binp', 2),
+    ('bins', 2),
+    ('dec', 10),
+)
+
 
 def parse_int(
     text: str,
     body_required: bool = True,
 ) -> Tuple[int, str, int]:
 
-    for base2, regex in _INT_REGEX_DICT.items():
-        match = regex.match(text)
-        if match:
-            base = abs(base2)
+    # Fast paths for plain hexadecimal, the format this program emits
+    # itself, skipping the regex engine; anything fancier (signs,
+    # separators, other bases) falls through to the full match
+    if text:
+        if text[-1] in 'hH':
+            body = text[:-1]
+            if body and HEX_SET.issuperset(body):
+                return int(body, 16), '', 16
+        elif text[:2] in ('0x', '0X'):
+            body = text[2:]
+            if body and HEX_SET.issuperset(body):
+                return int(body, 16), '', 16
+        elif (text[0] != '0' or len(text) == 1) and DEC_SET.issuperset(text):
+            # A leading zero on a longer run means octal, left to the regex
+            return int(text), '', 10
+
+    match = _INT_COMBINED_REGEX.match(text)
+    if not match:
+        raise ValueError(f'Invalid integer format: {text}')
+    group = match.group
+    for name, base in _INT_GROUP_BASES:
+        body = group(name)
+        if body is not None:
             break
     else:
         raise ValueError(f'Invalid integer format: {text}')
-    gd = match.groupdict()
-    sign = gd['sign']
-    body = gd['body'].replace("'", '')
+    sign = group('sign')
+    body = body.replace("'", '')
     if not body_required and not body:
         body = '0'
     value = int(body, base)
     return value, sign, base
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_int_cached(
+    text: str,
+    body_required: bool = True,
+) -> Tuple[int, str, int]:
+    # Interactive prompts tend to re-submit the same few values; the result
+    # tuple is immutable, so it is safe to share across calls
+    return parse_int(text, body_required)
+
+
 @enum.unique
 class ValueFormatEnum(enum.IntEnum):
     HEXADECIMAL_UPPER = 0
@@ -123,18 +176,16 @@ VALUE_FORMAT_SUFFIX: Mapping[ValueFormatEnum, str] = {
 }
 
 
-def format_uint(
-    value: int,
-    base: ValueFormatEnum = ValueFormatEnum.DECIMAL,
-    prefix: bool = False,
-    suffix: bool = False,
-    zeros: bool = False,
-    bytesize: int = 4,
-) -> str:
-
-    if value < 0:
-        raise ValueError('not unsigned')
-
+@functools.lru_cache(maxsize=256)
+def _uint_format_parts(
+    base: ValueFormatEnum,
+    prefix: bool,
+    suffix: bool,
+    zeros: bool,
+    bytesize: int,
+) -> Tuple[str, str, str]:
+    # Affixes and format spec for the given options, computed once per
+    # combination; the width probe over the maximum value is the costly part
     c = VALUE_FORMAT_CHAR[base]
     p = VALUE_FORMAT_PREFIX[base] if prefix else ''
     s = VALUE_FORMAT_SUFFIX[base] if suffix else ''
@@ -144,72 +195,118 @@ def format_uint(
             raise ValueError('bytesize must be positive')
         bitsize = 8 * bytesize
         maxi = (1 << bitsize) - 1
-
-        fmt = f"{{:{c}}}"
-        n = len(fmt.format(maxi))
-        z = f'0{n}' if zeros else ''
+        n = len(format(maxi, c))
+        spec = f'0{n}{c}'
     else:
-        z = ''
+        spec = c
+
+    return p, spec, s
+
 
-    fmt = f'{p}{{:{z}{c}}}{s}'
-    text = fmt.format(value)
-    return text
+def format_uint(
+    value: int,
+    base: ValueFormatEnum = ValueFormatEnum.DECIMAL,
+    prefix: bool = False,
+    suffix: bool = False,
+    zeros: bool = False,
+    bytesize: int = 4,
+) -> str:
 
+    if value < 0:
+        raise ValueError('not unsigned')
 
-def chop(
-    vector: Sequence[int],
-    window: int,
-    align_base: int = 0,
-) -> Iterator[int]:
+    p, spec, s = _uint_format_parts(base, prefix, suffix, zeros, bytesize)
+    return p + format(value, spec) + s
 
-    window = int(window)
-    if window <= 0:
-        raise ValueError('non-positive window')
 
-    align_base = int(align_base)
-    if align_base:
-        offset = -align_base % window
-        chunk = vector[:offset]
-        yield chunk
+@functools.lru_cache(maxsize=256)
+def make_uint_formatter(
+    base: ValueFormatEnum = ValueFormatEnum.DECIMAL,
+    prefix: bool = False,
+    suffix: bool = False,
+    zeros: bool = False,
+    bytesize: int = 4,
+) -> Callable[[int], str]:
+    # Partially-evaluated format_uint for hot loops with fixed options:
+    # affixes and format spec are resolved here once, so each call is a
+    # bare format() plus at most one concatenation
+    p, spec, s = _uint_format_parts(base, prefix, suffix, zeros, bytesize)
+
+    if p or s:
+        def formatter(value: int) -> str:
+            return p + format(value, spec) + s
     else:
-        offset = 0
+        def formatter(value: int) -> str:
+            return format(value, spec)
 
-    for i in range(offset, len(vector), window):
-        yield vector[i:(i + window)]
+    return formatter
 
 
 MIME_TYPE: str = 'application/hecks'
 
 
+# The hex encoders lean on bytes.hex(), whose single C-level pass also
+# emits the dot separators, instead of hexlify + chop + join re-scans.
+# Encoders take bytes and return str, decoders take str and return bytes
+# (binascii and base64 accept ASCII str directly), so the clipboard text
+# never goes through an extra encode/decode round-trip
 CLIPBOARD_ENCODERS = {
-    'repr': repr,
-    'hex-lo': binascii.hexlify,
-    'hex-up': lambda data: binascii.hexlify(data).upper(),
-    'hex-lo-dot': lambda data: b'.'.join(hexrec.utils.chop(binascii.hexlify(data), 2)),
-    'hex-up-dot': lambda data: b'.'.join(hexrec.utils.chop(binascii.hexlify(data).upper(), 2)),
-    'base64': base64.b64encode,
-    'base85': base64.b85encode,
+    'repr': lambda data: repr(bytes(data)),
+    'hex-lo': lambda data: data.hex(),
+    'hex-up': lambda data: data.hex().upper(),
+    'hex-lo-dot': lambda data: data.hex('.'),
+    'hex-up-dot': lambda data: data.hex('.').upper(),
+    'base64': lambda data: base64.b64encode(data).decode('ascii'),
+    'base85': lambda data: base64.b85encode(data).decode('ascii'),
 }
 
+def _decode_repr(text: str) -> bytes:
+    # repr(bytes) is a quoted ASCII literal, undone by unicode_escape far
+    # more cheaply than a full AST parse; literal_eval stays as the
+    # fallback for anything fancier than the self-produced form
+    if text[:2] in ("b'", 'b"') and text[-1:] == text[1]:
+        body = text[2:-1]
+        if text[1] not in body.replace('\\' + text[1], ''):
+            try:
+                return body.encode('latin-1').decode('unicode_escape').encode('latin-1')
+            except (UnicodeError, ValueError):
+                pass
+    return _literal_eval(text)
+
+
 CLIPBOARD_DECODERS = {
-    'repr': _literal_eval,
+    'repr': _decode_repr,
     'hex-lo': binascii.unhexlify,
     'hex-up': binascii.unhexlify,
-    'hex-lo-dot': lambda ascii: binascii.unhexlify(ascii.replace(b'.', b'')),
-    'hex-up-dot': lambda ascii: binascii.unhexlify(ascii.replace(b'.', b'')),
+    'hex-lo-dot': lambda text: binascii.unhexlify(text.replace('.', '')),
+    'hex-up-dot': lambda text: binascii.unhexlify(text.replace('.', '')),
     'base64': base64.b64decode,
     'base85': base64.b85decode,
 }
 
 
+def _lzma_compress(data: bytes) -> bytes:
+    # Deferred import: lzma drags in a C extension at startup, yet it is
+    # only needed when the user actually picks this compression
+    import lzma
+    return lzma.compress(data)
+
+
+def _lzma_decompress(data: bytes) -> bytes:
+    import lzma
+    return lzma.decompress(data)
+
+
+# None marks the uncompressed pass-through, skipped at the call sites
+# instead of paying a per-call identity lambda
 CLIPBOARD_COMPRESSORS = {
-    'none': lambda x: x,
-    'lzma': lzma.compress,
+    'none': None,
+    'lzma': _lzma_compress,
 }
 
 CLIPBOARD_DECOMPRESSORS = {
-    'none': lambda x: x,
-    'lzma': lzma.decompress,
+    'none': None,
+    'lzma': _lzma_decompress,
 }
 
 
@@ -221,8 +318,7 @@ def memory_to_clipboard(
     prefix: bool = False,
 ) -> str:
 
-    def format_address(value: int) -> str:
-        return format_uint(value, base, prefix, not prefix)
+    format_address = make_uint_formatter(base, prefix, not prefix)
 
     encoding = str(encoding)
     encoder = CLIPBOARD_ENCODERS[encoding]
@@ -230,20 +326,32 @@ def memory_to_clipboard(
     compression = str(compression)
     compressor = CLIPBOARD_COMPRESSORS[compression]
 
-    count = 0
-    block_tokens = []
-
-    for address, items in memory.blocks():
-        count += 1
-        size = len(items)
-
-        block_tokens += [
-            f'Address: {format_address(address)}',
-            f'Size: {format_address(size)}',
-            encoder(compressor(items)).decode('ascii'),
-            '',
+    # One comprehension pass over the blocks, one chunk per block; the
+    # trailing newline of each chunk doubles as the empty terminator line
+    # once everything is joined
+    count = memory.content_parts
+
+    if compression == 'lzma' and count > 1:
+        # lzma.compress releases the GIL, so blocks compress in parallel;
+        # block data is copied out first because the views yielded by
+        # blocks() only stay valid for one iteration
+        from concurrent.futures import ThreadPoolExecutor
+        blocks = [(address, bytes(items)) for address, items in memory.blocks()]
+        with ThreadPoolExecutor() as executor:
+            payloads = executor.map(compressor, (items for _, items in blocks))
+            block_tokens = [
+                f'Address: {format_address(address)}\n'
+                f'Size: {format_address(len(items))}\n'
+                f'{encoder(payload)}\n'
+                for (address, items), payload in zip(blocks, payloads)
+            ]
+    else:
+        block_tokens = [
+            f'Address: {format_address(address)}\n'
+            f'Size: {format_address(len(items))}\n'
+            f'{encoder(items if compressor is None else compressor(items))}\n'
+            for address, items in memory.blocks()
         ]
-        del items  # discard
 
     header_tokens = [
         'MIME-Version: 1.0',
@@ -251,6 +359,14 @@ def memory_to_clipboard(
         f'Data-Encoding: {encoding}',
         f'Data-Compression: {compression}',
         f'Block-Count: {count}',
+    ]
+    hexadecimal = (ValueFormatEnum.HEXADECIMAL_UPPER, ValueFormatEnum.HEXADECIMAL_LOWER)
+    if base in hexadecimal and not prefix:
+        # Declares that every address is 'h'-suffixed hexadecimal, so that
+        # the parser can bind a dedicated converter once instead of
+        # sniffing the format of each value
+        header_tokens.append('Address-Format: hex-suffix')
+    header_tokens += [
         f'Address-Start: {format_address(memory.start)}',
         f'Address-End-Ex: {format_address(memory.endex)}',
         ''
@@ -261,31 +377,31 @@ def memory_to_clipboard(
 
 
 def iter_lines(text: str) -> Iterator[str]:
-    start = 0
-    while 1:
-        endex = text.find('\n', start)
-        if endex < 0:
-            endex = len(text)
-        yield text[start:endex]
-        start = endex + 1
+    # One C-level split beats the former find()+slice Python loop; no
+    # caller bails out early enough for laziness to pay off
+    return iter(text.split('\n'))
+
+
+_HEADER_LINE_REGEX = re.compile(r'^([^:\n]+):[ \t]*(.*?)\s*$', re.MULTILINE)
+_BLOCK_LINE_REGEX = re.compile(r'\s*([^:]+?)\s*:\s*(.*?)\s*$')
 
 
 def clipboard_to_memory(
-    clipboard: Iterable[str],
+    clipboard: Union[str, Iterable[str]],
 ) -> Memory:
 
-    it = iter(clipboard)
+    if not isinstance(clipboard, str):
+        clipboard = '\n'.join(clipboard)
 
-    # Parse header
-    header = {}
-    while 1:
-        line = next(it)
-        if not line:
-            break
-        split = line.index(':')
-        key = line[:split].strip()
-        value = line[split + 1:].strip()
-        header[key] = value
+    # Parse the whole header with a single scan; lines are then indexed by
+    # an integer pointer instead of driving a per-line iterator
+    split = clipboard.find('\n\n')
+    if split < 0:
+        split = len(clipboard)
+    header = {key.strip(): value
+              for key, value in _HEADER_LINE_REGEX.findall(clipboard[:split])}
+    lines = clipboard[(split + 2):].split('\n')
+    index = 0
 
     key = 'MIME-Version'
     value = header.get(key)
@@ -304,6 +420,17 @@ def clipboard_to_memory(
         raise ValueError(f'Unsupported {key}: {value}')
     decompressor = CLIPBOARD_DECOMPRESSORS[value]
 
+    if header.get('Address-Format') == 'hex-suffix':
+        # Uniform format declared by the emitter: bind the converter once,
+        # skipping the per-value format sniffing below
+        def parse_value(text: str) -> int:
+            return int(text[:-1], 16)
+    else:
+        def parse_value(text: str) -> int:
+            if text.endswith('h'):
+                return int(text[:-1], 16)
+            return int(text)
+
     key = 'Block-Count'
     value = header.get(key)
     if not value:
@@ -326,40 +453,86 @@ def clipboard_to_memory(
 
     if endex < start:
         raise ValueError(f'Negative address range')
+    # Local binding for the hot loop below (LOAD_FAST vs LOAD_GLOBAL /
+    # attribute lookup per iteration)
+    match_block_line = _BLOCK_LINE_REGEX.match
+    entries = []  # (address, size, decoded parts), decompressed below
+
+    try:
+        for _ in range(count):
+            match = match_block_line(lines[index])
+            index += 1
+            if match is None:
+                raise ValueError(f'Invalid block line: {lines[index - 1]}')
+            key, value = match.groups()
+            if key != 'Address':
+                raise ValueError(f'Expecting Address, got: {key}')
+            address = parse_value(value)
+
+            match = match_block_line(lines[index])
+            index += 1
+            if match is None:
+                raise ValueError(f'Invalid block line: {lines[index - 1]}')
+            key, value = match.groups()
+            if key != 'Size':
+                raise ValueError(f'Expecting Size, got {key}')
+            size = parse_value(value)
+
+            line = lines[index]
+            index += 1
+            parts = []
+            append = parts.append
+            while line:
+                append(decoder(line))
+                line = lines[index]
+                index += 1
+            entries.append((address, size, parts))
+
+    except IndexError:
+        raise ValueError('Truncated clipboard data') from None
+
+    if decompressor is not None:
+        flat = [part for _, _, parts in entries for part in parts]
+        if len(flat) > 1:
+            # lzma.decompress releases the GIL, so pieces decompress in
+            # parallel; results are then handed back to their blocks
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor() as executor:
+                flat = list(executor.map(decompressor, flat))
+        else:
+            flat = [decompressor(part) for part in flat]
+        offset = 0
+        for _, _, parts in entries:
+            parts[:] = flat[offset:(offset + len(parts))]
+            offset += len(parts)
+
+    # bytesparse appends ascending writes much faster than random-order
+    # ones; self-produced clipboards are already sorted, so this scan is
+    # usually all it costs
+    if any(entries[i][0] > entries[i + 1][0] for i in range(len(entries) - 1)):
+        entries.sort(key=lambda entry: entry[0])
+
+    datas = []
+
+    for address, size, parts in entries:
+        data = parts[0] if len(parts) == 1 else b''.join(parts)
+        if len(data) < size:
+            raise ValueError(f'Expecting {size} bytes, got {len(data)}')
+        elif len(data) > size:
+            data = data[:size]
+        datas.append((address, data))
+
+    if len(datas) == 1:
+        # Single contiguous block, the common case: build the memory
+        # around the data directly, skipping the write machinery
+        address, data = datas[0]
+        return Memory.from_bytes(data, offset=address, start=start, endex=endex)
+
     memory = Memory(start=start, endex=endex)
 
-    for _ in range(count):
-        line = next(it)
-        split = line.index(':')
-        key = line[:split].strip()
-        value = line[split + 1:].strip()
-        if key != 'Address':
-            raise ValueError(f'Expecting Address, got: {key}')
-        if value.endswith('h'):
-            address = int(value[:-1], 16)
-        else:
-            address = int(value)
-
-        line = next(it)
-        split = line.index(':')
-        key = line[:split].strip()
-        value = line[split + 1:].strip()
-        if key != 'Size':
-            raise ValueError(f'Expecting Size, got {key}')
-        if value.endswith('h'):
-            size = int(value[:-1], 16)
-        else:
-            size = int(value)
-
-        line = next(it)
-        while line:
-            data = decompressor(decoder(line.encode('ascii')))
-            if len(data) < size:
-                raise ValueError(f'Expecting {size} bytes, got {len(data)}')
-            elif len(data) > size:
-                data = data[:size]
-            memory.write(address, data)
-            del data
-            line = next(it)
+    for address, data in datas:
+        # Single write per block, so that the memory rebalances its
+        # internal blocks once instead of once per data line
+        memory.write(address, data)
 
     return memory